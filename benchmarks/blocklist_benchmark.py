@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Spider Domain Crawler - Domain Engelleme Listesi Benchmark'ı
+
+Derlenmiş ``DomainBlocklist`` ile önceki doğrusal tarama yöntemini her
+engelleme modunda karşılaştırır. Önce iki yöntemin örnek host'larda aynı
+kararı verdiği doğrulanır, ardından derleme süresi, bellek ve saniyedeki
+arama sayısı raporlanır.
+
+Kullanım:
+    python benchmarks/blocklist_benchmark.py --entries 1000000 --lookups 100000
+
+Copyright (c) 2025 Hasan Yasin Yaşar
+Licensed under PSH 1.1 (Pasha Software License)
+"""
+
+import argparse
+import json
+import os
+import random
+import string
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modules.domain_blocklist import BLOCKING_MODES, DomainBlocklist
+
+TLDS = ['com', 'net', 'org', 'io', 'com.tr', 'co.uk', 'de']
+
+
+def random_label(rng: random.Random, low: int = 4, high: int = 12) -> str:
+    return ''.join(rng.choice(string.ascii_lowercase + string.digits) for _ in range(rng.randint(low, high)))
+
+
+def generate_blocklist(count: int, rng: random.Random):
+    """Reklam/izleyici listelerine benzer sentetik bir engelleme listesi üretir"""
+    domains = set()
+    while len(domains) < count:
+        domain = random_label(rng) + '.' + rng.choice(TLDS)
+        if rng.random() < 0.2:
+            domain = random_label(rng, 2, 6) + '.' + domain
+        domains.add(domain)
+    return list(domains)
+
+
+def generate_hosts(blocklist, count: int, rng: random.Random):
+    """Yarısı engelli domain'lerden türetilmiş, yarısı rastgele host listesi üretir"""
+    hosts = []
+    for _ in range(count):
+        if rng.random() < 0.5:
+            host = rng.choice(blocklist)
+            if rng.random() < 0.5:
+                host = random_label(rng, 2, 8) + '.' + host
+        else:
+            host = random_label(rng) + '.' + random_label(rng) + '.' + rng.choice(TLDS)
+        hosts.append(host)
+    return hosts
+
+
+def linear_is_blocked(domain: str, blocked_domains, mode: str) -> bool:
+    """Önceki _is_domain_blocked davranışı: tüm liste üzerinde doğrusal tarama"""
+    for blocked_domain in blocked_domains:
+        if mode == 'exact':
+            if domain == blocked_domain:
+                return True
+        elif mode == 'subdomain':
+            if domain == blocked_domain or domain.endswith('.' + blocked_domain):
+                return True
+        elif mode == 'contains':
+            if blocked_domain in domain:
+                return True
+    return False
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Domain engelleme listesi benchmark\'ı')
+    parser.add_argument('--entries', type=int, default=1000000, help='Engelleme listesi boyutu (varsayılan: 1000000)')
+    parser.add_argument('--lookups', type=int, default=100000, help='Derlenmiş liste ile arama sayısı (varsayılan: 100000)')
+    parser.add_argument('--linear-lookups', type=int, default=20,
+                        help='Doğrusal tarama ile arama ve doğrulama sayısı (varsayılan: 20)')
+    parser.add_argument('--modes', nargs='+', default=list(BLOCKING_MODES), choices=BLOCKING_MODES,
+                        help='Ölçülecek engelleme modları')
+    parser.add_argument('--json', action='store_true', help='Sonuçları JSON satırları olarak yazdır')
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    blocklist = generate_blocklist(args.entries, rng)
+    hosts = generate_hosts(blocklist, args.lookups, rng)
+    sample = hosts[:args.linear_lookups]
+
+    if not args.json:
+        print(f"{args.entries} girdi, {args.lookups} arama")
+        print(f"{'mod':>10} {'derleme sn':>11} {'bellek MB':>10} {'arama/sn':>12} {'doğrusal arama/sn':>18}")
+
+    for mode in args.modes:
+        tracemalloc.start()
+        start = time.perf_counter()
+        compiled = DomainBlocklist(blocklist, mode=mode)
+        build_seconds = time.perf_counter() - start
+        memory_mb = tracemalloc.get_traced_memory()[0] / (1024 * 1024)
+        tracemalloc.stop()
+
+        # Doğrulama: derlenmiş liste doğrusal tarama ile aynı kararı vermeli
+        for host in sample:
+            if compiled.is_host_blocked(host) != linear_is_blocked(host, compiled.domains, mode):
+                print(f"❌ Uyuşmazlık ({mode}): {host}")
+                sys.exit(1)
+
+        start = time.perf_counter()
+        for host in hosts:
+            compiled.is_host_blocked(host)
+        lookups_per_sec = len(hosts) / (time.perf_counter() - start)
+
+        start = time.perf_counter()
+        for host in sample:
+            linear_is_blocked(host, compiled.domains, mode)
+        linear_per_sec = len(sample) / (time.perf_counter() - start)
+
+        if args.json:
+            print(json.dumps({'benchmark': 'blocklist', 'mode': mode, 'entries': args.entries,
+                              'build_seconds': round(build_seconds, 2), 'memory_mb': round(memory_mb, 1),
+                              'lookups_per_sec': round(lookups_per_sec), 'linear_lookups_per_sec': round(linear_per_sec, 1)}))
+        else:
+            print(f"{mode:>10} {build_seconds:>11.2f} {memory_mb:>10.1f} {lookups_per_sec:>12.0f} {linear_per_sec:>18.1f}")
+
+
+if __name__ == '__main__':
+    main()
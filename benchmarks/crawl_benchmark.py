@@ -0,0 +1,396 @@
+#!/usr/bin/env python3
+"""
+Spider Domain Crawler - Uçtan Uca Crawl Benchmark'ı
+
+Yerel bir HTTP sunucusu sentetik bir web (``siteN.test`` domain'leri, sayfalar
+arası link grafı, dış domain linkleri, dolgu metni ve yapay gecikme) sunar.
+Sunucu proxy gibi çalışır; crawler tüm istekleri ``use_proxy`` ile ona
+gönderir, böylece çok sayıda domain DNS'e ihtiyaç duymadan taklit edilir.
+Spider modları domain'leri ``https://`` ile açtığından sunucu CONNECT
+tünellerini de karşılar; sertifika her çalıştırmada ``openssl`` ile
+üretilir ve ölçüm process'ine ``REQUESTS_CA_BUNDLE`` ile tanıtılır.
+
+Her mod ayrı bir process'te çalıştırılır (peak RSS ve CPU süresi modlar
+arasında karışmaz) ve şu değerler raporlanır:
+
+- pages_per_sec: Sunulan HTML sayfa sayısı / duvar saati süresi
+- requests_per_domain: Toplam istek (robots.txt dahil) / bulunan domain sayısı
+- cpu_sec, peak_rss_mb: Crawler process'inin CPU süresi ve en yüksek bellek kullanımı
+- latency_p50_ms, latency_p99_ms: İstemci tarafında ölçülen yanıt süresi (header'lara kadar)
+
+Modlar: crawl (URLCrawler.crawl), detect (crawl_and_detect_domains),
+spider ve enhanced_spider.
+
+Kullanım:
+    python benchmarks/crawl_benchmark.py
+    python benchmarks/crawl_benchmark.py --sites 200 --pages 100 --latency 20 --concurrency 8 --json
+    python benchmarks/crawl_benchmark.py --modes crawl detect --page-size 50000 --external 0.4
+
+Copyright (c) 2025 Hasan Yasin Yaşar
+Licensed under PSH 1.1 (Pasha Software License)
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import logging
+import os
+import random
+import resource
+import shutil
+import ssl
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+MODES = ('crawl', 'detect', 'spider', 'enhanced_spider')
+START_URL = 'http://site0.test/'
+# Proxy havuzunun başlangıç doğrulaması için sunucunun yanıtladığı adres (sayaçlara eklenmez)
+PROXY_CHECK_URL = 'http://proxy-check.test/'
+FILLER = ('Lorem ipsum dolor sit amet, consectetur adipiscing elit. Sed do eiusmod tempor '
+          'incididunt ut labore et dolore magna aliqua. ')
+
+
+def build_page(site: int, page: int, args) -> bytes:
+    """
+    Sitenin sayfasını üretir (aynı parametrelerle her zaman aynı içerik)
+
+    Args:
+        site: Site numarası (siteN.test)
+        page: Sayfa numarası (/pN, 0 ana sayfa)
+        args: Graf parametreleri (sites, pages, fanout, external, page_size)
+    """
+    rng = random.Random(site * 1000003 + page)
+    parts = [f'<html><head><title>site{site} sayfa {page}</title></head><body>']
+    for _ in range(args.fanout):
+        if args.sites > 1 and rng.random() < args.external:
+            target = rng.randrange(args.sites - 1)
+            target += target >= site
+            parts.append(f'<a href="http://site{target}.test/p{rng.randrange(args.pages)}">dış</a>')
+        else:
+            parts.append(f'<a href="/p{rng.randrange(args.pages)}">iç</a>')
+    size = sum(len(part) for part in parts)
+    if size < args.page_size:
+        parts.append('<p>' + (FILLER * (args.page_size // len(FILLER) + 1))[:args.page_size - size] + '</p>')
+    parts.append('</body></html>')
+    return ''.join(parts).encode('utf-8')
+
+
+def serve(args) -> None:
+    """Sentetik web sunucusunu çalıştırır; ilk satırda dinlediği portu yazar"""
+    lock = threading.Lock()
+    counts = {'requests': 0, 'pages': 0, 'robots': 0, 'not_found': 0, 'tunnels': 0, 'hosts': set()}
+    tls = None
+    if args.cert:
+        tls = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        tls.load_cert_chain(os.path.join(args.cert, 'cert.pem'), os.path.join(args.cert, 'key.pem'))
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+        # Header ve gövde ayrı yazılır; Nagle + gecikmeli ACK ölçüme ~40 ms eklemesin
+        disable_nagle_algorithm = True
+        # CONNECT ile açılan HTTPS tünelinin hedef host'u
+        tunnel_host = None
+
+        def log_message(self, *args):
+            pass
+
+        def _send(self, status, body=b'', content_type='text/html; charset=utf-8'):
+            self.send_response(status)
+            self.send_header('Content-Type', content_type)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_CONNECT(self):
+            if tls is None:
+                self._send(405)
+                return
+            self.send_response(200, 'Connection Established')
+            self.end_headers()
+            self.wfile.flush()
+            try:
+                connection = tls.wrap_socket(self.connection, server_side=True)
+            except (ssl.SSLError, OSError):
+                self.close_connection = True
+                return
+            with lock:
+                counts['tunnels'] += 1
+            # Tünel içindeki istekler aynı bağlantı üzerinden TLS ile okunur
+            self.connection = connection
+            self.rfile = connection.makefile('rb')
+            self.wfile = connection.makefile('wb')
+            self.tunnel_host = self.path.rsplit(':', 1)[0].lower()
+            # http.client CONNECT'i HTTP/1.0 ile gönderir; tünel yine de açık kalmalı
+            self.close_connection = False
+
+        def do_GET(self):
+            parts = urlsplit(self.path)
+            if self.tunnel_host is not None:
+                parts = urlsplit(f'https://{self.tunnel_host}{self.path}')
+            if not parts.netloc:
+                # Proxy üzerinden gelmeyen istekler: sayaçların okunması/sıfırlanması
+                with lock:
+                    if parts.path == '/__reset':
+                        counts.update(requests=0, pages=0, robots=0, not_found=0, tunnels=0, hosts=set())
+                    stats = dict(counts, hosts=len(counts['hosts']))
+                self._send(200, json.dumps(stats).encode(), 'application/json')
+                return
+
+            host = parts.hostname or ''
+            if host == urlsplit(PROXY_CHECK_URL).hostname:
+                self._send(200, b'ok', 'text/plain')
+                return
+            with lock:
+                counts['requests'] += 1
+                counts['hosts'].add(host)
+            if args.latency:
+                time.sleep(args.latency / 1000)
+
+            path = parts.path or '/'
+            if path == '/robots.txt':
+                with lock:
+                    counts['robots'] += 1
+                self._send(200, b'User-agent: *\nDisallow:\n', 'text/plain')
+                return
+
+            try:
+                site = int(host.split('.', 1)[0][4:])
+                page = int(path[2:]) if path.startswith('/p') else (0 if path == '/' else -1)
+            except ValueError:
+                site = page = -1
+            if not (0 <= site < args.sites and 0 <= page < args.pages):
+                with lock:
+                    counts['not_found'] += 1
+                self._send(404)
+                return
+            with lock:
+                counts['pages'] += 1
+            self._send(200, build_page(site, page, args))
+
+    class Server(ThreadingHTTPServer):
+        daemon_threads = True
+        # Varsayılan listen kuyruğu (5) eşzamanlı modlarda bağlantı hatalarına yol açar
+        request_queue_size = 128
+
+    server = Server(('127.0.0.1', 0), Handler)
+    print(server.server_address[1], flush=True)
+    server.serve_forever()
+
+
+def percentile(values, q: float) -> float:
+    """Sıralı listenin q (0-1) yüzdeliği"""
+    if not values:
+        return 0.0
+    return values[min(len(values) - 1, int(round(q * (len(values) - 1))))]
+
+
+def run_mode(args) -> dict:
+    """Tek bir modu bu process'te çalıştırır ve istemci tarafı ölçümleri döndürür"""
+    import requests
+    import modules.config as config
+
+    # Ölçümler diskteki önbelleklerden etkilenmesin; host aralığı tüm modlarda sabit
+    config.USE_DNS_CACHE = False
+    config.USE_HTTP_CACHE = False
+    config.ROBOTS_TXT_CACHE_FILE = ':memory:'
+    config.MIN_DELAY = config.MAX_DELAY = args.delay
+    config.PROXY_VALIDATION_URL = PROXY_CHECK_URL
+
+    from modules.domain_detector import DomainDetector
+    from modules.url_crawler import URLCrawler
+    from domain_crawler import crawl_and_detect_domains, spider_crawl_domains, enhanced_spider_crawl_domains
+
+    # Sentetik domain'ler DNS'te yoktur; doğrulama sunucunun sitelerine göre yapılır
+    def validate_domain_exists(self, domain):
+        try:
+            return domain.endswith('.test') and int(domain[4:-5]) < args.sites
+        except ValueError:
+            return False
+    DomainDetector.validate_domain_exists = validate_domain_exists
+
+    # Yanıt süresi: isteğin gönderilmesinden header'ların alınmasına kadar
+    latencies = []
+    errors = [0]
+    original_send = requests.adapters.HTTPAdapter.send
+
+    def timed_send(adapter, request, **kwargs):
+        start = time.perf_counter()
+        try:
+            return original_send(adapter, request, **kwargs)
+        except Exception:
+            errors[0] += 1
+            raise
+        finally:
+            latencies.append(time.perf_counter() - start)
+    requests.adapters.HTTPAdapter.send = timed_send
+
+    logging.disable(logging.CRITICAL)
+    proxy = [args.proxy]
+    concurrency = args.concurrency or None
+    crawler_settings = {'delay': args.delay, 'max_depth': args.depth, 'max_urls': args.max_urls,
+                        'use_proxy': True, 'proxy_list': proxy}
+    detector_settings = {'delay': args.delay, 'use_proxy': True, 'proxy_list': proxy}
+    spider_settings = {'max_depth': args.spider_depth, 'max_domains_per_level': args.domains_per_level,
+                       'max_total_domains': args.max_domains, 'use_proxy': True, 'proxy_list': proxy,
+                       'concurrency': concurrency, 'workers': args.workers}
+
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    cpu_start = usage.ru_utime + usage.ru_stime
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        if args.run == 'crawl':
+            crawler = URLCrawler(**crawler_settings)
+            results = crawler.crawl_concurrent([START_URL], concurrency) if concurrency else crawler.crawl([START_URL])
+            crawler.close()
+            domains = len({urlsplit(url).netloc for url in results['found_urls']})
+        elif args.run == 'detect':
+            _, domain_results, _ = crawl_and_detect_domains([START_URL], crawler_settings, detector_settings,
+                                                            concurrency=concurrency)
+            domains = domain_results['total_valid_domains']
+        elif args.run == 'spider':
+            domains = spider_crawl_domains([START_URL], **spider_settings)['total_valid_domains']
+        else:
+            domains = enhanced_spider_crawl_domains([START_URL], max_pages_per_domain=args.max_urls,
+                                                    **spider_settings)['total_valid_domains']
+    wall = time.perf_counter() - start
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+
+    # ru_maxrss Linux'ta KB, macOS'ta byte cinsindendir
+    peak_rss = usage.ru_maxrss / (1024 * 1024 if sys.platform == 'darwin' else 1024)
+    latencies.sort()
+    return {'wall_sec': round(wall, 3), 'cpu_sec': round(usage.ru_utime + usage.ru_stime - cpu_start, 3),
+            'peak_rss_mb': round(peak_rss, 1), 'domains': domains, 'client_requests': len(latencies),
+            'client_errors': errors[0],
+            'latency_p50_ms': round(percentile(latencies, 0.50) * 1000, 2),
+            'latency_p99_ms': round(percentile(latencies, 0.99) * 1000, 2)}
+
+
+def server_stats(port: int, action: str = '__stats') -> dict:
+    with urllib.request.urlopen(f'http://127.0.0.1:{port}/{action}') as response:
+        return json.loads(response.read())
+
+
+def create_certificate(directory: str, sites: int) -> bool:
+    """
+    Sentetik siteler için self-signed sertifika üretir
+
+    Returns:
+        openssl bulunamazsa veya başarısız olursa False (HTTPS tünelleri kapalı kalır)
+    """
+    if shutil.which('openssl') is None:
+        return False
+    names = ','.join(f'DNS:site{site}.test' for site in range(sites))
+    with open(os.path.join(directory, 'openssl.cnf'), 'w') as config:
+        config.write('[req]\ndistinguished_name=dn\n[dn]\n[ext]\n'
+                     f'subjectAltName={names}\nbasicConstraints=critical,CA:TRUE\n')
+    command = ['openssl', 'req', '-x509', '-newkey', 'rsa:2048', '-nodes', '-days', '1', '-subj', '/CN=site0.test',
+               '-keyout', os.path.join(directory, 'key.pem'), '-out', os.path.join(directory, 'cert.pem'),
+               '-config', os.path.join(directory, 'openssl.cnf'), '-extensions', 'ext']
+    return subprocess.run(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL).returncode == 0
+
+
+def graph_args(args):
+    """Sunucu ve ölçüm process'lerine aktarılan graf parametreleri"""
+    return ['--sites', str(args.sites), '--pages', str(args.pages), '--fanout', str(args.fanout),
+            '--external', str(args.external), '--page-size', str(args.page_size), '--latency', str(args.latency)]
+
+
+def measure(mode: str, port: int, args) -> dict:
+    """Modu ayrı bir process'te çalıştırır ve sunucu sayaçlarıyla birleştirir"""
+    server_stats(port, '__reset')
+    command = [sys.executable, os.path.abspath(__file__), '--run', mode, '--proxy', f'http://127.0.0.1:{port}',
+               '--delay', str(args.delay), '--depth', str(args.depth), '--max-urls', str(args.max_urls),
+               '--spider-depth', str(args.spider_depth), '--domains-per-level', str(args.domains_per_level),
+               '--max-domains', str(args.max_domains), '--concurrency', str(args.concurrency),
+               '--workers', str(args.workers)] + graph_args(args)
+    env = dict(os.environ)
+    if args.cert:
+        env['REQUESTS_CA_BUNDLE'] = os.path.join(args.cert, 'cert.pem')
+    output = subprocess.run(command, stdout=subprocess.PIPE, check=True, universal_newlines=True, env=env).stdout
+    client = json.loads(output.strip().splitlines()[-1])
+    server = server_stats(port)
+
+    result = {'benchmark': 'crawl', 'mode': mode, 'sites': args.sites, 'pages_per_site': args.pages,
+              'fanout': args.fanout, 'external': args.external, 'page_size': args.page_size,
+              'latency_ms': args.latency, 'concurrency': args.concurrency, 'workers': args.workers,
+              'requests': server['requests'], 'pages': server['pages'], 'robots': server['robots'],
+              'not_found': server['not_found'], 'tunnels': server['tunnels'], 'hosts': server['hosts']}
+    result.update(client)
+    result['pages_per_sec'] = round(server['pages'] / max(client['wall_sec'], 1e-9), 1)
+    result['requests_per_domain'] = round(server['requests'] / max(1, client['domains']), 2)
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Yerel sentetik web üzerinde uçtan uca crawl benchmark\'ı')
+    parser.add_argument('--modes', nargs='+', choices=MODES, default=list(MODES), help='Çalıştırılacak modlar (varsayılan: hepsi)')
+    parser.add_argument('--sites', type=int, default=50, help='Sentetik domain sayısı (varsayılan: 50)')
+    parser.add_argument('--pages', type=int, default=50, help='Site başına sayfa sayısı (varsayılan: 50)')
+    parser.add_argument('--fanout', type=int, default=10, help='Sayfa başına link sayısı (varsayılan: 10)')
+    parser.add_argument('--external', type=float, default=0.2, help='Linklerin dış domain\'e gitme oranı (varsayılan: 0.2)')
+    parser.add_argument('--page-size', type=int, default=20000, help='Sayfa boyutu, byte (varsayılan: 20000)')
+    parser.add_argument('--latency', type=float, default=5, help='Sunucunun istek başına yapay gecikmesi, ms (varsayılan: 5)')
+    parser.add_argument('--delay', type=float, default=0.0, help='Aynı host\'a istekler arası süre, tüm modlarda sabitlenir (varsayılan: 0)')
+    parser.add_argument('--depth', type=int, default=2, help='crawl/detect modlarında crawler derinliği (varsayılan: 2)')
+    parser.add_argument('--max-urls', type=int, default=100, help='crawl/detect modlarında maksimum URL, enhanced_spider\'da domain başına sayfa (varsayılan: 100)')
+    parser.add_argument('--spider-depth', type=int, default=2, help='Spider derinliği (varsayılan: 2)')
+    parser.add_argument('--domains-per-level', type=int, default=20, help='Spider seviye başına domain (varsayılan: 20)')
+    parser.add_argument('--max-domains', type=int, default=100, help='Spider maksimum domain (varsayılan: 100)')
+    parser.add_argument('--concurrency', type=int, default=0, help='Eşzamanlı crawl thread sayısı, 0 ise sıralı (varsayılan: 0)')
+    parser.add_argument('--workers', type=int, default=1, help='Spider worker sayısı (varsayılan: 1)')
+    parser.add_argument('--json', action='store_true', help='Sonuçları JSON satırları olarak yazdır')
+    # İç kullanım: sunucu ve ölçüm process'leri
+    parser.add_argument('--serve', action='store_true', help=argparse.SUPPRESS)
+    parser.add_argument('--run', choices=MODES, help=argparse.SUPPRESS)
+    parser.add_argument('--proxy', help=argparse.SUPPRESS)
+    parser.add_argument('--cert', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.serve:
+        serve(args)
+        return
+    if args.run:
+        print(json.dumps(run_mode(args)))
+        return
+
+    cert_dir = tempfile.mkdtemp(prefix='crawl_benchmark_')
+    args.cert = cert_dir if create_certificate(cert_dir, args.sites) else None
+    if args.cert is None:
+        print("⚠️  openssl bulunamadı: HTTPS istekleri (spider modları) başarısız olacak", file=sys.stderr)
+    server_command = [sys.executable, os.path.abspath(__file__), '--serve'] + graph_args(args)
+    if args.cert:
+        server_command += ['--cert', args.cert]
+    server = subprocess.Popen(server_command, stdout=subprocess.PIPE, universal_newlines=True)
+    try:
+        port = int(server.stdout.readline())
+        if not args.json:
+            print(f"{args.sites} site x {args.pages} sayfa, fanout {args.fanout}, dış link oranı {args.external}, "
+                  f"sayfa {args.page_size} byte, gecikme {args.latency} ms")
+            print(f"{'mod':>16} {'sayfa':>6} {'istek':>6} {'domain':>6} {'sayfa/sn':>9} {'istek/domain':>12} "
+                  f"{'CPU sn':>7} {'RSS MB':>7} {'p50 ms':>7} {'p99 ms':>7}")
+        for mode in args.modes:
+            result = measure(mode, port, args)
+            if args.json:
+                print(json.dumps(result), flush=True)
+            else:
+                print(f"{mode:>16} {result['pages']:>6} {result['requests']:>6} {result['domains']:>6} "
+                      f"{result['pages_per_sec']:>9.1f} {result['requests_per_domain']:>12.2f} "
+                      f"{result['cpu_sec']:>7.2f} {result['peak_rss_mb']:>7.1f} "
+                      f"{result['latency_p50_ms']:>7.2f} {result['latency_p99_ms']:>7.2f}", flush=True)
+    finally:
+        server.terminate()
+        server.wait()
+        shutil.rmtree(cert_dir, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Spider Domain Crawler - Domain URL Deposu Bellek Benchmark'ı
+
+Sentetik bir bağlantı akışını (sayfalardaki link, görsel ve script URL'leri;
+ortak yollar ve sayfalar arası tekrarlar dahil) farklı saklama biçimlerine
+ekler ve tracemalloc ile ölçülen bellek kullanımını raporlar:
+
+- dict-of-sets: eski ``Dict[str, Set[str]]`` (domain -> tam URL'ler)
+- seen-set: ``"domain url"`` string'lerinden oluşan küme
+- store: ``DomainURLStore`` (sınırsız, domain başına sınır ve reservoir örneklemi)
+
+Kullanım:
+    python benchmarks/domain_urls_benchmark.py --links 1000000
+    python benchmarks/domain_urls_benchmark.py --links 1000000 --limit 100
+
+Copyright (c) 2025 Hasan Yasin Yaşar
+Licensed under PSH 1.1 (Pasha Software License)
+"""
+
+import argparse
+import gc
+import json
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modules.domain_url_store import DomainURLStore
+
+# Hemen her sitede bulunan yollar
+COMMON_PATHS = ['/', '/favicon.ico', '/robots.txt', '/css/style.css', '/js/main.js', '/js/jquery.min.js',
+                '/images/logo.png', '/hakkimizda', '/iletisim', '/gizlilik-politikasi', '/sitemap.xml']
+
+
+def generate_links(count: int, domains: int, seed: int = 42):
+    """
+    (domain, url) çiftleri üretir
+
+    Domain popülerliği Zipf benzeri dağılır; bağlantıların ~%30'u ortak
+    yollara, kalanı siteye özel sayfa ve görsellere gider. Aynı URL'ye farklı
+    sayfalardan tekrar tekrar referans verilir.
+    """
+    rng = random.Random(seed)
+    weights = [1 / (rank + 1) for rank in range(domains)]
+    names = [f"site{index}.example.com" if index % 3 else f"site{index}.com.tr" for index in range(domains)]
+    picks = rng.choices(range(domains), weights, k=count)
+    for index in picks:
+        domain = names[index]
+        host = domain if rng.random() < 0.7 else rng.choice(('www.', 'cdn.', 'static.')) + domain
+        scheme = 'https' if rng.random() < 0.9 else 'http'
+        roll = rng.random()
+        if roll < 0.3:
+            path = rng.choice(COMMON_PATHS)
+        elif roll < 0.8:
+            path = f"/kategori/{rng.randrange(40)}/urun-{rng.randrange(2000)}.html"
+        else:
+            path = f"/uploads/2025/{rng.randrange(12) + 1:02d}/gorsel-{rng.randrange(5000)}.jpg?w={rng.choice((320, 640, 1280))}"
+        yield domain, f"{scheme}://{host}{path}"
+
+
+def add_dict_of_sets(links):
+    container = {}
+    for domain, url in links:
+        container.setdefault(domain, set()).add(url)
+    return container, sum(len(urls) for urls in container.values())
+
+
+def add_seen_set(links):
+    container = set()
+    for domain, url in links:
+        container.add(f"{domain} {url}")
+    return container, len(container)
+
+
+def add_store(links, limit=0, sampling='first'):
+    store = DomainURLStore(max_per_domain=limit, sampling=sampling, seed=1)
+    for domain, url in links:
+        store.add(domain, url)
+    return store, len(store)
+
+
+def measure(name, func, args):
+    """Fonksiyonun oluşturduğu yapının bellek kullanımını ve ekleme hızını ölçer"""
+    # Hız: bağlantılar önceden üretilir, tracemalloc kapalıdır
+    links = list(generate_links(args.links, args.domains))
+    gc.collect()
+    start = time.perf_counter()
+    container, stored = func(links)
+    elapsed = time.perf_counter() - start
+    del container, links
+    gc.collect()
+
+    # Bellek: bağlantılar ölçüm sırasında üretilir; sadece yapının tuttuğu
+    # string'ler ve nesneler ölçülen bellekte kalır
+    tracemalloc.start()
+    container, stored = func(generate_links(args.links, args.domains))
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del container
+    return {'benchmark': 'domain_urls', 'layout': name, 'links': args.links, 'stored_urls': stored,
+            'memory_mb': round(current / (1024 * 1024), 1),
+            'bytes_per_url': round(current / max(1, stored), 1),
+            'links_per_sec': round(args.links / elapsed)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Domain URL deposu bellek benchmark\'ı')
+    parser.add_argument('--links', type=int, default=1000000, help='Eklenecek bağlantı sayısı (varsayılan: 1000000)')
+    parser.add_argument('--domains', type=int, default=20000, help='Farklı domain sayısı (varsayılan: 20000)')
+    parser.add_argument('--limit', type=int, default=100, help='Sınırlı ölçümlerde domain başına URL (varsayılan: 100)')
+    parser.add_argument('--json', action='store_true', help='Sonuçları JSON satırları olarak yazdır')
+    args = parser.parse_args()
+
+    layouts = [
+        ('dict-of-sets', add_dict_of_sets),
+        ('seen-set', add_seen_set),
+        ('store', add_store),
+        (f'store-first-{args.limit}', lambda links: add_store(links, args.limit, 'first')),
+        (f'store-reservoir-{args.limit}', lambda links: add_store(links, args.limit, 'reservoir'))
+    ]
+
+    if not args.json:
+        print(f"{args.links} bağlantı, {args.domains} domain")
+        print(f"{'yapı':>22} {'URL':>9} {'bellek MB':>10} {'byte/URL':>9} {'bağlantı/sn':>12}")
+
+    for name, func in layouts:
+        result = measure(name, func, args)
+        if args.json:
+            print(json.dumps(result))
+        else:
+            print(f"{name:>22} {result['stored_urls']:>9} {result['memory_mb']:>10.1f} "
+                  f"{result['bytes_per_url']:>9.1f} {result['links_per_sec']:>12}")
+
+
+if __name__ == '__main__':
+    main()
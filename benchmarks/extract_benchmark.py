@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Spider Domain Crawler - Link Çıkarma Benchmark'ı
+
+BeautifulSoup ağacı üzerinden link çıkarma (``PageData.from_soup``) ile akışlı
+``LinkExtractor``'ı karşılaştırır. Önce iki yöntemin test korpusunda birebir
+aynı sonucu verdiği doğrulanır, ardından MB başına süre ve bellek ölçülür.
+
+Kullanım:
+    python benchmarks/extract_benchmark.py --pages 200 --links 500
+
+Copyright (c) 2025 Hasan Yasin Yaşar
+Licensed under PSH 1.1 (Pasha Software License)
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bs4 import BeautifulSoup
+
+from benchmarks.parse_benchmark import generate_page
+from modules.link_extractor import LinkExtractor, extract_page_data
+from modules.page_pipeline import PageData
+
+# Tokenizer'ın sınır durumlarını içeren sayfalar
+EDGE_CASES = [
+    b'<A HREF="/Buyuk">x</A><IMG SRC=resim.png><Link Href=stil.css>',
+    b'<a href="/a" href="/b">tekrar</a><a href>bos</a><a href="   ">bosluk</a><a>yok</a>',
+    b'<a href="/ara?q=1&amp;p=2&lt;">entity</a><img src="/x&#47;y.png">',
+    b'<script>var s = "<a href=\'/script-ici\'>";</script><a href="/sonra">sonra</a>',
+    b'<style>a[href="/css"] {}</style><!-- <a href="/yorum"> --><a href=/tirnaksiz>t</a>',
+    b'<a href="/kapali"/><img src="//cdn.example.net/a.png" /><script src="js/app.js" defer></script>',
+    b'<a href="mailto:a@b.com">m</a><a href="javascript:void(0)">j</a><a href="#bolum">f</a>',
+    '<meta charset="iso-8859-9"><a href="/şehir/ığdır">tr</a>'.encode('iso-8859-9'),
+    '<a href="/çağrı">utf8</a><img src="/görsel.png">'.encode('utf-8'),
+    b'<html><body><a href="/yarim" <img src="/kirik">',
+]
+
+
+def soup_extract(content, base_url: str) -> PageData:
+    """BeautifulSoup ağacı üzerinden link çıkarır (eski yöntem)"""
+    return PageData.from_soup(BeautifulSoup(content, 'html.parser'), base_url)
+
+
+def chunked_extract(content: bytes, base_url: str, chunk_size: int = 4096) -> PageData:
+    """İçeriği ağdan geliyormuş gibi parça parça LinkExtractor'a verir"""
+    extractor = LinkExtractor(base_url, encoding='utf-8')
+    for start in range(0, len(content), chunk_size):
+        extractor.feed(content[start:start + chunk_size])
+    return extractor.close()
+
+
+def verify(pages) -> int:
+    """İki yöntemin tüm sayfalarda aynı sonucu verdiğini doğrular, uyuşmazlık sayısını döndürür"""
+    mismatches = 0
+    for base_url, content in pages:
+        expected = soup_extract(content, base_url)
+        candidates = [extract_page_data(content, base_url)]
+        if isinstance(content, bytes) and b'charset' not in content:
+            candidates.append(chunked_extract(content, base_url))
+        for result in candidates:
+            if (result.links, result.assets) != (expected.links, expected.assets):
+                mismatches += 1
+                print(f"❌ Uyuşmazlık: {base_url}")
+                break
+    return mismatches
+
+
+def measure(extract, pages):
+    """Tüm sayfaları işler; (saniye, tepe bellek byte) döndürür"""
+    start = time.perf_counter()
+    for base_url, content in pages:
+        extract(content, base_url)
+    elapsed = time.perf_counter() - start
+
+    # Bellek ölçümü ayrı geçişte (tracemalloc süreyi etkilemesin)
+    tracemalloc.start()
+    for base_url, content in pages:
+        extract(content, base_url)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Link çıkarma yöntemleri benchmark\'ı')
+    parser.add_argument('--pages', type=int, default=200, help='Sentetik sayfa sayısı (varsayılan: 200)')
+    parser.add_argument('--links', type=int, default=500, help='Sayfa başına link/kaynak sayısı (varsayılan: 500)')
+    parser.add_argument('--json', action='store_true', help='Sonuçları JSON satırları olarak yazdır')
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    pages = [('https://bench.example.com/sayfa/%d' % i, generate_page(i, args.links, rng))
+             for i in range(args.pages)]
+    edge_pages = [('https://kenar.example.com/dizin/%d/' % i, content) for i, content in enumerate(EDGE_CASES)]
+    total_mb = sum(len(content) for _, content in pages) / (1024 * 1024)
+
+    mismatches = verify(edge_pages + pages)
+    if mismatches:
+        print(f"❌ {mismatches} sayfada sonuçlar farklı")
+        sys.exit(1)
+
+    results = []
+    for name, extract in [('beautifulsoup', soup_extract), ('link_extractor', extract_page_data)]:
+        elapsed, peak = measure(extract, pages)
+        results.append({'benchmark': 'extract', 'method': name, 'pages': args.pages,
+                        'mb_per_sec': round(total_mb / elapsed, 2),
+                        'peak_kb_per_mb': round(peak / 1024 / total_mb, 1)})
+
+    if args.json:
+        for result in results:
+            print(json.dumps(result))
+        return
+
+    print(f"✅ {len(edge_pages) + len(pages)} sayfada sonuçlar birebir aynı")
+    print(f"{args.pages} sayfa, toplam {total_mb:.1f} MB HTML")
+    print(f"{'yöntem':>16} {'MB/sn':>8} {'tepe KB / MB':>14}")
+    for result in results:
+        print(f"{result['method']:>16} {result['mb_per_sec']:>8.2f} {result['peak_kb_per_mb']:>14.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Spider Domain Crawler - HTML Parse Benchmark'ı
+
+PagePipeline'ın parse aşamasının process sayısına göre ölçeklenmesini ölçer.
+Sentetik HTML sayfaları üretilir ve her worker sayısı için saniyede parse
+edilen sayfa sayısı raporlanır.
+
+Kullanım:
+    python benchmarks/parse_benchmark.py --pages 400 --workers 0 1 2 4 8
+
+Copyright (c) 2025 Hasan Yasin Yaşar
+Licensed under PSH 1.1 (Pasha Software License)
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modules.page_pipeline import PagePipeline
+
+
+def generate_page(index: int, links: int, rng: random.Random) -> bytes:
+    """Belirtilen sayıda link ve kaynak içeren sentetik bir HTML sayfası üretir"""
+    parts = ['<html><head><title>Sayfa %d</title>' % index,
+             '<link rel="stylesheet" href="/static/site.css"></head><body>']
+    for i in range(links):
+        kind = rng.random()
+        if kind < 0.6:
+            parts.append('<p>Paragraf %d <a href="/sayfa/%d">iç link</a></p>' % (i, rng.randrange(10000)))
+        elif kind < 0.8:
+            parts.append('<a href="https://site%d.example.com/yol/%d">dış link</a>' % (rng.randrange(500), i))
+        elif kind < 0.9:
+            parts.append('<img src="//cdn%d.example.net/img/%d.png" alt="resim">' % (rng.randrange(20), i))
+        else:
+            parts.append('<script src="https://js%d.example.org/lib.js"></script>' % rng.randrange(50))
+    parts.append('</body></html>')
+    return ''.join(parts).encode('utf-8')
+
+
+def run(pages, workers: int, threads: int) -> float:
+    """Verilen worker sayısı ile tüm sayfaları parse eder, sayfa/saniye döndürür"""
+    pipeline = PagePipeline(parse_workers=workers)
+    try:
+        # Process pool'u ısıt (başlangıç maliyeti ölçüme girmesin)
+        pipeline.parse(pages[0][1], pages[0][0])
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            list(executor.map(lambda item: pipeline.parse(item[1], item[0]), pages))
+        elapsed = time.perf_counter() - start
+    finally:
+        pipeline.close()
+
+    return len(pages) / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description='PagePipeline parse aşaması benchmark\'ı')
+    parser.add_argument('--pages', type=int, default=400, help='Parse edilecek sayfa sayısı (varsayılan: 400)')
+    parser.add_argument('--links', type=int, default=500, help='Sayfa başına link/kaynak sayısı (varsayılan: 500)')
+    parser.add_argument('--workers', type=int, nargs='+', default=[0, 1, 2, 4, os.cpu_count() or 1],
+                        help='Denenecek parse process sayıları (0: process pool yok)')
+    parser.add_argument('--json', action='store_true', help='Sonuçları JSON satırları olarak yazdır')
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    pages = [('https://bench.example.com/sayfa/%d' % i, generate_page(i, args.links, rng))
+             for i in range(args.pages)]
+    total_mb = sum(len(content) for _, content in pages) / (1024 * 1024)
+
+    if not args.json:
+        print(f"{args.pages} sayfa, toplam {total_mb:.1f} MB HTML")
+        print(f"{'workers':>8} {'sayfa/sn':>10} {'MB/sn':>8}")
+
+    for workers in sorted(set(args.workers)):
+        # Fetch tarafını temsil eden thread'ler parse işlerini eşzamanlı gönderir
+        threads = max(1, workers) * 2
+        pages_per_sec = run(pages, workers, threads)
+        mb_per_sec = pages_per_sec * total_mb / args.pages
+
+        if args.json:
+            print(json.dumps({'benchmark': 'parse', 'workers': workers, 'pages': args.pages,
+                              'pages_per_sec': round(pages_per_sec, 1), 'mb_per_sec': round(mb_per_sec, 2)}))
+        else:
+            print(f"{workers:>8} {pages_per_sec:>10.1f} {mb_per_sec:>8.2f}")
+
+
+if __name__ == '__main__':
+    main()
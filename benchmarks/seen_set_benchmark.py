@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Spider Domain Crawler - Görülen URL Kümesi Benchmark'ı
+
+Her backend'e (memory, bloom, disk) N adet sentetik URL ekler; ekleme ve
+arama hızını, bellek/disk kullanımını ve hiç eklenmemiş URL'lerde ölçülen
+yanlış pozitif oranını raporlar. URL'ler üretilirken saklanmaz, böylece
+ölçülen bellek sadece kümeye aittir.
+
+Kullanım:
+    python benchmarks/seen_set_benchmark.py --urls 10000000
+    python benchmarks/seen_set_benchmark.py --urls 100000000 --backends bloom disk
+
+Copyright (c) 2025 Hasan Yasin Yaşar
+Licensed under PSH 1.1 (Pasha Software License)
+"""
+
+import argparse
+import gc
+import json
+import os
+import resource
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modules.seen_set import SEEN_SET_BACKENDS, create_seen_set
+
+
+def generate_urls(count: int, prefix: str = 'https'):
+    """Gerçekçi uzunlukta, tekrar etmeyen URL'ler üretir"""
+    for index in range(count):
+        yield f"{prefix}://site{index % 50000}.example.com/kategori/{index % 997}/sayfa-{index}.html?ref={index * 7919 % 1000003}"
+
+
+def rss_mb() -> float:
+    """Process'in en yüksek RSS değeri (MB)"""
+    usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return usage / (1024 * 1024) if sys.platform == 'darwin' else usage / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Görülen URL kümesi benchmark\'ı')
+    parser.add_argument('--urls', type=int, default=1000000, help='Eklenecek URL sayısı (varsayılan: 1000000)')
+    parser.add_argument('--probes', type=int, default=100000, help='Arama ve yanlış pozitif ölçümü için URL sayısı (varsayılan: 100000)')
+    parser.add_argument('--backends', nargs='+', default=list(SEEN_SET_BACKENDS), choices=SEEN_SET_BACKENDS,
+                        help='Ölçülecek backend\'ler')
+    parser.add_argument('--error-rate', type=float, default=0.001, help='Bloom filtresi hata oranı (varsayılan: 0.001)')
+    parser.add_argument('--json', action='store_true', help='Sonuçları JSON satırları olarak yazdır')
+    args = parser.parse_args()
+
+    if not args.json:
+        print(f"{args.urls} URL, {args.probes} arama")
+        print(f"{'backend':>8} {'ekleme/sn':>10} {'arama/sn':>10} {'bellek MB':>10} {'disk MB':>8} "
+              f"{'byte/URL':>9} {'yanlış poz.':>11} {'RSS MB':>8}")
+
+    # Her backend ayrı process'te ölçülmediği için RSS tepe değeri birikimlidir;
+    # karşılaştırma için kümenin raporladığı bellek kullanılmalıdır
+    for backend in args.backends:
+        gc.collect()
+        seen = create_seen_set(backend, error_rate=args.error_rate)
+
+        start = time.perf_counter()
+        for url in generate_urls(args.urls):
+            seen.add(url)
+        insert_per_sec = args.urls / (time.perf_counter() - start)
+
+        probes = min(args.probes, args.urls)
+        start = time.perf_counter()
+        missing = sum(1 for url in generate_urls(probes) if url not in seen)
+        lookup_per_sec = probes / (time.perf_counter() - start)
+        if missing:
+            print(f"❌ {backend}: eklenen {missing} URL bulunamadı (yanlış negatif)")
+            sys.exit(1)
+
+        false_positives = sum(1 for url in generate_urls(args.probes, prefix='http') if url in seen)
+        false_positive_rate = false_positives / args.probes
+
+        stats = seen.stats()
+        memory_mb = stats['memory_bytes'] / (1024 * 1024)
+        disk_mb = stats.get('disk_bytes', 0) / (1024 * 1024)
+        bytes_per_url = (stats['memory_bytes'] + stats.get('disk_bytes', 0)) / args.urls
+        seen.close()
+
+        if args.json:
+            print(json.dumps({'benchmark': 'seen_set', 'backend': backend, 'urls': args.urls,
+                              'inserts_per_sec': round(insert_per_sec), 'lookups_per_sec': round(lookup_per_sec),
+                              'memory_mb': round(memory_mb, 1), 'disk_mb': round(disk_mb, 1),
+                              'bytes_per_url': round(bytes_per_url, 1), 'false_positive_rate': false_positive_rate,
+                              'rss_mb': round(rss_mb())}))
+        else:
+            print(f"{backend:>8} {insert_per_sec:>10.0f} {lookup_per_sec:>10.0f} {memory_mb:>10.1f} {disk_mb:>8.1f} "
+                  f"{bytes_per_url:>9.1f} {false_positive_rate:>11.5f} {rss_mb():>8.0f}")
+        del seen
+
+
+if __name__ == '__main__':
+    main()
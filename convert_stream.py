@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+"""
+Spider Domain Crawler - Akışlı sonuç dönüştürücü
+
+``--stream`` ile yazılmış NDJSON (veya .ndjson.gz) sonuç dosyasını normal
+JSON çıktısı biçimine dönüştürür. Yarıda kesilmiş çalışmaların dosyaları da
+okunabilir; bu durumda sonuçta ``"complete": false`` bulunur.
+
+Kullanım:
+    python convert_stream.py data/domain_results.ndjson.gz -o data/domain_results.json
+
+Copyright (c) 2025 Hasan Yasin Yaşar
+Licensed under PSH 1.1 (Pasha Software License)
+"""
+
+import argparse
+import json
+from modules.result_stream import read_results
+
+def main():
+    """Ana fonksiyon"""
+    parser = argparse.ArgumentParser(description='NDJSON sonuç akışını JSON çıktısına dönüştürür')
+    parser.add_argument('input', help='NDJSON (veya .ndjson.gz) sonuç dosyası')
+    parser.add_argument('--output', '-o', help='Yazılacak JSON dosyası (verilmezse ekrana yazdırılır)')
+    args = parser.parse_args()
+    
+    results = read_results(args.input)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2, ensure_ascii=False)
+        print(f"💾 Sonuçlar kaydedildi: {args.output}")
+    else:
+        print(json.dumps(results, indent=2, ensure_ascii=False))
+    return 0
+
+if __name__ == "__main__":
+    exit(main())
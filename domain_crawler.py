@@ -13,6 +13,22 @@ Detaylar: LICENSE.md
 
 from modules.url_crawler import URLCrawler
 from modules.domain_detector import DomainDetector
+from modules.politeness import HostScheduler
+from modules.page_pipeline import PagePipeline
+from modules.http_pool import ConnectionPool
+from modules.body_reader import BodyReader
+from modules.domain_blocklist import DomainBlocklist
+from modules.dns_validator import DNSValidator
+from modules.dns_cache import DNSCache
+from modules.http_cache import HTTPCache
+from modules.robots import RobotsCache
+from modules.retry import RetryPolicy
+from modules.proxy_pool import ProxyPool
+from modules.spider_queue import SpiderWorkQueue
+from modules.checkpoint import CrawlCheckpoint
+from modules.seen_set import create_seen_set
+from modules.url_record import parse_url
+from modules.config import SPIDER_WORKERS
 import argparse
 import sys
 import logging
@@ -25,40 +41,389 @@ def setup_logging(level='INFO'):
         format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
     )
 
-def crawl_and_detect_domains(start_urls, crawler_settings, detector_settings):
-    """URL'leri crawl eder ve domain'leri tespit eder"""
+def _compile_blocklist(blocked_domains):
+    """Engelleme listesini derler (liste boşsa varsayılan engellenen domain'ler kullanılır)"""
+    if not blocked_domains:
+        from modules.config import DEFAULT_BLOCKED_DOMAINS
+        blocked_domains = DEFAULT_BLOCKED_DOMAINS
+    return DomainBlocklist(blocked_domains)
+
+def _open_dns_cache():
+    """Kalıcı DNS önbelleğini açar (config.USE_DNS_CACHE kapalıysa None)"""
+    from modules.config import USE_DNS_CACHE
+    return DNSCache() if USE_DNS_CACHE else None
+
+def _open_http_cache():
+    """Kalıcı HTTP önbelleğini açar (config.USE_HTTP_CACHE kapalıysa None)"""
+    from modules.config import USE_HTTP_CACHE
+    return HTTPCache() if USE_HTTP_CACHE else None
+
+def _print_http_cache_stats(http_cache):
+    """HTTP önbelleğinin bu çalıştırmada kazandırdığı istek ve byte'ları yazdırır"""
+    stats = http_cache.summary()
+    print(f"🗄️  HTTP önbelleği: {stats['requests_saved']} istek atlandı (taze), "
+          f"{stats['revalidated']} sayfa yeniden doğrulandı (304), {stats['stores']} sayfa kaydedildi, "
+          f"~{stats['bytes_saved'] / 1024:.0f} KB indirilmedi")
+
+def _open_robots_cache():
+    """robots.txt önbelleğini açar (config.RESPECT_ROBOTS_TXT kapalıysa None)"""
+    from modules.config import RESPECT_ROBOTS_TXT
+    return RobotsCache() if RESPECT_ROBOTS_TXT else None
+
+def _print_robots_stats(robots_cache):
+    """robots.txt önbelleğinin bu çalıştırmadaki istatistiklerini yazdırır"""
+    stats = robots_cache.summary()
+    print(f"🤖 robots.txt: {stats['hosts']} host ({stats['fetches']} indirme, {stats['disk_hits']} önbellekten), "
+          f"{stats['disallowed']} URL yasaklandı, {stats['crawl_delays']} host Crawl-delay bildirdi")
+
+def _open_proxy_pool(use_proxy, proxy_list):
+    """Proxy listesini eşzamanlı doğrulayarak havuz oluşturur (proxy kullanılmıyorsa None)"""
+    if not use_proxy or not proxy_list:
+        return None
+    proxy_pool = ProxyPool(proxy_list)
+    healthy = proxy_pool.validate()
+    print(f"🌐 Proxy doğrulaması: {healthy}/{len(proxy_pool)} proxy çalışıyor ({proxy_pool.validation_url})")
+    return proxy_pool
+
+def _print_proxy_stats(proxy_pool):
+    """Proxy havuzunun bu çalıştırmadaki durumunu yazdırır"""
+    stats = proxy_pool.summary()
+    print(f"🌐 Proxy havuzu: {stats['healthy']}/{stats['total']} proxy kullanımda, "
+          f"{stats['ejections']} devre dışı bırakma, {stats['readmissions']} tekrar kullanıma alma")
+
+def _print_retry_stats(retry_policy):
+    """Hata sınıfı başına tekrar deneme sayaçlarını yazdırır (hata yoksa bir şey yazdırmaz)"""
+    stats = retry_policy.summary()
+    if not stats:
+        return
+    print("🔁 Tekrar denemeler: " + ", ".join(
+        f"{reason} {counters['failures']} hata ({counters['retried']} tekrar, {counters['gave_up']} vazgeçildi)"
+        for reason, counters in sorted(stats.items())))
+
+def _print_host_rates(*schedulers):
+    """Uyarlamalı hız kontrolünün host başına ulaştığı hızları özetler"""
+    rates = {}
+    for scheduler in schedulers:
+        if scheduler.adaptive:
+            rates.update(scheduler.rates())
+    if not rates:
+        return
+    decreases = sum(rate['decreases'] for rate in rates.values())
+    slowest = sorted(rates.items(), key=lambda item: item[1]['interval'], reverse=True)[:5]
+    print(f"🚦 Uyarlamalı hız: {len(rates)} host, {decreases} yavaşlama; en yavaş host'lar: "
+          + ", ".join(f"{host} {rate['interval']:.2f} sn" for host, rate in slowest))
+
+def _open_checkpoint(checkpoint_path, resume, mode):
+    """
+    Spider checkpoint'ini açar; ``resume`` ise kaydedilmiş durumu okur
+    
+    Args:
+        checkpoint_path: Checkpoint dosyası (None ise checkpoint kullanılmaz)
+        resume: Kaydedilmiş durumdan devam edilsin mi
+        mode: Spider modu ('spider' veya 'enhanced_spider')
+    
+    Returns:
+        (CrawlCheckpoint veya None, devam edilecek durum veya None)
+    """
+    if not checkpoint_path:
+        return None, None
+    
+    checkpoint = CrawlCheckpoint(checkpoint_path)
+    state = None
+    if resume:
+        state = checkpoint.load()
+        if state is None:
+            print(f"⚠️  Checkpoint bulunamadı, baştan başlanıyor: {checkpoint_path}")
+        elif state['mode'] != mode:
+            raise ValueError(f"Checkpoint farklı bir spider moduna ait: {state['mode']} (bu çalıştırma: {mode})")
+        else:
+            print(f"♻️  Checkpoint'ten devam ediliyor: {checkpoint_path}")
+            print(f"   Bekleyen iş: {len(state['pending'])}, işlenmiş domain: {len(state['processed_domains'])}, "
+                  f"bulunan domain: {len(state['domains'])}")
+    return checkpoint, state
+
+def crawl_and_detect_domains(start_urls, crawler_settings, detector_settings, concurrency=None, parse_workers=None):
+    """
+    URL'leri crawl eder ve domain'leri tespit eder
+    
+    Crawler ve detector aynı sayfa pipeline'ını, bağlantı havuzunu ve gövde
+    okuyucusunu paylaşır; crawler'ın indirdiği sayfalar detector tarafından
+    tekrar indirilmez.
     
-    # URL Crawler ile URL'leri topla
-    print("🕷️  URL Crawling başlatılıyor...")
-    crawler = URLCrawler(**crawler_settings)
-    crawl_results = crawler.crawl(start_urls)
+    Args:
+        start_urls: Başlangıç URL'leri
+        crawler_settings: URLCrawler ayarları
+        detector_settings: DomainDetector ayarları
+        concurrency: Verilirse crawling bu sayıda thread ile eşzamanlı yapılır
+        parse_workers: Ayarlarda pipeline yoksa oluşturulacak pipeline'ın parse process sayısı
+    """
+    
+    # Ayarlarda verilmeyen paylaşılan bileşenleri bu çağrı için oluştur
+    owned = {}
+    shared = {}
+    
+    # Bağlantı havuzu veya DNS doğrulayıcı oluşturulacaksa kalıcı DNS önbelleğini kullanırlar
+    dns_cache = None
+    needs_pool = not (crawler_settings.get('connection_pool') or detector_settings.get('connection_pool'))
+    if needs_pool or detector_settings.get('dns_validator') is None:
+        dns_cache = owned['dns_cache'] = _open_dns_cache()
+    
+    # Tek zamanlayıcı: detector'ın bir host'a ilk isteği crawler'ın son isteğini bilir ve
+    # uyarlamalı modda crawler'ın 429/503'lerden öğrendiği yavaşlama detector'a da uygulanır
+    factories = {
+        'scheduler': lambda: HostScheduler(max(crawler_settings.get('delay', 1.0), detector_settings.get('delay', 1.0))),
+        'page_pipeline': lambda: PagePipeline(parse_workers=parse_workers),
+        'connection_pool': lambda: ConnectionPool(dns_cache=dns_cache),
+        'body_reader': BodyReader,
+        'retry_policy': RetryPolicy
+    }
+    # Crawler ve detector aynı engelleme listesini kullanıyorsa liste bir kez derlenir
+    if (crawler_settings.get('use_domain_blocking') and detector_settings.get('use_domain_blocking')
+            and crawler_settings.get('blocked_domains') == detector_settings.get('blocked_domains')):
+        factories['domain_blocklist'] = lambda: _compile_blocklist(crawler_settings.get('blocked_domains'))
+    for key, factory in factories.items():
+        shared[key] = crawler_settings.get(key) or detector_settings.get(key)
+        if shared[key] is None:
+            shared[key] = owned[key] = factory()
+    page_pipeline = shared['page_pipeline']
     
-    print(f"✅ Crawling tamamlandı: {crawl_results['total_found']} URL bulundu")
+    # Kalıcı HTTP önbelleği açıksa crawler ve detector aynı önbelleği kullanır
+    http_cache = crawler_settings.get('http_cache') or detector_settings.get('http_cache')
+    if http_cache is None:
+        http_cache = _open_http_cache()
+        if http_cache is not None:
+            owned['http_cache'] = http_cache
+    shared['http_cache'] = http_cache
     
-    # Tüm URL'leri birleştir (başlangıç + bulunan)
-    all_urls = list(set(start_urls + crawl_results['found_urls']))
+    # robots.txt kuralları crawler ve detector arasında paylaşılır
+    robots_cache = crawler_settings.get('robots_cache') or detector_settings.get('robots_cache')
+    if robots_cache is None:
+        robots_cache = _open_robots_cache()
+        if robots_cache is not None:
+            owned['robots_cache'] = robots_cache
+    shared['robots_cache'] = robots_cache
     
-    # Domain Detector ile domain'leri tespit et
-    print(f"🔍 Domain tespiti başlatılıyor ({len(all_urls)} URL)...")
-    detector = DomainDetector(**detector_settings)
-    domain_results = detector.detect_domains_from_urls(all_urls)
+    # Proxy listesi bir kez doğrulanır, havuz crawler ve detector arasında paylaşılır
+    proxy_pool = crawler_settings.get('proxy_pool') or detector_settings.get('proxy_pool')
+    if proxy_pool is None:
+        settings = crawler_settings if crawler_settings.get('use_proxy') else detector_settings
+        proxy_pool = _open_proxy_pool(settings.get('use_proxy'), settings.get('proxy_list'))
+        if proxy_pool is not None:
+            owned['proxy_pool'] = proxy_pool
+    shared['proxy_pool'] = proxy_pool
+    
+    crawler_settings = {**crawler_settings, **shared}
+    detector_settings = {**detector_settings, **shared}
+    
+    # DNS doğrulayıcı sadece detector tarafından kullanılır
+    if detector_settings.get('dns_validator') is None:
+        owned['dns_validator'] = DNSValidator(cache=dns_cache)
+        detector_settings['dns_validator'] = owned['dns_validator']
+    
+    crawler = None
+    try:
+        # URL Crawler ile URL'leri topla
+        print("🕷️  URL Crawling başlatılıyor...")
+        crawler = URLCrawler(**crawler_settings)
+        if concurrency:
+            crawl_results = crawler.crawl_concurrent(start_urls, concurrency=concurrency)
+        else:
+            crawl_results = crawler.crawl(start_urls)
+        
+        print(f"✅ Crawling tamamlandı: {crawl_results['total_found']} URL bulundu")
+        
+        # Tüm URL'leri birleştir (başlangıç + bulunan); başlangıç URL'leri de
+        # kanonik biçimde verilir, aynı sayfa detector'da iki kez işlenmez
+        canonical_start_urls = []
+        for url in start_urls:
+            record = parse_url(url)
+            canonical_start_urls.append(record.url if record is not None else url)
+        all_urls = list(set(canonical_start_urls + crawl_results['found_urls']))
+        
+        # Domain Detector ile domain'leri tespit et
+        print(f"🔍 Domain tespiti başlatılıyor ({len(all_urls)} URL)...")
+        detector = DomainDetector(**detector_settings)
+        domain_results = detector.detect_domains_from_urls(all_urls, concurrency=concurrency)
+    finally:
+        # Spider her iş için yeni crawler oluşturur; görülen URL kümeleri iş bitince kapatılır
+        if crawler is not None:
+            crawler.close()
+        # Ters sırada kapat: DNS önbelleği onu kullanan bileşenlerden sonra kapanır
+        for component in reversed(list(owned.values())):
+            if hasattr(component, 'close'):
+                component.close()
+    
+    stats = page_pipeline.stats
+    print(f"♻️  Sayfa pipeline: {stats['fetches']} indirme, {stats['cache_hits'] + stats['coalesced']} tekrar kullanım")
+    if 'http_cache' in owned:
+        _print_http_cache_stats(http_cache)
+    if 'robots_cache' in owned:
+        _print_robots_stats(robots_cache)
+    if 'retry_policy' in owned:
+        _print_retry_stats(shared['retry_policy'])
+    if 'proxy_pool' in owned:
+        _print_proxy_stats(proxy_pool)
+    if 'scheduler' in owned:
+        _print_host_rates(shared['scheduler'])
     
     return crawl_results, domain_results, detector
 
+class _SpiderComponents:
+    """
+    Spider boyunca paylaşılan bileşenler
+    
+    Host bazlı zamanlayıcı, sayfa pipeline'ı, bağlantı havuzu, gövde okuyucusu,
+    bir kez derlenen engelleme listesi, DNS doğrulayıcı/önbelleği, HTTP ve
+    robots.txt önbellekleri, retry politikası ve proxy havuzu spider başında
+    bir kez oluşturulur ve her işin crawler/detector ayarlarına eklenir.
+    """
+    
+    def __init__(self, use_random_user_agent=False, use_proxy=False, proxy_list=None, blocked_domains=None,
+                 use_domain_blocking=False, parse_workers=None, domain_url_store=None):
+        self.scheduler = HostScheduler(1.0)
+        self.page_pipeline = PagePipeline(parse_workers=parse_workers)
+        self.dns_cache = _open_dns_cache()
+        self.connection_pool = ConnectionPool(dns_cache=self.dns_cache)
+        self.body_reader = BodyReader()
+        self.domain_blocklist = _compile_blocklist(blocked_domains) if use_domain_blocking else None
+        self.dns_validator = DNSValidator(cache=self.dns_cache)
+        self.http_cache = _open_http_cache()
+        self.robots_cache = _open_robots_cache()
+        self.retry_policy = RetryPolicy()
+        self.proxy_pool = _open_proxy_pool(use_proxy, proxy_list)
+        self.domain_url_store = domain_url_store
+        self._pool_stats = None
+        
+        # Crawler ve detector'ın ortak ayarları
+        self._common = {
+            'use_random_user_agent': use_random_user_agent,
+            'use_proxy': use_proxy,
+            'proxy_list': proxy_list,
+            'blocked_domains': blocked_domains,
+            'use_domain_blocking': use_domain_blocking,
+            'scheduler': self.scheduler,
+            'page_pipeline': self.page_pipeline,
+            'connection_pool': self.connection_pool,
+            'body_reader': self.body_reader,
+            'domain_blocklist': self.domain_blocklist,
+            'http_cache': self.http_cache,
+            'robots_cache': self.robots_cache,
+            'retry_policy': self.retry_policy,
+            'proxy_pool': self.proxy_pool
+        }
+    
+    def crawler_settings(self, max_depth, max_urls, excluded_extensions):
+        """Her işin URLCrawler ayarları"""
+        return {
+            'delay': 1.0,
+            'max_depth': max_depth,
+            'max_urls': max_urls,
+            'excluded_extensions': excluded_extensions,  # Dosya uzantısı filtresi
+            **self._common
+        }
+    
+    def detector_settings(self):
+        """Her işin DomainDetector ayarları"""
+        settings = {
+            'delay': 0.5,    # Daha hızlı domain tespiti
+            'timeout': 10,
+            'validate_domains': True,
+            **self._common,
+            'dns_validator': self.dns_validator
+        }
+        if self.domain_url_store is not None:
+            settings['domain_url_store'] = self.domain_url_store
+        return settings
+    
+    def close(self):
+        """Bileşenleri kapatır (DNS önbelleği onu kullanan bileşenlerden sonra kapanır)"""
+        self._pool_stats = self.connection_pool.stats()
+        self.page_pipeline.close()
+        self.connection_pool.close()
+        self.dns_validator.close()
+        for component in (self.dns_cache, self.http_cache, self.robots_cache, self.proxy_pool):
+            if component is not None:
+                component.close()
+    
+    def print_stats(self):
+        """Spider boyunca toplanan bağlantı, indirme, önbellek, retry ve proxy istatistiklerini yazdırır"""
+        pool_stats = self._pool_stats or self.connection_pool.stats()
+        print(f"🔌 Bağlantı havuzu: {pool_stats['requests']} istek, {pool_stats['connections']} yeni bağlantı, "
+              f"%{pool_stats['reuse_ratio'] * 100:.0f} tekrar kullanım")
+        body_stats = self.body_reader.summary()
+        print(f"📦 İndirilen HTML: {body_stats['bytes_read'] / 1024:.0f} KB, atlanan yanıt: "
+              f"{body_stats['skipped_non_html'] + body_stats['skipped_too_large']} "
+              f"(~{body_stats['bytes_avoided'] / 1024:.0f} KB indirilmedi)")
+        if self.dns_cache is not None:
+            print(f"🧭 DNS önbelleği: %{self.dns_cache.hit_ratio * 100:.0f} isabet, "
+                  f"{self.dns_validator.stats['lookups']} yeni DNS sorgusu")
+        if self.http_cache is not None:
+            _print_http_cache_stats(self.http_cache)
+        if self.robots_cache is not None:
+            _print_robots_stats(self.robots_cache)
+        _print_retry_stats(self.retry_policy)
+        if self.proxy_pool is not None:
+            _print_proxy_stats(self.proxy_pool)
+        _print_host_rates(self.scheduler)
+    
+    def results(self):
+        """Final sonuçlara eklenecek retry ve (uyarlamalı modda) host hızı bilgileri"""
+        results = {'retries': self.retry_policy.summary()}
+        if self.scheduler.adaptive:
+            results['host_rates'] = self.scheduler.rates()
+        return results
+
 def spider_crawl_domains(initial_urls, max_depth=3, max_domains_per_level=20, max_total_domains=100, 
                         excluded_extensions=None, use_random_user_agent=False, use_proxy=False, proxy_list=None,
-                        blocked_domains=None, use_domain_blocking=False):
-    """Spider crawl - bulunan domain'leri zincirleme crawl eder (Orijinal versiyon)"""
+                        blocked_domains=None, use_domain_blocking=False, concurrency=None, workers=None,
+                        parse_workers=None, checkpoint_path=None, resume=False, result_stream=None,
+                        domain_url_store=None):
+    """
+    Spider crawl - bulunan domain'leri zincirleme crawl eder (Orijinal versiyon)
+    
+    Seviye bariyeri yoktur: yeni bulunan her domain spider derinliği ile
+    etiketlenip hemen kuyruğa alınır ve boşta olan ilk worker tarafından işlenir.
+    
+    Args:
+        initial_urls: Başlangıç URL'leri
+        max_depth: Maksimum spider derinliği
+        max_domains_per_level: Her derinlikte kuyruğa alınacak maksimum domain sayısı
+        max_total_domains: Toplam maksimum domain sayısı
+        excluded_extensions: Hariç tutulacak dosya uzantıları
+        concurrency: Verilirse sayfa crawling bu sayıda thread ile eşzamanlı yapılır
+        workers: Aynı anda işlenecek domain sayısı (varsayılan: config.SPIDER_WORKERS)
+        parse_workers: HTML parse için process sayısı (varsayılan: config.PARSE_WORKERS)
+        checkpoint_path: Verilirse crawl durumu periyodik olarak bu dosyaya kaydedilir
+        resume: True ise ``checkpoint_path``'teki durumdan devam edilir; tamamlanmış
+            işler tekrar indirilmez
+        result_stream: Verilirse yeni domain'ler, sayfalar ve tamamlanan işler bu
+            ``ResultStreamWriter``'a bulundukları anda yazılır
+        domain_url_store: Verilirse tüm işlerde domain'e referans veren URL'ler bu
+            ``DomainURLStore``'da toplanır (verilmezse her işin detector'ı kendi deposunu kullanır)
+    """
     
     all_domains = set()
-    processed_domains = set()
-    current_urls = initial_urls.copy()
+    level_domain_counts = {}
+    
+    checkpoint, resumed_state = _open_checkpoint(checkpoint_path, resume, 'spider')
+    queue = SpiderWorkQueue(max_depth, {'domain': max_domains_per_level}, workers, checkpoint=checkpoint)
     
     print(f"🕸️  SPIDER CRAWL BAŞLATIYOR")
     print(f"   Maksimum derinlik: {max_depth}")
     print(f"   Seviye başına max domain: {max_domains_per_level}")
     print(f"   Toplam max domain: {max_total_domains}")
     print(f"   Başlangıç URL'leri: {len(initial_urls)}")
+    print(f"   Eşzamanlı domain worker: {queue.workers}")
+    
+    # Tüm spider boyunca paylaşılan bileşenler
+    components = _SpiderComponents(use_random_user_agent, use_proxy, proxy_list, blocked_domains,
+                                   use_domain_blocking, parse_workers, domain_url_store)
+    
+    if resumed_state is not None:
+        queue.restore(resumed_state)
+        components.scheduler.restore(resumed_state['scheduler'])
+        all_domains = resumed_state['domains']
+        level_domain_counts = {depth: counts[0] for depth, counts in resumed_state['level_counts'].items()}
     
     # Excluded extensions bilgisini göster
     if excluded_extensions is None:
@@ -68,127 +433,92 @@ def spider_crawl_domains(initial_urls, max_depth=3, max_domains_per_level=20, ma
     else:
         print(f"   Hariç tutulan uzantılar: {excluded_extensions}")
     
-    for depth in range(max_depth):
-        if len(all_domains) >= max_total_domains:
-            print(f"⚠️  Maksimum domain sayısına ulaşıldı ({max_total_domains})")
-            break
-            
-        if not current_urls:
-            print(f"⚠️  İşlenecek URL kalmadı")
-            break
-        
-        print(f"\n🔄 SEVİYE {depth + 1} - {len(current_urls)} URL işlenecek")
-        
-        # Bu seviyedeki tüm URL'leri işle
-        level_domains = set()
-        
-        for i, url in enumerate(current_urls, 1):
-            if len(all_domains) >= max_total_domains:
-                print(f"⚠️  Maksimum domain sayısına ulaşıldı, seviye durduruluyor")
-                break
-                
-            print(f"  🔍 ({i}/{len(current_urls)}) İşleniyor: {url}")
-            
-            # Her URL için ayrı crawling yap
-            crawler_settings = {
-                'delay': 1.0,
-                'max_depth': 2,  # Her domain için daha derin crawl
-                'max_urls': 30,   # Her domain için daha fazla URL
-                'excluded_extensions': excluded_extensions,  # Dosya uzantısı filtresi
-                'use_random_user_agent': use_random_user_agent,
-                'use_proxy': use_proxy,
-                'proxy_list': proxy_list,
-                'blocked_domains': blocked_domains,
-                'use_domain_blocking': use_domain_blocking
-            }
-            
-            detector_settings = {
-                'delay': 0.5,    # Daha hızlı domain tespiti
-                'timeout': 10,
-                'validate_domains': True,
-                'use_random_user_agent': use_random_user_agent,
-                'use_proxy': use_proxy,
-                'proxy_list': proxy_list,
-                'blocked_domains': blocked_domains,
-                'use_domain_blocking': use_domain_blocking
-            }
-            
-            try:
-                # Bu URL'yi crawl et ve domain'leri tespit et
-                crawl_results, domain_results, detector = crawl_and_detect_domains(
-                    [url], crawler_settings, detector_settings
-                )
-                
-                # Yeni domain'leri ekle
-                new_domains = set(domain_results['valid_domains']) - all_domains
-                level_domains.update(new_domains)
-                all_domains.update(new_domains)
-                
-                print(f"    ✅ {len(new_domains)} yeni domain bulundu")
-                print(f"    📄 {crawl_results['total_found']} URL crawl edildi (filtrelenmiş)")
-                
-                # İlk birkaç yeni domain'i göster
-                if new_domains:
-                    for j, domain in enumerate(list(new_domains)[:3], 1):
-                        print(f"      {j}. {domain}")
-                    if len(new_domains) > 3:
-                        print(f"      ... ve {len(new_domains) - 3} domain daha")
-                
-                # Rate limiting
-                if i < len(current_urls):
-                    time.sleep(1)
-                    
-            except Exception as e:
-                print(f"    ❌ Hata: {e}")
-                continue
-        
-        print(f"📊 Seviye {depth + 1} sonuçları:")
-        print(f"   Bu seviyede yeni domain'ler: {len(level_domains)}")
-        print(f"   Toplam domain'ler: {len(all_domains)}")
-        
-        # Bu seviyede bulunan domain'lerin özetini göster
-        if level_domains:
-            print(f"   Seviye {depth + 1} domain'leri:")
-            for i, domain in enumerate(list(level_domains)[:5], 1):
-                print(f"     {i}. {domain}")
-            if len(level_domains) > 5:
-                print(f"     ... ve {len(level_domains) - 5} domain daha")
-        
-        # İşlenmiş domain'leri kaydet
-        processed_domains.update([detector.extract_domain(url) for url in current_urls])
+    crawler_settings = components.crawler_settings(
+        max_depth=2,  # Her domain için daha derin crawl
+        max_urls=30,  # Her domain için daha fazla URL
+        excluded_extensions=excluded_extensions
+    )
+    detector_settings = components.detector_settings()
+    
+    def process(task):
+        print(f"  🔍 [Derinlik {task.depth + 1}] İşleniyor: {task.url}")
+        # Bu URL'yi crawl et ve domain'leri tespit et
+        return crawl_and_detect_domains(
+            [task.url], crawler_settings, detector_settings, concurrency=concurrency
+        )
+    
+    def on_result(task, result):
+        crawl_results, domain_results, detector = result
         
-        # Bir sonraki seviye için URL'leri hazırla
-        # Bu seviyede bulunan yeni domain'lerden henüz işlenmemiş olanları seç
-        next_domains = []
-        for domain in level_domains:
-            if (domain not in processed_domains and 
-                len(next_domains) < max_domains_per_level and
-                len(all_domains) < max_total_domains):
-                next_domains.append(domain)
+        # Yeni domain'leri ekle (toplam limit aşılmadan)
+        new_domains = set(domain_results['valid_domains']) - all_domains
+        new_domains = set(sorted(new_domains)[:max(0, max_total_domains - len(all_domains))])
+        all_domains.update(new_domains)
+        level_domain_counts[task.depth] = level_domain_counts.get(task.depth, 0) + len(new_domains)
+        if result_stream is not None:
+            for domain in sorted(new_domains):
+                result_stream.domain(domain, depth=task.depth + 1, source=task.url)
+            result_stream.event('task_done', url=task.url, depth=task.depth + 1, new_domains=len(new_domains))
         
-        # Domain'leri URL'lere çevir
-        current_urls = [f"https://{domain}" for domain in next_domains]
+        print(f"    ✅ [Derinlik {task.depth + 1}] {task.url}: {len(new_domains)} yeni domain bulundu")
+        print(f"    📄 {crawl_results['total_found']} URL crawl edildi (filtrelenmiş)")
         
-        print(f"   Bir sonraki seviye için: {len(current_urls)} URL hazırlandı")
+        # İlk birkaç yeni domain'i göster
+        if new_domains:
+            for j, domain in enumerate(list(new_domains)[:3], 1):
+                print(f"      {j}. {domain}")
+            if len(new_domains) > 3:
+                print(f"      ... ve {len(new_domains) - 3} domain daha")
         
-        # Bir sonraki seviye için hazırlanan URL'leri göster
-        if current_urls:
-            print(f"   Bir sonraki seviye URL'leri:")
-            for i, url in enumerate(current_urls[:3], 1):
-                print(f"     {i}. {url}")
-            if len(current_urls) > 3:
-                print(f"     ... ve {len(current_urls) - 3} URL daha")
+        # Yeni domain'leri bekletmeden bir sonraki derinlik için kuyruğa al
+        for domain in new_domains:
+            if len(all_domains) < max_total_domains:
+                queue.admit(f"https://{domain}", task.depth + 1)
         
-        # Rate limiting
-        if depth < max_depth - 1 and current_urls:
-            print(f"⏳ Bir sonraki seviye için 3 saniye bekleniyor...")
-            time.sleep(3)
+        # Bulunan domain'ler çocuk işlerin kabulünden sonra journal'a yazılır; çökmede 'f'
+        # kaydı diskteyse kabuller de diskte olur ve devam edildiğinde alt ağaç kaybolmaz
+        if checkpoint is not None:
+            checkpoint.found(task.depth, new_domains)
+    
+    def should_stop():
+        return len(all_domains) >= max_total_domains
+    
+    def checkpoint_state():
+        return {
+            'mode': 'spider',
+            **queue.state(),
+            'domains': all_domains,
+            'level_counts': {depth: [count, 0] for depth, count in level_domain_counts.items()},
+            'scheduler': components.scheduler.state()
+        }
+    
+    for url in initial_urls:
+        queue.admit(url, 0)
+    if checkpoint is not None:
+        checkpoint.start(checkpoint_state)
+    
+    try:
+        queue.run(process, on_result, should_stop)
+    finally:
+        if checkpoint is not None:
+            checkpoint.close()
+        components.close()
+    
+    components.print_stats()
+    if checkpoint is not None:
+        print(f"💾 Checkpoint: {checkpoint.path} ({checkpoint.stats['records']} kayıt, "
+              f"{checkpoint.stats['snapshots']} snapshot)")
+    
+    if len(all_domains) >= max_total_domains:
+        print(f"⚠️  Maksimum domain sayısına ulaşıldı ({max_total_domains})")
     
     print(f"\n🎯 SPIDER CRAWL TAMAMLANDI")
     print(f"   Toplam bulunan domain: {len(all_domains)}")
-    print(f"   İşlenen seviye: {depth + 1}")
-    print(f"   İşlenen toplam domain: {len(processed_domains)}")
+    print(f"   İşlenen seviye: {queue.deepest_level + 1}")
+    print(f"   İşlenen toplam domain: {len(queue.processed_domains)}")
     print(f"   Filtrelenen uzantı sayısı: {len(excluded_extensions) if excluded_extensions else 0}")
+    for depth in sorted(level_domain_counts):
+        print(f"   Derinlik {depth + 1}: {level_domain_counts[depth]} yeni domain")
     
     # Final sonuçları hazırla
     final_results = {
@@ -199,20 +529,27 @@ def spider_crawl_domains(initial_urls, max_depth=3, max_domains_per_level=20, ma
         'valid_domains': sorted(list(all_domains)),
         'invalid_domains': [],
         'validation_enabled': True,
-        'spider_depth': depth + 1,
-        'processed_domains': len(processed_domains),
+        'spider_depth': queue.deepest_level + 1,
+        'processed_domains': len(queue.processed_domains),
         'excluded_extensions': excluded_extensions,
         'analysis_time': time.time()
     }
+    final_results.update(components.results())
     
     return final_results
 
 def enhanced_spider_crawl_domains(initial_urls, max_depth=3, max_domains_per_level=20, max_total_domains=100, 
                                 max_pages_per_domain=50, excluded_extensions=None, use_random_user_agent=False,
-                                use_proxy=False, proxy_list=None, blocked_domains=None, use_domain_blocking=False):
+                                use_proxy=False, proxy_list=None, blocked_domains=None, use_domain_blocking=False,
+                                concurrency=None, workers=None, parse_workers=None, checkpoint_path=None,
+                                resume=False, result_stream=None, domain_url_store=None):
     """
     Gelişmiş Spider Crawl - Hem sayfa hem domain seviyesinde zincirleme crawl
     
+    Seviye bariyeri yoktur: bulunan domain'ler ve diğer domain'lere ait sayfalar
+    hemen kuyruğa alınır. Her derinlikte kotanın yarısı domain'lere, yarısı
+    sayfalara ayrılır.
+    
     Args:
         initial_urls: Başlangıç URL'leri
         max_depth: Maksimum crawl derinliği
@@ -220,12 +557,32 @@ def enhanced_spider_crawl_domains(initial_urls, max_depth=3, max_domains_per_lev
         max_total_domains: Toplam maksimum domain sayısı
         max_pages_per_domain: Her domain için maksimum sayfa sayısı
         excluded_extensions: Hariç tutulacak dosya uzantıları
+        concurrency: Verilirse sayfa crawling bu sayıda thread ile eşzamanlı yapılır
+        workers: Aynı anda işlenecek domain sayısı (varsayılan: config.SPIDER_WORKERS)
+        parse_workers: HTML parse için process sayısı (varsayılan: config.PARSE_WORKERS)
+        checkpoint_path: Verilirse crawl durumu periyodik olarak bu dosyaya kaydedilir
+        resume: True ise ``checkpoint_path``'teki durumdan devam edilir; tamamlanmış
+            işler tekrar indirilmez
+        result_stream: Verilirse yeni domain'ler, sayfalar ve tamamlanan işler bu
+            ``ResultStreamWriter``'a bulundukları anda yazılır
+        domain_url_store: Verilirse tüm işlerde domain'e referans veren URL'ler bu
+            ``DomainURLStore``'da toplanır (verilmezse her işin detector'ı kendi deposunu kullanır)
     """
     
     all_domains = set()
-    all_pages = set()
-    processed_domains = set()
-    current_urls = initial_urls.copy()
+    # Sayfalar sadece görülen kümesinde tutulur; liste halinde sonuç akışına ve
+    # checkpoint'e yazılır, sonuçtaki sayfa listesi bellek backend'inde kümeden üretilir
+    seen_pages = create_seen_set()
+    total_pages = 0
+    level_counts = {}
+    
+    checkpoint, resumed_state = _open_checkpoint(checkpoint_path, resume, 'enhanced_spider')
+    queue = SpiderWorkQueue(
+        max_depth,
+        {'domain': max_domains_per_level // 2, 'page': max_domains_per_level // 2},
+        workers,
+        checkpoint=checkpoint
+    )
     
     print(f"🕸️  GELİŞMİŞ SPIDER CRAWL BAŞLATIYOR")
     print(f"   Maksimum derinlik: {max_depth}")
@@ -233,6 +590,20 @@ def enhanced_spider_crawl_domains(initial_urls, max_depth=3, max_domains_per_lev
     print(f"   Toplam max domain: {max_total_domains}")
     print(f"   Domain başına max sayfa: {max_pages_per_domain}")
     print(f"   Başlangıç URL'leri: {len(initial_urls)}")
+    print(f"   Eşzamanlı domain worker: {queue.workers}")
+    
+    # Tüm spider boyunca paylaşılan bileşenler
+    components = _SpiderComponents(use_random_user_agent, use_proxy, proxy_list, blocked_domains,
+                                   use_domain_blocking, parse_workers, domain_url_store)
+    
+    if resumed_state is not None:
+        queue.restore(resumed_state)
+        components.scheduler.restore(resumed_state['scheduler'])
+        all_domains = resumed_state['domains']
+        # Sayfalar checkpoint arşivinden okunarak doğrudan görülen kümesine aktarılır
+        seen_pages.update(checkpoint.iter_pages())
+        total_pages = resumed_state['pages_count']
+        level_counts = resumed_state['level_counts']
     
     # Excluded extensions bilgisini göster
     if excluded_extensions is None:
@@ -242,175 +613,145 @@ def enhanced_spider_crawl_domains(initial_urls, max_depth=3, max_domains_per_lev
     else:
         print(f"   Hariç tutulan uzantılar: {excluded_extensions}")
     
-    for depth in range(max_depth):
-        if len(all_domains) >= max_total_domains:
-            print(f"⚠️  Maksimum domain sayısına ulaşıldı ({max_total_domains})")
-            break
-            
-        if not current_urls:
-            print(f"⚠️  İşlenecek URL kalmadı")
-            break
-        
-        print(f"\n🔄 SEVİYE {depth + 1} - {len(current_urls)} URL işlenecek")
-        
-        # Bu seviyedeki tüm URL'leri işle
-        level_domains = set()
-        level_pages = set()
-        
-        for i, url in enumerate(current_urls, 1):
-            if len(all_domains) >= max_total_domains:
-                print(f"⚠️  Maksimum domain sayısına ulaşıldı, seviye durduruluyor")
-                break
-                
-            print(f"  🔍 ({i}/{len(current_urls)}) İşleniyor: {url}")
-            
-            # Her URL için derin sayfa crawling yap
-            crawler_settings = {
-                'delay': 1.0,
-                'max_depth': 3,  # Daha derin sayfa crawling
-                'max_urls': max_pages_per_domain,  # Domain başına daha fazla sayfa
-                'excluded_extensions': excluded_extensions,
-                'use_random_user_agent': use_random_user_agent,
-                'use_proxy': use_proxy,
-                'proxy_list': proxy_list,
-                'blocked_domains': blocked_domains,
-                'use_domain_blocking': use_domain_blocking
-            }
-            
-            detector_settings = {
-                'delay': 0.5,
-                'timeout': 10,
-                'validate_domains': True,
-                'use_random_user_agent': use_random_user_agent,
-                'use_proxy': use_proxy,
-                'proxy_list': proxy_list,
-                'blocked_domains': blocked_domains,
-                'use_domain_blocking': use_domain_blocking
-            }
-            
-            try:
-                # Bu URL'yi derin crawl et
-                crawl_results, domain_results, detector = crawl_and_detect_domains(
-                    [url], crawler_settings, detector_settings
-                )
-                
-                # Bulunan sayfaları kaydet
-                found_pages = set(crawl_results['found_urls'])
-                new_pages = found_pages - all_pages
-                level_pages.update(new_pages)
-                all_pages.update(new_pages)
-                
-                # Yeni domain'leri kaydet
-                new_domains = set(domain_results['valid_domains']) - all_domains
-                level_domains.update(new_domains)
-                all_domains.update(new_domains)
-                
-                print(f"    ✅ {len(new_domains)} yeni domain, {len(new_pages)} yeni sayfa bulundu")
-                print(f"    📄 {crawl_results['total_found']} URL crawl edildi (filtrelenmiş)")
-                
-                # İlk birkaç yeni domain ve sayfayı göster
-                if new_domains:
-                    print(f"    🌐 Yeni domain'ler:")
-                    for j, domain in enumerate(list(new_domains)[:3], 1):
-                        print(f"      {j}. {domain}")
-                    if len(new_domains) > 3:
-                        print(f"      ... ve {len(new_domains) - 3} domain daha")
-                
-                if new_pages:
-                    print(f"    📄 Yeni sayfalar:")
-                    for j, page in enumerate(list(new_pages)[:3], 1):
-                        print(f"      {j}. {page}")
-                    if len(new_pages) > 3:
-                        print(f"      ... ve {len(new_pages) - 3} sayfa daha")
-                
-                # Rate limiting
-                if i < len(current_urls):
-                    time.sleep(1)
-                    
-            except Exception as e:
-                print(f"    ❌ Hata: {e}")
-                continue
-        
-        print(f"📊 Seviye {depth + 1} sonuçları:")
-        print(f"   Bu seviyede yeni domain'ler: {len(level_domains)}")
-        print(f"   Bu seviyede yeni sayfalar: {len(level_pages)}")
-        print(f"   Toplam domain'ler: {len(all_domains)}")
-        print(f"   Toplam sayfalar: {len(all_pages)}")
+    # Her URL için derin sayfa crawling yap
+    crawler_settings = components.crawler_settings(
+        max_depth=3,  # Daha derin sayfa crawling
+        max_urls=max_pages_per_domain,  # Domain başına daha fazla sayfa
+        excluded_extensions=excluded_extensions
+    )
+    detector_settings = components.detector_settings()
+    
+    def process(task):
+        print(f"  🔍 [Derinlik {task.depth + 1}] İşleniyor: {task.url}")
+        # Bu URL'yi derin crawl et
+        return crawl_and_detect_domains(
+            [task.url], crawler_settings, detector_settings, concurrency=concurrency
+        )
+    
+    def on_result(task, result):
+        nonlocal total_pages
+        crawl_results, domain_results, detector = result
         
-        # Bu seviyede bulunan domain'lerin özetini göster
-        if level_domains:
-            print(f"   Seviye {depth + 1} domain'leri:")
-            for i, domain in enumerate(list(level_domains)[:5], 1):
-                print(f"     {i}. {domain}")
-            if len(level_domains) > 5:
-                print(f"     ... ve {len(level_domains) - 5} domain daha")
+        # Bulunan sayfaları kaydet
+        new_pages = [page for page in crawl_results['found_urls'] if seen_pages.add(page)]
+        total_pages += len(new_pages)
         
-        # İşlenmiş domain'leri kaydet
-        processed_domains.update([detector.extract_domain(url) for url in current_urls])
+        # Yeni domain'leri kaydet (toplam limit aşılmadan)
+        new_domains = set(domain_results['valid_domains']) - all_domains
+        new_domains = set(sorted(new_domains)[:max(0, max_total_domains - len(all_domains))])
+        all_domains.update(new_domains)
         
-        # Bir sonraki seviye için URL'leri hazırla
-        # Strategi 1: Yeni domain'lerden URL'ler seç
-        next_urls_from_domains = []
-        for domain in level_domains:
-            if (domain not in processed_domains and 
-                len(next_urls_from_domains) < max_domains_per_level // 2 and
-                len(all_domains) < max_total_domains):
-                next_urls_from_domains.append(f"https://{domain}")
+        counts = level_counts.setdefault(task.depth, [0, 0])
+        counts[0] += len(new_domains)
+        counts[1] += len(new_pages)
+        if result_stream is not None:
+            for domain in sorted(new_domains):
+                result_stream.domain(domain, depth=task.depth + 1, source=task.url)
+            for page in new_pages:
+                result_stream.page(page, depth=task.depth + 1, source=task.url)
+            result_stream.event('task_done', url=task.url, depth=task.depth + 1,
+                                new_domains=len(new_domains), new_pages=len(new_pages))
         
-        # Strateji 2: Yeni sayfalardan URL'ler seç
-        next_urls_from_pages = []
-        for page in level_pages:
-            page_domain = detector.extract_domain(page)
-            if (page_domain not in processed_domains and 
-                len(next_urls_from_pages) < max_domains_per_level // 2 and
-                len(all_domains) < max_total_domains):
-                next_urls_from_pages.append(page)
+        print(f"    ✅ [Derinlik {task.depth + 1}] {task.url}: {len(new_domains)} yeni domain, {len(new_pages)} yeni sayfa bulundu")
+        print(f"    📄 {crawl_results['total_found']} URL crawl edildi (filtrelenmiş)")
         
-        # İki stratejiyi birleştir
-        current_urls = next_urls_from_domains + next_urls_from_pages
+        # İlk birkaç yeni domain ve sayfayı göster
+        if new_domains:
+            print(f"    🌐 Yeni domain'ler:")
+            for j, domain in enumerate(list(new_domains)[:3], 1):
+                print(f"      {j}. {domain}")
+            if len(new_domains) > 3:
+                print(f"      ... ve {len(new_domains) - 3} domain daha")
         
-        print(f"   Bir sonraki seviye için: {len(current_urls)} URL hazırlandı")
-        print(f"     - Domain'lerden: {len(next_urls_from_domains)} URL")
-        print(f"     - Sayfalardan: {len(next_urls_from_pages)} URL")
+        if new_pages:
+            print(f"    📄 Yeni sayfalar:")
+            for j, page in enumerate(new_pages[:3], 1):
+                print(f"      {j}. {page}")
+            if len(new_pages) > 3:
+                print(f"      ... ve {len(new_pages) - 3} sayfa daha")
         
-        # Bir sonraki seviye için hazırlanan URL'leri göster
-        if current_urls:
-            print(f"   Bir sonraki seviye URL'leri:")
-            for i, url in enumerate(current_urls[:5], 1):
-                print(f"     {i}. {url}")
-            if len(current_urls) > 5:
-                print(f"     ... ve {len(current_urls) - 5} URL daha")
+        if len(all_domains) < max_total_domains:
+            # Strateji 1: Yeni domain'ler hemen kuyruğa alınır
+            for domain in new_domains:
+                queue.admit(f"https://{domain}", task.depth + 1, 'domain')
+            
+            # Strateji 2: Henüz işlenmemiş domain'lere ait yeni sayfalar kuyruğa alınır
+            for page in new_pages:
+                queue.admit(page, task.depth + 1, 'page')
         
-        # Rate limiting
-        if depth < max_depth - 1 and current_urls:
-            print(f"⏳ Bir sonraki seviye için 3 saniye bekleniyor...")
-            time.sleep(3)
+        # Bulunanlar çocuk işlerin kabulünden sonra journal'a yazılır; çökmede 'f'
+        # kaydı diskteyse kabuller de diskte olur ve devam edildiğinde alt ağaç kaybolmaz
+        if checkpoint is not None:
+            checkpoint.found(task.depth, new_domains, new_pages)
+    
+    def should_stop():
+        return len(all_domains) >= max_total_domains
+    
+    def checkpoint_state():
+        return {
+            'mode': 'enhanced_spider',
+            **queue.state(),
+            'domains': all_domains,
+            'level_counts': level_counts,
+            'scheduler': components.scheduler.state()
+        }
+    
+    for url in initial_urls:
+        queue.admit(url, 0)
+    if checkpoint is not None:
+        checkpoint.start(checkpoint_state)
+    
+    try:
+        queue.run(process, on_result, should_stop)
+    finally:
+        if checkpoint is not None:
+            checkpoint.close()
+        components.close()
+    
+    components.print_stats()
+    if checkpoint is not None:
+        print(f"💾 Checkpoint: {checkpoint.path} ({checkpoint.stats['records']} kayıt, "
+              f"{checkpoint.stats['snapshots']} snapshot)")
+    seen_stats = seen_pages.stats()
+    print(f"🧮 Görülen sayfa kümesi ({seen_stats['backend']}): {seen_stats['items']} sayfa, "
+          f"{seen_stats['memory_bytes'] / 1024:.0f} KB bellek")
+    # Bloom/disk backend'leri öğeleri geri veremez; sayfalar sonuç akışından okunur
+    found_pages = sorted(seen_pages) if seen_pages.iterable else []
+    seen_pages.close()
+    if not seen_pages.iterable and result_stream is None:
+        print(f"⚠️  Sayfa listesi {seen_stats['backend']} backend'inde sonuçlara eklenmez; listelemek için --stream kullanın")
+    
+    if len(all_domains) >= max_total_domains:
+        print(f"⚠️  Maksimum domain sayısına ulaşıldı ({max_total_domains})")
     
     print(f"\n🎯 GELİŞMİŞ SPIDER CRAWL TAMAMLANDI")
     print(f"   Toplam bulunan domain: {len(all_domains)}")
-    print(f"   Toplam bulunan sayfa: {len(all_pages)}")
-    print(f"   İşlenen seviye: {depth + 1}")
-    print(f"   İşlenen toplam domain: {len(processed_domains)}")
+    print(f"   Toplam bulunan sayfa: {total_pages}")
+    print(f"   İşlenen seviye: {queue.deepest_level + 1}")
+    print(f"   İşlenen toplam domain: {len(queue.processed_domains)}")
     print(f"   Filtrelenen uzantı sayısı: {len(excluded_extensions) if excluded_extensions else 0}")
+    for depth in sorted(level_counts):
+        print(f"   Derinlik {depth + 1}: {level_counts[depth][0]} yeni domain, {level_counts[depth][1]} yeni sayfa")
     
     # Final sonuçları hazırla
     final_results = {
         'total_domains_found': len(all_domains),
-        'total_pages_found': len(all_pages),
+        'total_pages_found': total_pages,
         'total_valid_domains': len(all_domains),
         'total_invalid_domains': 0,
         'total_urls_processed': len(initial_urls),
         'valid_domains': sorted(list(all_domains)),
-        'found_pages': sorted(list(all_pages)),
+        'found_pages': found_pages,
         'invalid_domains': [],
         'validation_enabled': True,
-        'spider_depth': depth + 1,
-        'processed_domains': len(processed_domains),
+        'spider_depth': queue.deepest_level + 1,
+        'processed_domains': len(queue.processed_domains),
         'max_pages_per_domain': max_pages_per_domain,
         'excluded_extensions': excluded_extensions,
         'analysis_time': time.time(),
         'crawl_strategy': 'enhanced_spider_both_page_and_domain'
     }
+    final_results.update(components.results())
     
     return final_results
     
@@ -426,6 +767,7 @@ def main():
     parser.add_argument('--spider-depth', type=int, default=3, help='Spider crawl derinliği (varsayılan: 3)')
     parser.add_argument('--domains-per-level', type=int, default=20, help='Seviye başına max domain (varsayılan: 20)')
     parser.add_argument('--max-total-domains', type=int, default=100, help='Toplam max domain (varsayılan: 100)')
+    parser.add_argument('--workers', type=int, default=SPIDER_WORKERS, help=f'Aynı anda işlenecek domain sayısı (varsayılan: {SPIDER_WORKERS})')
     
     # Filtreleme ayarları
     parser.add_argument('--exclude-extensions', nargs='*', help='Hariç tutulacak dosya uzantıları (örn: .css .js .pdf)')
@@ -446,7 +788,8 @@ def main():
             args.urls,
             max_depth=args.spider_depth,
             max_domains_per_level=args.domains_per_level,
-            max_total_domains=args.max_total_domains
+            max_total_domains=args.max_total_domains,
+            workers=args.workers
         )
         
         # Sonuçları kaydet
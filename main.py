@@ -15,28 +15,39 @@ import json
 import time
 import os
 from datetime import datetime
-from modules.config import DEFAULT_EXCLUDED_EXTENSIONS
+from modules.config import DEFAULT_EXCLUDED_EXTENSIONS, DEFAULT_CONCURRENCY, SPIDER_WORKERS, PARSE_WORKERS, SEEN_SET_ERROR_RATE, HTTP_CACHE_FRESH_TTL, METRICS_DUMP_INTERVAL
+from modules.seen_set import SEEN_SET_BACKENDS
+from modules.result_stream import ResultStreamWriter
+from modules.domain_url_store import DomainURLStore, DOMAIN_URL_SAMPLING_MODES
+from modules import metrics
 from domain_crawler import crawl_and_detect_domains, spider_crawl_domains, enhanced_spider_crawl_domains
 
-def save_results(results, filename=None):
-    """Sonuçları JSON dosyasına kaydet"""
+def _result_path(filename, extension):
+    """Sonuç dosyasının data/ klasöründeki yolunu döndürür"""
     # Data klasörünü oluştur (yoksa)
     data_dir = "data"
     os.makedirs(data_dir, exist_ok=True)
     
     if filename is None:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"domain_results_{timestamp}.json"
+        filename = f"domain_results_{timestamp}{extension}"
     
     # Dosya yolunu data klasörü ile birleştir
     if not filename.startswith(data_dir):
-        filepath = os.path.join(data_dir, filename)
-    else:
-        filepath = filename
-    
-    # Sonuçları güzelleştir
+        return os.path.join(data_dir, filename)
+    return filename
+
+def _finalize_results(results):
+    """Sonuçlara zaman damgası ve uzantı bilgisini ekler"""
     results['timestamp'] = datetime.now().isoformat()
     results['excluded_extensions'] = results.get('excluded_extensions', DEFAULT_EXCLUDED_EXTENSIONS)
+
+def save_results(results, filename=None):
+    """Sonuçları JSON dosyasına kaydet"""
+    filepath = _result_path(filename, '.json')
+    
+    # Sonuçları güzelleştir
+    _finalize_results(results)
     
     with open(filepath, 'w', encoding='utf-8') as f:
         json.dump(results, f, indent=2, ensure_ascii=False)
@@ -44,6 +55,32 @@ def save_results(results, filename=None):
     print(f"\n💾 Sonuçlar kaydedildi: {filepath}")
     return filepath
 
+def open_result_stream(filename=None, compress=False, append=False):
+    """Akışlı (NDJSON) sonuç dosyasını açar; domain ve sayfalar bulundukça yazılır"""
+    filepath = _result_path(filename, '.ndjson')
+    if compress and not filepath.endswith('.gz'):
+        filepath += '.gz'
+    return ResultStreamWriter(filepath, append=append)
+
+def close_result_stream(result_stream, results):
+    """Özet kaydını yazar ve akışı kapatır"""
+    _finalize_results(results)
+    result_stream.summary(results)
+    result_stream.close()
+    
+    print(f"\n💾 Sonuçlar akış olarak kaydedildi: {result_stream.path} ({sum(result_stream.counts.values())} kayıt)")
+    print(f"   JSON'a dönüştürmek için: python convert_stream.py {result_stream.path} -o sonuclar.json")
+    return result_stream.path
+
+def export_domain_urls(domain_url_store, filename):
+    """Domain'e referans veren URL'leri JSON dosyasına yazar"""
+    filepath = _result_path(filename, '.json')
+    written = domain_url_store.export(filepath)
+    stats = domain_url_store.stats()
+    print(f"🔗 Domain URL'leri kaydedildi: {filepath} ({stats['domains']} domain, {written} URL, "
+          f"{stats['memory_bytes'] / 1024:.0f} KB bellek)")
+    return filepath
+
 def main():
     parser = argparse.ArgumentParser(description='Domain Crawler - URL\'lerden domain tespit eder')
     parser.add_argument('urls', nargs='+', help='Crawl edilecek URL\'ler')
@@ -53,12 +90,40 @@ def main():
     parser.add_argument('--spider-domains-per-level', type=int, default=20, help='Seviye başına max domain (varsayılan: 20)')
     parser.add_argument('--spider-max-domains', type=int, default=100, help='Toplam max domain (varsayılan: 100)')
     parser.add_argument('--spider-max-pages-per-domain', type=int, default=50, help='Domain başına max sayfa (gelişmiş spider için, varsayılan: 50)')
+    parser.add_argument('--spider-workers', type=int, default=SPIDER_WORKERS, help=f'Spider modunda aynı anda işlenecek domain sayısı (varsayılan: {SPIDER_WORKERS})')
     parser.add_argument('--crawler-delay', type=float, default=1.0, help='Crawler gecikme süresi (varsayılan: 1.0)')
     parser.add_argument('--crawler-depth', type=int, default=2, help='Crawler derinliği (varsayılan: 2)')
     parser.add_argument('--crawler-max-urls', type=int, default=50, help='Crawler max URL (varsayılan: 50)')
+    parser.add_argument('--concurrent', '--async', dest='use_concurrent', action='store_true',
+                        help='Eşzamanlı crawl modu: istekler thread havuzunda paralel yürütülür (--async eski adıdır)')
+    parser.add_argument('--concurrency', type=int, default=DEFAULT_CONCURRENCY, help=f'Eşzamanlı modda istekleri yürüten thread sayısı (varsayılan: {DEFAULT_CONCURRENCY})')
+    parser.add_argument('--parse-workers', type=int, default=PARSE_WORKERS, help=f'HTML parse için process sayısı, 0 ise fetch thread\'inde parse edilir (varsayılan: {PARSE_WORKERS})')
     parser.add_argument('--detector-delay', type=float, default=0.5, help='Detector gecikme süresi (varsayılan: 0.5)')
     parser.add_argument('--detector-timeout', type=int, default=10, help='Detector timeout (varsayılan: 10)')
     parser.add_argument('--no-validation', action='store_true', help='Domain doğrulamasını devre dışı bırak')
+    parser.add_argument('--no-dns-cache', action='store_true', help='Kalıcı DNS önbelleğini (data/dns_cache.db) kullanma')
+    parser.add_argument('--http-cache', action='store_true', help='Sayfaları data/http_cache.db\'de sakla; tekrar crawl\'larda koşullu istek (ETag/Last-Modified) kullan')
+    parser.add_argument('--http-cache-ttl', type=float, default=HTTP_CACHE_FRESH_TTL,
+                        help=f'Bu süreden yeni önbellek kayıtları ağa gidilmeden kullanılır, saniye (varsayılan: {HTTP_CACHE_FRESH_TTL})')
+    parser.add_argument('--ignore-robots', action='store_true', help='robots.txt kurallarını ve Crawl-delay değerlerini yok say')
+    parser.add_argument('--adaptive-delay', action='store_true',
+                        help='Host başına gecikmeyi yanıtlara göre ayarla (AIMD): sağlıklı yanıtlarda hızlan, 429/503/timeout/TTFB artışında yavaşla')
+    parser.add_argument('--seen-set', choices=SEEN_SET_BACKENDS, default='memory',
+                        help='Görülen URL kümesi: memory (tam, bellekte), bloom (Bloom filtresi, az bellek), disk (tam, SQLite) (varsayılan: memory)')
+    parser.add_argument('--seen-set-error-rate', type=float, default=SEEN_SET_ERROR_RATE,
+                        help=f'Bloom filtresinin yanlış pozitif oranı (varsayılan: {SEEN_SET_ERROR_RATE})')
+    parser.add_argument('--checkpoint', help='Spider crawl durumunu periyodik olarak bu dosyaya kaydet (örn: data/crawl.ckpt)')
+    parser.add_argument('--resume', metavar='CHECKPOINT', help='Kaydedilmiş checkpoint\'ten spider crawl\'a devam et')
+    parser.add_argument('--stream', action='store_true', help='Sonuçları bulundukça NDJSON satırları olarak yaz (her domain/sayfa bir satır)')
+    parser.add_argument('--gzip', action='store_true', help='Akışlı çıktıyı gzip ile sıkıştır (--stream ile)')
+    parser.add_argument('--export-domain-urls', metavar='FILE', help='Her domain\'e referans veren URL\'leri JSON olarak kaydet (data/ klasörüne)')
+    parser.add_argument('--domain-urls-limit', type=int, default=0, help='Domain başına saklanacak maksimum URL, 0 ise sınırsız (varsayılan: 0)')
+    parser.add_argument('--domain-urls-sample', choices=DOMAIN_URL_SAMPLING_MODES, default='first',
+                        help='Sınır dolunca: first (ilk görülenler) veya reservoir (rastgele örnek) (varsayılan: first)')
+    parser.add_argument('--metrics', action='store_true', help='Aşama sürelerini (dns, connect, tls, ttfb, body, parse, ...) ölç ve sonda özet tablo yazdır')
+    parser.add_argument('--metrics-file', metavar='FILE', help='Metrikleri periyodik olarak bu dosyaya yaz (.json ise JSON, değilse Prometheus metin formatı; data/ klasörüne)')
+    parser.add_argument('--metrics-interval', type=float, default=METRICS_DUMP_INTERVAL,
+                        help=f'Metrik dosyasının yazılma aralığı, saniye (varsayılan: {METRICS_DUMP_INTERVAL})')
     parser.add_argument('--output', '-o', help='Çıktı dosyası adı (data/ klasörüne kaydedilir)')
     parser.add_argument('--exclude-extensions', nargs='*', help='Hariç tutulacak dosya uzantıları (örn: --exclude-extensions .pdf .jpg)')
     parser.add_argument('--include-all-extensions', action='store_true', help='Tüm dosya uzantılarını dahil et (filtreleme yapma)')
@@ -67,6 +132,7 @@ def main():
     parser.add_argument('--proxy', nargs='*', help='Kullanılacak proxy listesi (örn: --proxy http://proxy1:8080 socks5://proxy2:1080)')
     parser.add_argument('--proxy-file', help='Proxy listesini içeren dosya yolu')
     parser.add_argument('--no-proxy-rotation', action='store_true', help='Proxy rotasyonunu devre dışı bırak')
+    parser.add_argument('--proxy-check-url', help='Proxy doğrulama isteklerinin gönderileceği URL (varsayılan: config.PROXY_VALIDATION_URL)')
     parser.add_argument('--block-domains', nargs='*', help='Engellenecek domain listesi (örn: --block-domains google.com facebook.com)')
     parser.add_argument('--block-domains-file', help='Engellenecek domain listesini içeren dosya yolu')
     parser.add_argument('--use-default-blocked-domains', action='store_true', help='Varsayılan engellenen domain listesini kullan')
@@ -91,6 +157,61 @@ def main():
     else:
         print("🎭 Sabit user agent: Tarassut 1.0")
     
+    # DNS önbelleği ayarı
+    if args.no_dns_cache:
+        import modules.config as config
+        config.USE_DNS_CACHE = False
+        print("🧭 Kalıcı DNS önbelleği: Kapalı")
+    
+    # HTTP önbelleği ayarı
+    if args.http_cache:
+        import modules.config as config
+        config.USE_HTTP_CACHE = True
+        config.HTTP_CACHE_FRESH_TTL = max(0.0, args.http_cache_ttl)
+        print(f"🗄️  HTTP önbelleği: {config.HTTP_CACHE_FILE} (taze kalma süresi: {config.HTTP_CACHE_FRESH_TTL:.0f} sn)")
+    
+    # robots.txt ayarı
+    if args.ignore_robots:
+        import modules.config as config
+        config.RESPECT_ROBOTS_TXT = False
+        print("🤖 robots.txt: Yok sayılıyor")
+    
+    # Uyarlamalı host hızı ayarı
+    if args.adaptive_delay:
+        import modules.config as config
+        config.ADAPTIVE_DELAY = True
+        print(f"🚦 Uyarlamalı hız: Açık ({config.MIN_DELAY}-{config.MAX_DELAY} sn aralığında)")
+    
+    # Görülen URL kümesi ayarı
+    if args.seen_set != 'memory':
+        import modules.config as config
+        config.SEEN_SET_BACKEND = args.seen_set
+        config.SEEN_SET_ERROR_RATE = args.seen_set_error_rate
+        if args.seen_set == 'bloom':
+            print(f"🧮 Görülen URL kümesi: Bloom filtresi (yanlış pozitif oranı: {args.seen_set_error_rate})")
+        else:
+            print(f"🧮 Görülen URL kümesi: Disk ({config.SEEN_SET_DIR})")
+    
+    # Domain URL deposu: spider modlarında tüm işler için tek depo kullanılır
+    domain_url_store = None
+    if args.domain_urls_limit or args.domain_urls_sample != 'first':
+        import modules.config as config
+        config.DOMAIN_URLS_MAX_PER_DOMAIN = max(0, args.domain_urls_limit)
+        config.DOMAIN_URLS_SAMPLING = args.domain_urls_sample
+        print(f"🔗 Domain URL'leri: Domain başına en fazla {config.DOMAIN_URLS_MAX_PER_DOMAIN or 'sınırsız'} "
+              f"({config.DOMAIN_URLS_SAMPLING})")
+    if args.export_domain_urls:
+        domain_url_store = DomainURLStore()
+    
+    # Checkpoint ayarları (sadece spider modlarında)
+    if args.checkpoint and args.resume and args.checkpoint != args.resume:
+        parser.error('--checkpoint ve --resume farklı dosyalar gösteriyor; devam ederken sadece --resume kullanın')
+    checkpoint_path = args.resume or args.checkpoint
+    if checkpoint_path:
+        if not (args.spider or args.enhanced_spider):
+            parser.error('--checkpoint/--resume sadece --spider veya --enhanced-spider ile kullanılabilir')
+        print(f"💾 Checkpoint: {checkpoint_path}" + (" (devam ediliyor)" if args.resume else ""))
+    
     # Proxy ayarları
     proxy_list = []
     use_proxy = False
@@ -123,6 +244,8 @@ def main():
         else:
             config.PROXY_ROTATION = True
             print("🌐 Proxy rotasyonu: Açık")
+        if args.proxy_check_url:
+            config.PROXY_VALIDATION_URL = args.proxy_check_url
         
         print(f"🌐 Toplam proxy sayısı: {len(proxy_list)}")
         for i, proxy in enumerate(proxy_list[:3], 1):  # İlk 3 proxy'yi göster
@@ -192,6 +315,14 @@ def main():
         excluded_extensions = DEFAULT_EXCLUDED_EXTENSIONS
         print(f"📄 Varsayılan hariç tutulan uzantılar kullanılıyor: {len(excluded_extensions)} adet")
     
+    # Eşzamanlı crawl ayarları
+    concurrency = None
+    if args.use_concurrent:
+        concurrency = max(1, args.concurrency)
+        print(f"⚡ Eşzamanlı crawl modu: {concurrency} thread")
+    if args.parse_workers > 0:
+        print(f"🧩 HTML parse: {args.parse_workers} process")
+    
     print(f"🚀 Domain Crawler başlatılıyor...")
     print(f"📋 İşlenecek URL'ler: {len(args.urls)}")
     for i, url in enumerate(args.urls, 1):
@@ -199,6 +330,19 @@ def main():
     
     start_time = time.time()
     
+    # Metrikler: kapalıyken ölçüm noktalarında sadece registry kontrolü yapılır
+    metrics_registry = None
+    if args.metrics or args.metrics_file:
+        metrics_path = _result_path(args.metrics_file, '.prom') if args.metrics_file else None
+        metrics_registry = metrics.enable(metrics_path, args.metrics_interval)
+        print(f"📈 Metrikler: Açık" + (f" ({metrics_path}, {args.metrics_interval:.0f} sn'de bir)" if metrics_path else ""))
+    
+    # Akışlı çıktı: checkpoint'ten devam ediliyorsa mevcut dosyanın sonuna eklenir
+    result_stream = None
+    if args.stream:
+        result_stream = open_result_stream(args.output, compress=args.gzip, append=bool(args.resume))
+        print(f"📝 Akışlı çıktı: {result_stream.path}")
+    
     try:
         if args.enhanced_spider:
             print(f"\n🕸️  GELİŞMİŞ SPIDER CRAWL MODU (Sayfa + Domain Zincirleme)")
@@ -213,7 +357,14 @@ def main():
                 use_proxy=use_proxy,
                 proxy_list=proxy_list,
                 blocked_domains=blocked_domains,
-                use_domain_blocking=use_domain_blocking
+                use_domain_blocking=use_domain_blocking,
+                concurrency=concurrency,
+                workers=args.spider_workers,
+                parse_workers=args.parse_workers,
+                checkpoint_path=checkpoint_path,
+                resume=bool(args.resume),
+                result_stream=result_stream,
+                domain_url_store=domain_url_store
             )
         elif args.spider:
             print(f"\n🕸️  SPIDER CRAWL MODU (Sadece Domain Zincirleme)")
@@ -227,7 +378,14 @@ def main():
                 use_proxy=use_proxy,
                 proxy_list=proxy_list,
                 blocked_domains=blocked_domains,
-                use_domain_blocking=use_domain_blocking
+                use_domain_blocking=use_domain_blocking,
+                concurrency=concurrency,
+                workers=args.spider_workers,
+                parse_workers=args.parse_workers,
+                checkpoint_path=checkpoint_path,
+                resume=bool(args.resume),
+                result_stream=result_stream,
+                domain_url_store=domain_url_store
             )
         else:
             print(f"\n🔍 NORMAL CRAWL MODU")
@@ -242,7 +400,8 @@ def main():
                 'use_proxy': use_proxy,
                 'proxy_list': proxy_list,
                 'blocked_domains': blocked_domains,
-                'use_domain_blocking': use_domain_blocking
+                'use_domain_blocking': use_domain_blocking,
+                'result_stream': result_stream
             }
             
             # Detector ayarları
@@ -254,11 +413,14 @@ def main():
                 'use_proxy': use_proxy,
                 'proxy_list': proxy_list,
                 'blocked_domains': blocked_domains,
-                'use_domain_blocking': use_domain_blocking
+                'use_domain_blocking': use_domain_blocking,
+                'result_stream': result_stream,
+                'domain_url_store': domain_url_store
             }
             
             crawl_results, domain_results, detector = crawl_and_detect_domains(
-                args.urls, crawler_settings, detector_settings
+                args.urls, crawler_settings, detector_settings, concurrency=concurrency,
+                parse_workers=args.parse_workers
             )
             
             # Sonuçları birleştir
@@ -275,7 +437,12 @@ def main():
         print(f"\n⏱️  Toplam çalışma süresi: {execution_time:.2f} saniye")
         
         # Sonuçları kaydet
-        output_file = save_results(results, args.output)
+        if result_stream is not None:
+            output_file = close_result_stream(result_stream, results)
+        else:
+            output_file = save_results(results, args.output)
+        if domain_url_store is not None:
+            export_domain_urls(domain_url_store, args.export_domain_urls)
         
         # Özet bilgileri göster
         print(f"\n📊 ÖZET BİLGİLER:")
@@ -293,6 +460,10 @@ def main():
         elif args.spider:
             print(f"   Spider derinliği: {results['spider_depth']}")
             print(f"   İşlenen domain sayısı: {results['processed_domains']}")
+        else:
+            seen_stats = results['crawl_stats']['seen_set']
+            print(f"   Görülen URL kümesi ({seen_stats['backend']}): {seen_stats['items']} URL, "
+                  f"{seen_stats['memory_bytes'] / 1024:.0f} KB bellek")
         
         # İlk 10 domain'i göster
         if results['valid_domains']:
@@ -320,6 +491,15 @@ def main():
     except Exception as e:
         print(f"\n❌ Hata oluştu: {e}")
         return 1
+    finally:
+        # Yarıda kesilen çalışmada o ana kadar bulunanlar dosyada kalır (özet kaydı olmadan)
+        if result_stream is not None:
+            result_stream.close()
+        if metrics_registry is not None:
+            metrics.print_summary(metrics_registry)
+            metrics.disable()
+            if metrics_registry.path:
+                print(f"📈 Metrikler kaydedildi: {metrics_registry.path}")
     
     return 0
 
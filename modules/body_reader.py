@@ -0,0 +1,154 @@
+"""
+Spider Domain Crawler - Akışlı (Streaming) Yanıt Okuyucu Modülü
+
+Copyright (c) 2025 Hasan Yasin Yaşar
+Licensed under PSH 1.1 (Pasha Software License)
+"""
+
+import codecs
+import re
+import threading
+import time
+from typing import Dict, Optional, Union
+from urllib.parse import urlparse
+
+import requests
+
+from . import metrics
+
+_CHARSET_RE = re.compile(r'charset\s*=\s*["\']?([\w.:-]+)', re.IGNORECASE)
+
+
+class BodyReader:
+    """
+    ``stream=True`` ile alınan yanıtların gövdesini kontrollü okur
+
+    Önce header'lar kontrol edilir: HTML olmayan veya ``Content-Length`` değeri
+    limiti aşan yanıtlar gövde okunmadan kapatılır. Gövde parçalar halinde
+    thread başına tekrar kullanılan bir buffer'a okunur ve limit aşılırsa okuma
+    kesilir. Header'da charset varsa içerik doğrudan buffer'dan decode edilir;
+    böylece parser charset tahmini yapmaz ve ek bir byte kopyası oluşmaz.
+    Thread-safe'dir, crawler ve detector arasında paylaşılabilir.
+    """
+
+    def __init__(self, max_body_size: int = None, chunk_size: int = None):
+        """
+        BodyReader başlatıcı
+
+        Args:
+            max_body_size: Okunacak maksimum gövde boyutu (byte)
+            chunk_size: Ağdan tek seferde okunacak parça boyutu (byte)
+        """
+        from .config import MAX_BODY_SIZE, STREAM_CHUNK_SIZE
+        self.max_body_size = MAX_BODY_SIZE if max_body_size is None else max_body_size
+        self.chunk_size = STREAM_CHUNK_SIZE if chunk_size is None else chunk_size
+
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self.stats = {
+            'pages_read': 0,
+            'bytes_read': 0,
+            'skipped_non_html': 0,
+            'skipped_too_large': 0,
+            'bytes_avoided': 0
+        }
+
+    @staticmethod
+    def charset_from_headers(content_type: str) -> Optional[str]:
+        """
+        Content-Type header'ındaki charset'i döndürür
+
+        Args:
+            content_type: Content-Type header değeri
+
+        Returns:
+            Python codec adı veya charset yoksa/tanınmıyorsa None
+        """
+        match = _CHARSET_RE.search(content_type)
+        if not match:
+            return None
+        try:
+            return codecs.lookup(match.group(1)).name
+        except LookupError:
+            return None
+
+    def _buffer(self) -> bytearray:
+        """Thread'e ait tekrar kullanılan okuma buffer'ı"""
+        buffer = getattr(self._local, 'buffer', None)
+        if buffer is None:
+            buffer = self._local.buffer = bytearray()
+        return buffer
+
+    def _count(self, key: str, value: int = 1) -> None:
+        with self._lock:
+            self.stats[key] += value
+
+    @staticmethod
+    def _content_length(response: requests.Response) -> int:
+        """Content-Length header'ı (yoksa veya geçersizse 0)"""
+        try:
+            return max(0, int(response.headers.get('content-length', 0)))
+        except ValueError:
+            return 0
+
+    def read(self, response: requests.Response) -> Optional[Union[str, bytes]]:
+        """
+        Yanıtın HTML gövdesini okur
+
+        Args:
+            response: ``stream=True`` ile alınmış yanıt
+
+        Returns:
+            Charset biliniyorsa str, bilinmiyorsa ham bytes; HTML değilse veya
+            boyut limitini aşıyorsa None (yanıt gövdesi okunmadan bırakılır)
+        """
+        content_type = response.headers.get('content-type', '').lower()
+        content_length = self._content_length(response)
+
+        # Content-Type kontrolü (gövde indirilmeden)
+        if 'text/html' not in content_type:
+            self._count('skipped_non_html')
+            self._count('bytes_avoided', content_length)
+            return None
+
+        if content_length > self.max_body_size:
+            self._count('skipped_too_large')
+            self._count('bytes_avoided', content_length)
+            return None
+
+        current = metrics.registry
+        if current is not None:
+            start = time.perf_counter()
+
+        buffer = self._buffer()
+        size = 0
+        for chunk in response.iter_content(self.chunk_size):
+            if size + len(chunk) > self.max_body_size:
+                self._count('skipped_too_large')
+                self._count('bytes_read', size + len(chunk))
+                return None
+            # Slice ataması buffer'ı gerektiğinde büyütür, yoksa yerinde yazar
+            buffer[size:size + len(chunk)] = chunk
+            size += len(chunk)
+
+        self._count('pages_read')
+        self._count('bytes_read', size)
+        if current is not None:
+            host = (urlparse(response.url).hostname or '').lower()
+            current.observe('body', time.perf_counter() - start, host)
+            current.inc('bytes', size, host=host)
+
+        view = memoryview(buffer)[:size]
+        try:
+            charset = self.charset_from_headers(content_type)
+            if charset is not None:
+                return str(view, charset, 'replace')
+            # Charset bilinmiyorsa tespiti parser'a bırak (<meta charset>)
+            return bytes(view)
+        finally:
+            view.release()
+
+    def summary(self) -> Dict[str, int]:
+        """İstatistiklerin bir kopyasını döndürür"""
+        with self._lock:
+            return dict(self.stats)
@@ -0,0 +1,345 @@
+"""
+Spider Domain Crawler - Crawl Checkpoint (Kaydet/Devam Et) Modülü
+
+Copyright (c) 2025 Hasan Yasin Yaşar
+Licensed under PSH 1.1 (Pasha Software License)
+"""
+
+import json
+import os
+import time
+from typing import Callable, Dict, Iterator, Optional
+
+from .spider_queue import SpiderWorkQueue
+
+CHECKPOINT_VERSION = 3
+
+
+def empty_state(mode: str) -> Dict:
+    """Boş spider durumunu döndürür"""
+    return {
+        'version': CHECKPOINT_VERSION,
+        'mode': mode,
+        'pending': {},              # url -> [derinlik, tür]; kuyrukta bekleyen veya yarım kalan işler
+        'queued_urls': set(),
+        'processed_domains': set(),
+        'admitted_per_level': {},   # (derinlik, tür) -> kabul edilen iş sayısı
+        'deepest_level': 0,
+        'domains': set(),
+        'pages_count': 0,           # sayfaların kendisi <path>.pages arşivindedir
+        'level_counts': {},         # derinlik -> [yeni domain, yeni sayfa]
+        'scheduler': {}
+    }
+
+
+def apply_event(state: Dict, event: list) -> None:
+    """
+    Journal kaydını duruma uygular
+
+    Her kayıt bir kez uygulanır: journal'ın ilk satırı ait olduğu snapshot'ın
+    numarasını taşır, snapshot'tan önceki bir journal hiç okunmaz.
+
+    Args:
+        state: ``empty_state`` biçiminde durum
+        event: ``['a', url, derinlik, tür]``, ``['d', url]`` veya
+            ``['f', derinlik, domain'ler, sayfalar]``
+    """
+    kind = event[0]
+    if kind == 'a':
+        _, url, depth, task_kind = event
+        if url in state['queued_urls']:
+            return
+        state['queued_urls'].add(url)
+        state['pending'][url] = [depth, task_kind]
+        if depth > 0:
+            key = (depth, task_kind)
+            state['admitted_per_level'][key] = state['admitted_per_level'].get(key, 0) + 1
+    elif kind == 'd':
+        url = event[1]
+        entry = state['pending'].pop(url, None)
+        state['processed_domains'].add(SpiderWorkQueue.domain_of(url))
+        if entry is not None:
+            state['deepest_level'] = max(state['deepest_level'], entry[0])
+    elif kind == 'f':
+        _, depth, domains, pages = event
+        new_domains = set(domains) - state['domains']
+        state['domains'].update(new_domains)
+        # Sayfalar spider'ın görülen kümesinden geçmiştir, kayıtta sadece yeniler bulunur
+        state['pages_count'] += len(pages)
+        counts = state['level_counts'].setdefault(depth, [0, 0])
+        counts[0] += len(new_domains)
+        counts[1] += len(pages)
+
+
+class CrawlCheckpoint:
+    """
+    Spider crawl durumunun diske kaydı
+
+    Durum üç dosyada tutulur:
+
+    - ``<path>``: tam durumun snapshot'ı (JSON); geçici dosyaya yazılıp
+      ``os.replace`` ile atomik olarak değiştirilir
+    - ``<path>.journal``: son snapshot'tan sonraki değişiklikler; ilk satır
+      snapshot numarası, sonraki her satır tek bir kayıttır (kuyruğa kabul, iş
+      tamamlandı, bulunan domain/sayfalar)
+    - ``<path>.pages``: bulunan sayfaların sadece sonuna eklenen arşivi; snapshot
+      sayfa listesini değil arşivin geçerli uzunluğunu tutar. Sayfa listesi ne
+      crawl sırasında ne de devam edilirken belleğe alınır; ``iter_pages`` ile
+      okunur
+
+    Her kayıt sadece değişikliği yazdığından maliyeti durumun boyutundan
+    bağımsızdır. Journal, son snapshot'taki girdi sayısı kadar büyüdüğünde yeni
+    snapshot alınır; böylece milyonlarca girdide de kayıt başına maliyet sabit kalır.
+    """
+
+    def __init__(self, path: str, interval: float = None, compact_min: int = None):
+        """
+        CrawlCheckpoint başlatıcı
+
+        Args:
+            path: Snapshot dosyasının yolu (journal ``<path>.journal`` olur)
+            interval: Journal'ın diske zorla yazılma aralığı (varsayılan: config.CHECKPOINT_INTERVAL)
+            compact_min: Snapshot alınmadan önce journal'da birikecek minimum kayıt
+                (varsayılan: config.CHECKPOINT_COMPACT_MIN)
+        """
+        from .config import CHECKPOINT_INTERVAL, CHECKPOINT_COMPACT_MIN
+        self.path = path
+        self.journal_path = path + '.journal'
+        self.pages_path = path + '.pages'
+        self.interval = CHECKPOINT_INTERVAL if interval is None else interval
+        self.compact_min = CHECKPOINT_COMPACT_MIN if compact_min is None else compact_min
+
+        self._source: Optional[Callable[[], Dict]] = None
+        self._journal = None
+        self._pages = None
+        # Arşivin son snapshot'ta geçerli sayılan uzunluğu (byte); sonrası journal'dan gelir
+        self._pages_offset = 0
+        self._pages_count = 0
+        # Son snapshot'ın numarası; journal sadece aynı numarayı taşıyorsa okunur
+        self._generation = 0
+        self._loaded = False
+        self._records = 0
+        self._snapshot_entries = 0
+        self._last_sync = time.monotonic()
+        self.stats = {
+            'records': 0,
+            'snapshots': 0
+        }
+
+    def exists(self) -> bool:
+        """Diskte devam ettirilebilecek bir checkpoint olup olmadığını döndürür"""
+        return os.path.exists(self.path)
+
+    def load(self) -> Optional[Dict]:
+        """
+        Snapshot'ı okur ve journal'daki kayıtları üzerine uygular
+
+        Sayfa arşivi okunmaz; durumda sadece sayfa sayısı bulunur, sayfalar
+        ``iter_pages`` ile okunur.
+
+        Returns:
+            ``empty_state`` biçiminde durum veya checkpoint yoksa None
+        """
+        if not self.exists():
+            return None
+
+        with open(self.path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if data.get('version') != CHECKPOINT_VERSION:
+            raise ValueError(f"Desteklenmeyen checkpoint sürümü: {data.get('version')}")
+        state = empty_state(data['mode'])
+        state.update({
+            'pending': {url: entry for url, entry in data['pending']},
+            'queued_urls': set(data['queued_urls']),
+            'processed_domains': set(data['processed_domains']),
+            'admitted_per_level': {(depth, kind): count for depth, kind, count in data['admitted_per_level']},
+            'deepest_level': data['deepest_level'],
+            'domains': set(data['domains']),
+            'pages_count': data['pages_count'],
+            'level_counts': {int(depth): counts for depth, counts in data['level_counts'].items()},
+            'scheduler': data.get('scheduler', {})
+        })
+        self._generation = data['generation']
+        self._pages_offset = data['pages_offset']
+        self._pages_count = data['pages_count']
+        self._loaded = True
+
+        for event in self._journal_events():
+            apply_event(state, event)
+        return state
+
+    def _journal_events(self) -> Iterator[list]:
+        """Son snapshot'a ait journal kayıtlarını sırayla döndürür"""
+        if not os.path.exists(self.journal_path):
+            return
+        with open(self.journal_path, 'r', encoding='utf-8') as f:
+            for index, line in enumerate(f):
+                try:
+                    event = json.loads(line)
+                except ValueError:
+                    # Çökme sırasında yarım yazılmış son satır
+                    break
+                if index == 0:
+                    # Yeni snapshot yazılıp journal sıfırlanamadan çökülmüşse eski
+                    # journal'ın kayıtları snapshot'ta zaten vardır
+                    if event != ['g', self._generation]:
+                        return
+                    continue
+                yield event
+
+    def iter_pages(self) -> Iterator[str]:
+        """
+        Checkpoint'teki bulunan sayfaları diskten okuyarak döndürür
+
+        Arşivin son snapshot'ta geçerli olan kısmı, ``start`` öncesinde ise
+        journal'daki sayfalar da okunur. Devam edilirken sayfalar buradan
+        spider'ın görülen URL kümesine aktarılır.
+        """
+        if self._pages_offset:
+            consumed = 0
+            with open(self.pages_path, 'rb') as f:
+                for line in f:
+                    consumed += len(line)
+                    # Snapshot'tan sonra eklenen satırlar journal'dan gelir
+                    if consumed > self._pages_offset:
+                        break
+                    yield json.loads(line)
+        if self._loaded and self._pages is None:
+            for event in self._journal_events():
+                if event[0] == 'f':
+                    yield from event[3]
+
+    def start(self, source: Callable[[], Dict]) -> None:
+        """
+        Kaydı başlatır: mevcut durumun snapshot'ını alır ve journal'ı açar
+
+        Args:
+            source: O anki tam durumu ``empty_state`` biçiminde döndüren fonksiyon
+        """
+        self._source = source
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        # Arşivin son snapshot'tan sonra yazılmış kısmı atılır (yeni crawl'da tamamı)
+        self._pages = open(self.pages_path, 'ab')
+        self._pages.truncate(self._pages_offset)
+        self._pages.seek(0, os.SEEK_END)
+        if self._loaded:
+            # Journal'daki sayfalar yeni snapshot'tan önce arşive taşınır
+            for event in self._journal_events():
+                if event[0] == 'f':
+                    self._write_pages(event[3])
+        self.snapshot()
+
+    def record(self, *event) -> None:
+        """
+        Journal'a tek bir değişiklik kaydı ekler
+
+        Args:
+            event: ``apply_event`` biçiminde kayıt
+        """
+        if self._journal is None:
+            return
+        self._journal.write(json.dumps(event, ensure_ascii=False, separators=(',', ':')) + '\n')
+        self._records += 1
+        self.stats['records'] += 1
+
+    def admitted(self, url: str, depth: int, kind: str) -> None:
+        """Kuyruğa kabul edilen işi kaydeder"""
+        self.record('a', url, depth, kind)
+
+    def finished(self, url: str) -> None:
+        """Tamamlanan (veya hata ile biten) işi kaydeder"""
+        self.record('d', url)
+
+    def found(self, depth: int, domains, pages=()) -> None:
+        """Bir işte bulunan yeni domain ve sayfaları kaydeder"""
+        if domains or pages:
+            self.record('f', depth, list(domains), list(pages))
+            self._write_pages(pages)
+
+    def _write_pages(self, pages) -> None:
+        """Sayfaları arşivin sonuna ekler (bir sonraki snapshot'a kadar journal'da da bulunurlar)"""
+        if self._pages is None:
+            return
+        for page in pages:
+            self._pages.write(json.dumps(page, ensure_ascii=False).encode('utf-8') + b'\n')
+            self._pages_count += 1
+
+    def maybe_sync(self) -> None:
+        """Gerekiyorsa journal'ı diske yazar veya yeni snapshot alır"""
+        if self._journal is None:
+            return
+        if self._records >= max(self.compact_min, self._snapshot_entries):
+            self.snapshot()
+        elif time.monotonic() - self._last_sync >= self.interval:
+            self._sync()
+
+    def _sync(self) -> None:
+        """Journal'ı işletim sistemi tamponundan diske aktarır"""
+        self._journal.flush()
+        os.fsync(self._journal.fileno())
+        self._last_sync = time.monotonic()
+
+    def snapshot(self) -> None:
+        """Tam durumu atomik olarak yazar ve journal'ı sıfırlar"""
+        if self._source is None:
+            return
+        state = self._source()
+        # Snapshot'ın işaret ettiği arşiv kısmı snapshot'tan önce diske yazılmış olmalı
+        if self._pages is not None:
+            self._pages.flush()
+            os.fsync(self._pages.fileno())
+            self._pages_offset = self._pages.tell()
+        self._generation += 1
+        data = {
+            'version': CHECKPOINT_VERSION,
+            'mode': state['mode'],
+            'saved_at': time.time(),
+            'pending': [[url, entry] for url, entry in state['pending'].items()],
+            'queued_urls': list(state['queued_urls']),
+            'processed_domains': list(state['processed_domains']),
+            'admitted_per_level': [[depth, kind, count] for (depth, kind), count in state['admitted_per_level'].items()],
+            'deepest_level': state['deepest_level'],
+            'domains': list(state['domains']),
+            'generation': self._generation,
+            'pages_offset': self._pages_offset,
+            'pages_count': self._pages_count,
+            'level_counts': state['level_counts'],
+            'scheduler': state['scheduler']
+        }
+
+        # json.dump dosyaya saf Python kodlayıcısıyla yazar; her bölüm ayrı ayrı
+        # json.dumps (C kodlayıcı) ile yazılarak hem hız hem bellek dengede tutulur
+        temp_path = self.path + '.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            f.write('{')
+            for index, (key, value) in enumerate(data.items()):
+                if index:
+                    f.write(',')
+                f.write(json.dumps(key) + ':')
+                f.write(json.dumps(value, ensure_ascii=False, separators=(',', ':')))
+            f.write('}')
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, self.path)
+
+        # Snapshot yerindeyken journal güvenle sıfırlanabilir
+        if self._journal is not None:
+            self._journal.close()
+        self._journal = open(self.journal_path, 'w', encoding='utf-8')
+        self._journal.write(json.dumps(['g', self._generation]) + '\n')
+        self._records = 0
+        self._snapshot_entries = len(data['queued_urls']) + len(data['domains']) + self._pages_count
+        self._last_sync = time.monotonic()
+        self.stats['snapshots'] += 1
+
+    def close(self) -> None:
+        """Son snapshot'ı alır, journal'ı ve sayfa arşivini kapatır"""
+        if self._journal is None:
+            return
+        self.snapshot()
+        self._journal.close()
+        self._journal = None
+        self._pages.close()
+        self._pages = None
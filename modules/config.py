@@ -10,6 +10,58 @@ DEFAULT_DELAY = 1.0  # İstekler arası bekleme süresi (saniye)
 DEFAULT_MAX_DEPTH = 2  # Maksimum crawl derinliği
 DEFAULT_MAX_URLS = 100  # Maksimum toplanacak URL sayısı
 DEFAULT_TIMEOUT = 10  # HTTP request timeout (saniye)
+DEFAULT_CONCURRENCY = 10  # Eşzamanlı modda istekleri yürüten thread sayısı
+SPIDER_WORKERS = 4  # Spider modunda aynı anda işlenecek domain sayısı
+DETECTOR_WORKERS = 4  # Domain tespitinde aynı anda işlenecek URL sayısı (aynı host'a istekler yine zamanlayıcıyla sıralanır)
+PAGE_CACHE_SIZE = 10000  # Crawler ve detector arasında paylaşılan sayfa önbelleği (sayfa sayısı)
+PARSE_WORKERS = 0  # HTML parse için process sayısı (0: fetch thread'inde parse et)
+
+# HTTP bağlantı havuzu ayarları
+HTTP_POOL_CONNECTIONS = 100  # Aynı anda açık tutulacak maksimum host havuzu sayısı
+HTTP_POOL_MAXSIZE = 10  # Host başına maksimum keep-alive bağlantı sayısı
+HTTP_POOL_IDLE_TIMEOUT = 60.0  # Bu süre (saniye) kullanılmayan host havuzu kapatılır
+
+# Yanıt gövdesi okuma ayarları
+MAX_BODY_SIZE = 5 * 1024 * 1024  # Okunacak maksimum HTML boyutu (byte), aşan yanıtlar atlanır
+STREAM_CHUNK_SIZE = 64 * 1024  # Gövde okunurken kullanılan parça boyutu (byte)
+
+# DNS doğrulama ayarları
+DNS_MAX_IN_FLIGHT = 50  # Aynı anda çalışacak maksimum DNS sorgusu
+DNS_TIMEOUT = 5.0  # Sorgu başına zaman aşımı (saniye), aşılırsa domain geçersiz sayılır
+USE_DNS_CACHE = True  # DNS sonuçlarını çalıştırmalar arasında diskte sakla
+DNS_CACHE_FILE = 'data/dns_cache.db'  # Kalıcı DNS önbelleği (SQLite)
+DNS_CACHE_POSITIVE_TTL = 86400  # Çözümlenen domain'lerin saklanma süresi (saniye)
+DNS_CACHE_NEGATIVE_TTL = 3600  # Çözümlenemeyen (NXDOMAIN) domain'lerin saklanma süresi (saniye)
+DNS_CACHE_MEMORY_SIZE = 100000  # Bellekte tutulan maksimum DNS kaydı (LRU; fazlası diskten tekrar okunur)
+
+# Kalıcı HTTP yanıt önbelleği (tekrar crawl'larda koşullu istekler)
+USE_HTTP_CACHE = False  # HTML yanıtları çalıştırmalar arasında diskte sakla
+HTTP_CACHE_FILE = 'data/http_cache.db'  # HTTP önbelleği (SQLite)
+HTTP_CACHE_FRESH_TTL = 3600  # Bu süre içinde tekrar istenen sayfa ağa gidilmeden kullanılır (saniye)
+HTTP_CACHE_MAX_AGE = 30 * 86400  # Bu süredir doğrulanmamış kayıtlar önbellekten silinir (saniye)
+
+# Görülen URL kümesi ayarları (visited/found URL tekrar kontrolü)
+SEEN_SET_BACKEND = 'memory'  # 'memory' (tam, bellekte), 'bloom' (Bloom filtresi) veya 'disk' (tam, SQLite)
+SEEN_SET_ERROR_RATE = 0.001  # Bloom filtresinin hedef yanlış pozitif oranı
+SEEN_SET_INITIAL_CAPACITY = 100000  # Bloom filtresinin ilk kapasitesi, dolunca iki katı büyüklükte filtre eklenir
+SEEN_SET_DIR = 'data/seen'  # Disk backend'inin geçici dosyalarının klasörü
+
+# URL kanonikleştirme ayarları (tekrar kontrolü kanonik URL üzerinden yapılır)
+URL_RECORD_CACHE_SIZE = 50000  # Parse edilmiş URL kayıtlarının LRU önbellek boyutu (tekrar eden menü/footer linkleri)
+URL_TRACKING_PARAMS = ['gclid', 'dclid', 'fbclid', 'msclkid', 'yclid', 'igshid', 'mc_cid', 'mc_eid', '_ga', '_gl']  # Kanonik URL'den çıkarılan takip parametreleri
+URL_TRACKING_PREFIXES = ['utm_']  # Bu önekle başlayan query parametreleri de çıkarılır
+
+# Domain'e referans veren URL'lerin (DomainURLStore) saklanma ayarları
+DOMAIN_URLS_MAX_PER_DOMAIN = 0  # Domain başına saklanacak maksimum URL, 0 ise sınırsız
+DOMAIN_URLS_SAMPLING = 'first'  # Sınır dolunca: 'first' (ilk görülenler) veya 'reservoir' (rastgele örnek)
+
+# Akışlı (NDJSON) sonuç çıktısı ayarları
+RESULT_STREAM_FLUSH_INTERVAL = 5.0  # Biriken kayıtların en geç kaç saniyede bir dosyaya yazılacağı
+RESULT_STREAM_BUFFER_RECORDS = 1000  # Bu kadar kayıt biriktiğinde beklemeden yazılır
+
+# Spider checkpoint ayarları
+CHECKPOINT_INTERVAL = 30.0  # Checkpoint journal'ının diske zorla yazılma aralığı (saniye)
+CHECKPOINT_COMPACT_MIN = 10000  # Yeni snapshot alınmadan önce journal'da birikecek minimum kayıt
 
 # User-Agent Strings
 TARASSUT_USER_AGENT = 'Tarassut 1.0'
@@ -101,6 +153,10 @@ PROXY_LIST = [
 # Proxy doğrulama ayarları
 PROXY_VALIDATION_URL = 'http://httpbin.org/ip'  # Proxy test URL'i
 PROXY_VALIDATION_TIMEOUT = 5  # Proxy doğrulama timeout
+PROXY_VALIDATION_WORKERS = 32  # Başlangıçta aynı anda doğrulanan proxy sayısı
+PROXY_FAILURE_THRESHOLD = 3  # Art arda bu kadar hata alan proxy devre dışı bırakılır
+PROXY_COOLDOWN = 60  # Devre dışı proxy'nin tekrar doğrulanmasına kadar bekleme (saniye)
+PROXY_MAX_COOLDOWN = 600  # Doğrulaması tekrar başarısız olan proxy'lerde cooldown iki katına çıkar, üst sınır (saniye)
 
 # Domain engelleme ayarları
 USE_DOMAIN_BLOCKING = True  # Varsayılan olarak açık
@@ -196,14 +252,29 @@ ALLOWED_CONTENT_TYPES = [
 # Robots.txt ayarları
 RESPECT_ROBOTS_TXT = True
 ROBOTS_TXT_CACHE_TIME = 3600  # 1 saat
+ROBOTS_TXT_ERROR_CACHE_TIME = 300  # Alınamayan (5xx/ağ hatası) robots.txt'nin tekrar denenme süresi (saniye)
+ROBOTS_TXT_CACHE_FILE = 'data/robots_cache.db'  # Kalıcı robots.txt önbelleği (SQLite)
+ROBOTS_TXT_MAX_SIZE = 500 * 1024  # Okunacak maksimum robots.txt boyutu (byte)
+
+# Metrik ayarları (--metrics / --metrics-file)
+METRICS_DUMP_INTERVAL = 30  # Anlık görüntünün dosyaya yazılma aralığı (saniye)
 
 # Rate limiting ayarları
 MIN_DELAY = 0.1  # Minimum bekleme süresi
 MAX_DELAY = 10.0  # Maksimum bekleme süresi
 
+# Uyarlamalı (AIMD) host hızı ayarları (--adaptive-delay)
+ADAPTIVE_DELAY = False  # Host bekleme süresini yanıtlara göre ayarla (başlangıç: crawler/detector delay)
+ADAPTIVE_RATE_INCREASE = 0.05  # Sağlıklı her yanıtta hızın artışı (istek/sn)
+ADAPTIVE_BACKOFF = 0.5  # 429/503, zaman aşımı veya TTFB artışında hızın çarpanı
+ADAPTIVE_LATENCY_FACTOR = 2.0  # TTFB (EWMA) host'un en iyi değerinin bu katını aşarsa yavaşla
+ADAPTIVE_COOLDOWN = 5  # Yavaşlamadan sonra bu kadar yanıt boyunca tekrar ayarlama yapılmaz
+
 # Retry ayarları
-MAX_RETRIES = 3
-RETRY_DELAY = 2.0
+MAX_RETRIES = 3  # URL başına ilk denemeden sonraki maksimum tekrar (zaman aşımı, bağlantı hatası, 429, 5xx)
+RETRY_DELAY = 2.0  # İlk tekrar öncesi bekleme; her tekrarda iki katına çıkar (jitter ile)
+RETRY_MAX_DELAY = 60.0  # Tekrar öncesi bekleme üst sınırı (saniye)
+RETRY_AFTER_MAX = 120.0  # Retry-After bundan uzunsa URL tekrar denenmez (saniye)
 
 # Logging ayarları
 LOG_LEVEL = 'INFO'
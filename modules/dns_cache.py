@@ -0,0 +1,239 @@
+"""
+Spider Domain Crawler - Kalıcı DNS Sonuç Önbelleği Modülü
+
+Copyright (c) 2025 Hasan Yasin Yaşar
+Licensed under PSH 1.1 (Pasha Software License)
+"""
+
+import os
+import socket
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Iterable, Optional
+
+try:
+    from urllib3.exceptions import NameResolutionError
+except ImportError:  # urllib3 < 2.0
+    NameResolutionError = None
+
+# SQLite'ın tek sorguda kabul ettiği parametre sayısının altında kalan grup boyutu
+_BULK_CHUNK = 500
+
+
+def is_name_resolution_error(exc: BaseException) -> bool:
+    """requests/urllib3 hatasının DNS çözümleme hatası olup olmadığını döndürür"""
+    reason = exc.args[0] if exc.args else None
+    reason = getattr(reason, 'reason', reason)
+    if NameResolutionError is not None and isinstance(reason, NameResolutionError):
+        return True
+    return isinstance(reason, socket.gaierror)
+
+
+def is_nxdomain(exc: BaseException) -> bool:
+    """
+    Hatanın kesin "domain yok" (EAI_NONAME) cevabı olup olmadığını döndürür
+
+    Geçici hatalar (EAI_AGAIN, SERVFAIL, zaman aşımı) için False döner;
+    bunlar negatif olarak önbelleğe yazılmamalıdır.
+
+    Args:
+        exc: ``socket.gaierror`` veya onu saran requests/urllib3 hatası
+    """
+    if not isinstance(exc, socket.gaierror):
+        reason = exc.args[0] if exc.args else None
+        reason = getattr(reason, 'reason', reason)
+        if NameResolutionError is not None and isinstance(reason, NameResolutionError):
+            # urllib3 asıl socket.gaierror'ı zincirler (raise ... from e)
+            reason = reason.__cause__ or getattr(reason, '_reason', None)
+        exc = reason
+    return isinstance(exc, socket.gaierror) and exc.errno == socket.EAI_NONAME
+
+
+class DNSCache:
+    """
+    SQLite tabanlı kalıcı DNS önbelleği
+
+    Hem çözümlenen (pozitif) hem çözümlenemeyen (negatif, NXDOMAIN) sonuçlar
+    ayrı TTL'lerle saklanır. Okumalar bellek içi kopyadan yapılır; bu kopya
+    boyutu sınırlı bir LRU'dur, çıkarılan kayıtlar gerektiğinde diskten tekrar
+    okunur. Yazmalar biriktirilip toplu olarak diske aktarılır. Thread-safe'dir; spider,
+    detector ve indirme katmanı aynı örneği paylaşabilir.
+    """
+
+    def __init__(self, path: str = None, positive_ttl: float = None, negative_ttl: float = None,
+                 flush_every: int = 100, max_memory_entries: int = None):
+        """
+        DNSCache başlatıcı
+
+        Args:
+            path: SQLite dosya yolu (varsayılan: config.DNS_CACHE_FILE)
+            positive_ttl: Çözümlenen domain'lerin saklanma süresi (saniye)
+            negative_ttl: Çözümlenemeyen domain'lerin saklanma süresi (saniye)
+            flush_every: Bu kadar yeni sonuç biriktiğinde diske yazılır
+            max_memory_entries: Bellekte tutulacak maksimum kayıt (varsayılan: config.DNS_CACHE_MEMORY_SIZE)
+        """
+        from .config import DNS_CACHE_FILE, DNS_CACHE_POSITIVE_TTL, DNS_CACHE_NEGATIVE_TTL, DNS_CACHE_MEMORY_SIZE
+        self.path = DNS_CACHE_FILE if path is None else path
+        self.positive_ttl = DNS_CACHE_POSITIVE_TTL if positive_ttl is None else positive_ttl
+        self.negative_ttl = DNS_CACHE_NEGATIVE_TTL if negative_ttl is None else negative_ttl
+        self.flush_every = flush_every
+        self.max_memory_entries = DNS_CACHE_MEMORY_SIZE if max_memory_entries is None else max_memory_entries
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS dns_cache ('
+            'domain TEXT PRIMARY KEY, resolved INTEGER NOT NULL, expires REAL NOT NULL)'
+        )
+        self._conn.commit()
+
+        # domain -> (resolved, expires); diskten okunan ve yeni yazılan kayıtlar (LRU)
+        self._memory: 'OrderedDict[str, tuple]' = OrderedDict()
+        self._pending: Dict[str, tuple] = {}
+        self.stats = {
+            'hits': 0,
+            'misses': 0,
+            'stores': 0
+        }
+
+    @property
+    def hit_ratio(self) -> float:
+        """Önbellekten cevaplanan sorguların oranı"""
+        total = self.stats['hits'] + self.stats['misses']
+        return self.stats['hits'] / total if total else 0.0
+
+    def _load(self, domains) -> None:
+        """Bellekte olmayan domain'leri diskten toplu okur (kilit altında çağrılmalı)"""
+        if self._conn is None:
+            return
+        missing = [domain for domain in domains if domain not in self._memory]
+        for start in range(0, len(missing), _BULK_CHUNK):
+            chunk = missing[start:start + _BULK_CHUNK]
+            rows = self._conn.execute(
+                'SELECT domain, resolved, expires FROM dns_cache WHERE domain IN (%s)' % ','.join('?' * len(chunk)),
+                chunk
+            ).fetchall()
+            entries = {domain: (bool(resolved), expires) for domain, resolved, expires in rows}
+            # Diskte olmayanlar süresi dolmuş kayıt olarak işaretlenir (LRU'dan çıkana kadar tekrar sorgulanmaz)
+            for domain in chunk:
+                self._remember(domain, entries.get(domain, (False, 0.0)))
+
+    def _remember(self, domain: str, entry: tuple) -> None:
+        """Kaydı bellekteki LRU'ya yazar, sınır aşılırsa en eskileri çıkarır (kilit altında çağrılmalı)"""
+        self._memory[domain] = entry
+        self._memory.move_to_end(domain)
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+
+    def get_many(self, domains: Iterable[str]) -> Dict[str, bool]:
+        """
+        Birden fazla domain'i tek seferde sorgular
+
+        Args:
+            domains: Sorgulanacak domain'ler
+
+        Returns:
+            Süresi dolmamış kaydı olan domain'ler için domain -> çözümlendi mi
+            (kaydı olmayanlar sonuçta yer almaz)
+        """
+        domains = list(dict.fromkeys(domains))
+        now = time.time()
+        found = {}
+        with self._lock:
+            self._load(domains)
+            for domain in domains:
+                entry = self._memory.get(domain)
+                if entry is not None:
+                    self._memory.move_to_end(domain)
+                if entry is not None and entry[1] > now:
+                    found[domain] = entry[0]
+                    self.stats['hits'] += 1
+                else:
+                    self.stats['misses'] += 1
+        return found
+
+    def peek(self, domain: str) -> Optional[bool]:
+        """
+        Domain'in kaydını istatistikleri değiştirmeden döndürür
+
+        İndirme katmanının her istekte yaptığı kontrol içindir; disk sadece
+        domain bellekte yoksa okunur. Bellekteki kayıtlar kilitsiz okunur, bu
+        yüzden LRU sırası burada güncellenmez.
+
+        Returns:
+            True/False veya kayıt yoksa (ya da süresi dolduysa) None
+        """
+        entry = self._memory.get(domain)
+        if entry is None:
+            with self._lock:
+                self._load([domain])
+                entry = self._memory.get(domain)
+        if entry is None or entry[1] <= time.time():
+            return None
+        return entry[0]
+
+    def get(self, domain: str) -> Optional[bool]:
+        """
+        Tek bir domain'i sorgular
+
+        Returns:
+            True/False veya kayıt yoksa (ya da süresi dolduysa) None
+        """
+        return self.get_many([domain]).get(domain)
+
+    def put(self, domain: str, resolved: bool) -> None:
+        """
+        DNS sonucunu kaydeder
+
+        Args:
+            domain: Domain
+            resolved: Domain çözümlendiyse True (NXDOMAIN ise False)
+        """
+        expires = time.time() + (self.positive_ttl if resolved else self.negative_ttl)
+        with self._lock:
+            self._pending[domain] = (bool(resolved), expires)
+            self._remember(domain, self._pending[domain])
+            self.stats['stores'] += 1
+            if len(self._pending) >= self.flush_every:
+                self._flush()
+
+    def _flush(self) -> None:
+        """Biriken kayıtları diske yazar (kilit altında çağrılmalı)"""
+        if not self._pending or self._conn is None:
+            return
+        self._conn.executemany(
+            'INSERT OR REPLACE INTO dns_cache (domain, resolved, expires) VALUES (?, ?, ?)',
+            [(domain, int(resolved), expires) for domain, (resolved, expires) in self._pending.items()]
+        )
+        self._conn.commit()
+        self._pending.clear()
+
+    def flush(self) -> None:
+        """Biriken kayıtları diske yazar"""
+        with self._lock:
+            self._flush()
+
+    def purge_expired(self) -> int:
+        """Süresi dolmuş kayıtları diskten siler, silinen kayıt sayısını döndürür"""
+        with self._lock:
+            if self._conn is None:
+                return 0
+            self._flush()
+            cursor = self._conn.execute('DELETE FROM dns_cache WHERE expires <= ?', (time.time(),))
+            self._conn.commit()
+            return cursor.rowcount
+
+    def close(self) -> None:
+        """Biriken kayıtları yazar ve veritabanını kapatır"""
+        with self._lock:
+            if self._conn is None:
+                return
+            self._flush()
+            self._conn.close()
+            self._conn = None
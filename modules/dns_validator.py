@@ -0,0 +1,196 @@
+"""
+Spider Domain Crawler - Eşzamanlı DNS Doğrulama Modülü
+
+Copyright (c) 2025 Hasan Yasin Yaşar
+Licensed under PSH 1.1 (Pasha Software License)
+"""
+
+import socket
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait, FIRST_COMPLETED
+from typing import Callable, Dict, Iterable, Optional
+
+from .dns_cache import DNSCache, is_nxdomain
+
+
+def resolve_domain(domain: str) -> bool:
+    """
+    Domain'in DNS'te çözümlenip çözümlenmediğini döndürür
+
+    Raises:
+        socket.gaierror: Geçici DNS hatası (EAI_AGAIN, SERVFAIL); domain yok (NXDOMAIN) ise False döner
+    """
+    try:
+        socket.gethostbyname(domain)
+        return True
+    except UnicodeError:
+        return False
+    except socket.gaierror as e:
+        if is_nxdomain(e):
+            return False
+        raise
+
+
+class DNSValidator:
+    """
+    Domain'ler bulundukça arka planda DNS doğrulaması yapan zamanlayıcı
+
+    Aynı anda en fazla ``max_in_flight`` sorgu çalışır; her domain için tek
+    sorgu yapılır ve sonuç saklanır. ``timeout`` süresinde tamamlanmayan veya
+    hata yükselten sorgu bu çalıştırmada geçersiz sayılır ama kalıcı önbelleğe
+    yazılmaz; önbelleğe sadece kesin sonuçlar (çözümlendi / NXDOMAIN) girer. Daha önce başarıyla indirilmiş host'lar ``mark_resolved``
+    ile sorgu yapılmadan geçerli kabul edilir. ``cache`` verilirse önce kalıcı
+    önbelleğe bakılır. Thread-safe'dir, spider adımları arasında paylaşılabilir.
+    """
+
+    def __init__(self, max_in_flight: int = None, timeout: float = None, cache: DNSCache = None):
+        """
+        DNSValidator başlatıcı
+
+        Args:
+            max_in_flight: Aynı anda çalışacak maksimum DNS sorgusu
+            timeout: Sorgu başına zaman aşımı (saniye)
+            cache: Kalıcı DNS önbelleği; sorgudan önce bakılır, sonuçlar buraya yazılır
+        """
+        from .config import DNS_MAX_IN_FLIGHT, DNS_TIMEOUT
+        self.max_in_flight = max(1, DNS_MAX_IN_FLIGHT if max_in_flight is None else max_in_flight)
+        self.timeout = DNS_TIMEOUT if timeout is None else timeout
+        self.cache = cache
+
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._futures: Dict[str, Future] = {}
+        self._started: Dict[str, float] = {}
+        self._results: Dict[str, bool] = {}
+        self._lock = threading.Lock()
+        self.stats = {
+            'lookups': 0,
+            'known': 0,
+            'cached': 0,
+            'timeouts': 0
+        }
+
+    def mark_resolved(self, domain: str) -> None:
+        """Başarıyla bağlanılmış bir host'u sorgu yapmadan geçerli kabul eder"""
+        with self._lock:
+            if domain in self._results or domain in self._futures:
+                return
+            self._results[domain] = True
+            self.stats['known'] += 1
+        if self.cache is not None:
+            self.cache.put(domain, True)
+
+    def prefetch(self, domains: Iterable[str]) -> None:
+        """
+        Domain'leri kalıcı önbellekten toplu olarak yükler
+
+        Önbellekte süresi dolmamış kaydı olan domain'ler için sorgu yapılmaz.
+
+        Args:
+            domains: Yakında doğrulanacak domain'ler
+        """
+        if self.cache is None:
+            return
+        with self._lock:
+            unknown = [domain for domain in domains if domain not in self._results and domain not in self._futures]
+        if not unknown:
+            return
+        cached = self.cache.get_many(unknown)
+        with self._lock:
+            for domain, resolved in cached.items():
+                if domain not in self._results and domain not in self._futures:
+                    self._results[domain] = resolved
+                    self.stats['cached'] += 1
+
+    def submit(self, domain: str, resolve: Callable[[str], bool] = resolve_domain) -> None:
+        """
+        Domain için arka planda DNS sorgusu başlatır (daha önce başlatılmadıysa)
+
+        Args:
+            domain: Doğrulanacak domain
+            resolve: Domain çözümlenirse True, yoksa (NXDOMAIN) False döndüren fonksiyon;
+                geçici hatalarda hata yükseltmelidir
+        """
+        with self._lock:
+            if domain in self._results or domain in self._futures:
+                return
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_in_flight)
+            self._futures[domain] = self._executor.submit(self._lookup, domain, resolve)
+            self.stats['lookups'] += 1
+
+    def _lookup(self, domain: str, resolve: Callable[[str], bool]) -> None:
+        """Worker thread'inde tek bir sorgu çalıştırır"""
+        with self._lock:
+            self._started[domain] = time.monotonic()
+        try:
+            resolved = bool(resolve(domain))
+            definite = True
+        except Exception:
+            # Geçici hata (SERVFAIL, EAI_AGAIN): domain sadece bu çalıştırmada geçersiz sayılır
+            resolved = False
+            definite = False
+        with self._lock:
+            # Zaman aşımına uğramış sorgunun geç gelen sonucu dikkate alınmaz
+            timed_out = domain in self._results
+            self._results.setdefault(domain, resolved)
+        if self.cache is not None and definite and not timed_out:
+            self.cache.put(domain, resolved)
+
+    def results(self, domains: Iterable[str],
+                on_result: Callable[[str, bool], None] = None) -> Dict[str, bool]:
+        """
+        Verilen domain'lerin sorgularının bitmesini bekler
+
+        Args:
+            domains: Sonucu istenen domain'ler (önceden ``submit`` veya
+                ``mark_resolved`` ile bildirilmiş olmalı)
+            on_result: Her domain'in sonucu belli olduğunda çağrılır
+
+        Returns:
+            domain -> çözümlendi mi
+        """
+        domains = list(domains)
+        reported = set()
+
+        while True:
+            now = time.monotonic()
+            waiting = []
+            deadlines = []
+            finished = []
+
+            with self._lock:
+                for domain in domains:
+                    if domain not in self._results:
+                        started = self._started.get(domain)
+                        if started is not None and now - started >= self.timeout:
+                            self._results[domain] = False
+                            self.stats['timeouts'] += 1
+                        elif domain in self._futures:
+                            waiting.append(self._futures[domain])
+                            if started is not None:
+                                deadlines.append(started + self.timeout - now)
+
+                    if domain in self._results and domain not in reported:
+                        reported.add(domain)
+                        finished.append((domain, self._results[domain]))
+
+            if on_result is not None:
+                for domain, resolved in finished:
+                    on_result(domain, resolved)
+
+            if not waiting:
+                break
+
+            # İlk biten sorguya veya en yakın zaman aşımına kadar bekle
+            wait(waiting, timeout=min(deadlines) if deadlines else self.timeout, return_when=FIRST_COMPLETED)
+
+        with self._lock:
+            return {domain: self._results.get(domain, False) for domain in domains}
+
+    def close(self) -> None:
+        """Worker thread'lerini kapatır (devam eden sorgular beklenmez)"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
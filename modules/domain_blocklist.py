@@ -0,0 +1,145 @@
+"""
+Spider Domain Crawler - Derlenmiş Domain Engelleme Listesi Modülü
+
+Copyright (c) 2025 Hasan Yasin Yaşar
+Licensed under PSH 1.1 (Pasha Software License)
+"""
+
+from urllib.parse import urlsplit
+from typing import Dict, Iterable, List, Set
+
+BLOCKING_MODES = ('exact', 'subdomain', 'contains')
+
+
+class DomainBlocklist:
+    """
+    Bir kez derlenen, URLCrawler ve DomainDetector tarafından paylaşılan engelleme listesi
+
+    Engelleme moduna göre liste tek seferde uygun yapıya dönüştürülür:
+
+    - ``exact``: hash set, tek arama
+    - ``subdomain``: label'ları ters çevrilmiş trie (com -> google -> maps);
+      arama host'un label sayısı kadar adım sürer
+    - ``contains``: uzunluğa göre gruplanmış hash set; host içindeki her
+      pencere sadece listede bulunan uzunluklar için kontrol edilir
+
+    Host ve liste girdilerindeki ``www.`` öneki karşılaştırmadan önce kaldırılır.
+    """
+
+    def __init__(self, domains: Iterable[str], mode: str = None):
+        """
+        DomainBlocklist başlatıcı
+
+        Args:
+            domains: Engellenecek domain'ler
+            mode: Engelleme modu ('exact', 'subdomain', 'contains');
+                varsayılan config.DOMAIN_BLOCKING_MODE
+        """
+        if mode is None:
+            from .config import DOMAIN_BLOCKING_MODE
+            mode = DOMAIN_BLOCKING_MODE
+        if mode not in BLOCKING_MODES:
+            raise ValueError(f"Geçersiz domain engelleme modu: {mode} (seçenekler: {', '.join(BLOCKING_MODES)})")
+
+        self.mode = mode
+        self.domains: Set[str] = set()
+        for domain in domains:
+            domain = self.normalize_domain(domain)
+            if domain:
+                self.domains.add(domain)
+
+        self._trie: Dict = {}
+        self._lengths: List[int] = []
+        if mode == 'subdomain':
+            for domain in self.domains:
+                self._insert(domain)
+        elif mode == 'contains':
+            self._lengths = sorted({len(domain) for domain in self.domains})
+
+    def __len__(self) -> int:
+        return len(self.domains)
+
+    def __bool__(self) -> bool:
+        return bool(self.domains)
+
+    @staticmethod
+    def normalize_domain(domain: str) -> str:
+        """Domain'i karşılaştırma için normalize eder (küçük harf, www. öneki yok)"""
+        domain = domain.strip().lower().rstrip('.')
+        if domain.startswith('www.'):
+            domain = domain[4:]
+        return domain
+
+    @staticmethod
+    def host_of(url: str) -> str:
+        """URL'den normalize edilmiş host'u çıkarır (port ve kullanıcı bilgisi olmadan)"""
+        host = urlsplit(url).hostname or ''
+        host = host.rstrip('.')
+        if host.startswith('www.'):
+            host = host[4:]
+        return host
+
+    def _insert(self, domain: str) -> None:
+        """Domain'i ters label trie'sine ekler"""
+        node = self._trie
+        labels = domain.split('.')
+        for index in range(len(labels) - 1, 0, -1):
+            child = node.get(labels[index])
+            if child is True:
+                # Daha kısa bir girdi bu alt ağacı zaten kapsıyor
+                return
+            if child is None:
+                child = node[labels[index]] = {}
+            node = child
+        # Yaprak: bu domain ve tüm alt domain'leri engelli (alt ağaç gereksiz)
+        node[labels[0]] = True
+
+    def is_host_blocked(self, host: str) -> bool:
+        """
+        Normalize edilmiş host'un engellenip engellenmediğini kontrol eder
+
+        Args:
+            host: ``host_of`` ile elde edilmiş host
+
+        Returns:
+            Engelliyse True
+        """
+        if not host:
+            return False
+
+        if self.mode == 'exact':
+            return host in self.domains
+
+        if self.mode == 'subdomain':
+            node = self._trie
+            labels = host.split('.')
+            for index in range(len(labels) - 1, -1, -1):
+                node = node.get(labels[index])
+                if node is None:
+                    return False
+                if node is True:
+                    return True
+            return False
+
+        # contains: sadece listede var olan uzunluklardaki pencereler aranır
+        domains = self.domains
+        host_length = len(host)
+        for length in self._lengths:
+            if length > host_length:
+                break
+            for start in range(host_length - length + 1):
+                if host[start:start + length] in domains:
+                    return True
+        return False
+
+    def is_blocked(self, url: str) -> bool:
+        """
+        URL'nin domain'inin engellenip engellenmediğini kontrol eder
+
+        Args:
+            url: Kontrol edilecek URL
+
+        Returns:
+            Engelliyse True
+        """
+        return self.is_host_blocked(self.host_of(url))
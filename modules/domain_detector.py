@@ -12,21 +12,43 @@ Licensed under PSH 1.1 (Pasha Software License)
 
 import requests
 from bs4 import BeautifulSoup
-from urllib.parse import urlparse, urljoin
+from urllib.parse import urlparse
 import re
 import json
 import socket
 import random
-from typing import Set, List, Dict, Optional
+from typing import Set, List, Dict, Optional, Union
 import logging
 import time
+import heapq
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from .politeness import HostScheduler
+from .page_pipeline import PagePipeline, PageData
+from .http_pool import ConnectionPool
+from .body_reader import BodyReader
+from .http_cache import HTTPCache
+from .robots import RobotsCache
+from .retry import RetryPolicy, RetryLater
+from .proxy_pool import ProxyPool
+from .domain_blocklist import DomainBlocklist
+from .dns_validator import DNSValidator, resolve_domain
+from .domain_url_store import DomainURLStore
+from .result_stream import ResultStreamWriter
+from . import metrics
 
 class DomainDetector:
     """Domain tespit etme ve doğrulama sınıfı"""
     
     def __init__(self, delay: float = 1.0, timeout: int = 10, validate_domains: bool = True, 
                  use_random_user_agent: bool = False, use_proxy: bool = False, proxy_list: List[str] = None,
-                 blocked_domains: List[str] = None, use_domain_blocking: bool = False):
+                 blocked_domains: List[str] = None, use_domain_blocking: bool = False,
+                 scheduler: HostScheduler = None, page_pipeline: PagePipeline = None,
+                 connection_pool: ConnectionPool = None, body_reader: BodyReader = None,
+                 domain_blocklist: DomainBlocklist = None, dns_validator: DNSValidator = None,
+                 result_stream: ResultStreamWriter = None, domain_url_store: DomainURLStore = None,
+                 http_cache: HTTPCache = None, robots_cache: RobotsCache = None,
+                 retry_policy: RetryPolicy = None, proxy_pool: ProxyPool = None):
         """
         DomainDetector başlatıcı
         
@@ -39,23 +61,51 @@ class DomainDetector:
             proxy_list: Kullanılacak proxy listesi
             blocked_domains: Engellenen domain listesi
             use_domain_blocking: Domain engelleme kullan
+            scheduler: Paylaşılan host zamanlayıcısı (verilmezse delay ile oluşturulur)
+            page_pipeline: URLCrawler ile paylaşılan sayfa pipeline'ı
+            connection_pool: Paylaşılan HTTP bağlantı havuzu (verilmezse sınıfa özel oluşturulur)
+            body_reader: Paylaşılan yanıt gövdesi okuyucusu (boyut limiti ve istatistikler)
+            domain_blocklist: Önceden derlenmiş engelleme listesi (verilirse blocked_domains yerine kullanılır)
+            dns_validator: Paylaşılan DNS doğrulayıcı (domain'ler bulundukça arka planda doğrulanır)
+            result_stream: Verilirse doğrulanan her domain bu akışa sonucu belli olduğu anda yazılır
+            domain_url_store: Domain'e referans veren URL'lerin paylaşılan deposu (verilmezse sınıfa özel oluşturulur)
+            http_cache: Paylaşılan kalıcı HTTP önbelleği (verilirse sayfalar koşullu isteklerle yeniden doğrulanır)
+            robots_cache: Paylaşılan robots.txt önbelleği (verilirse yasaklanan sayfalar indirilmez)
+            retry_policy: Paylaşılan tekrar deneme politikası (başarısız sayfalar ertelenip tekrar işlenir)
+            proxy_pool: Paylaşılan proxy havuzu (verilmezse proxy_list doğrulanarak oluşturulur)
         """
         self.delay = delay
+        self.scheduler = scheduler or HostScheduler(delay)
+        self.page_pipeline = page_pipeline or PagePipeline()
         self.timeout = timeout
         self.validate_domains = validate_domains
+        self.dns_validator = dns_validator or DNSValidator()
         self.use_random_user_agent = use_random_user_agent
         self.use_proxy = use_proxy
         self.proxy_list = proxy_list or []
         self.current_proxy = None
-        self.failed_proxies: Set[str] = set()
+        self.proxy_pool = proxy_pool
         self.use_domain_blocking = use_domain_blocking
         self.blocked_domains = set()
+        self.domain_blocklist = domain_blocklist
+        self.result_stream = result_stream
         self.blocked_urls_count = 0
-        self.session = requests.Session()
+        self.connection_pool = connection_pool or ConnectionPool()
+        self.session = self.connection_pool.session()
+        self.body_reader = body_reader or BodyReader()
+        self.http_cache = http_cache
+        self.robots_cache = robots_cache
+        self.retry_policy = retry_policy or RetryPolicy()
+        if robots_cache is not None:
+            # Crawl-delay değerleri bu zamanlayıcıya uygulanır
+            robots_cache.attach(self.scheduler)
         self.found_domains: Set[str] = set()
+        # detect_domains_from_urls sayfaları thread havuzunda işlerken found_domains'i korur
+        self._found_lock = threading.Lock()
         self.valid_domains: Set[str] = set()
         self.invalid_domains: Set[str] = set()
-        self.domain_urls: Dict[str, Set[str]] = {}
+        # Domain'e referans veren URL'ler (sıkıştırılmış, export edilebilir)
+        self.domain_urls = domain_url_store if domain_url_store is not None else DomainURLStore()
         
         # Logging ayarla
         self.logger = logging.getLogger(__name__)
@@ -91,99 +141,76 @@ class DomainDetector:
         from .config import RANDOM_USER_AGENTS
         return random.choice(RANDOM_USER_AGENTS)
     
-    def _update_user_agent_if_needed(self):
-        """Gerekirse user agent'ı günceller"""
+    def _get_request_headers(self) -> Dict[str, str]:
+        """İstek bazlı header'ları döndürür (session header'larını değiştirmez)"""
         if self.use_random_user_agent:
             from .config import RANDOM_USER_AGENT_PER_REQUEST
             if RANDOM_USER_AGENT_PER_REQUEST:
                 new_user_agent = self._get_random_user_agent()
-                self.session.headers.update({'User-Agent': new_user_agent})
                 self.logger.debug(f"User agent güncellendi: {new_user_agent}")
+                return {'User-Agent': new_user_agent}
+        return {}
     
     def _setup_proxy(self):
-        """Proxy ayarlarını yapar"""
-        if self.use_proxy and self.proxy_list:
-            self.logger.info(f"Proxy modu etkin: {len(self.proxy_list)} proxy mevcut")
+        """Proxy ayarlarını yapar (paylaşılan havuz yoksa proxy listesi doğrulanarak havuz oluşturulur)"""
+        if self.use_proxy and self.proxy_pool is None and self.proxy_list:
+            self.proxy_pool = ProxyPool(self.proxy_list)
+            healthy = self.proxy_pool.validate()
+            self.logger.info(f"Proxy doğrulaması: {healthy}/{len(self.proxy_pool)} proxy çalışıyor")
+        
+        if self.use_proxy and self.proxy_pool is not None:
+            self.logger.info(f"Proxy modu etkin: {len(self.proxy_pool)} proxy mevcut")
             self._select_proxy()
-        elif self.use_proxy and not self.proxy_list:
+        elif self.use_proxy:
             self.logger.warning("Proxy modu etkin ama proxy listesi boş!")
             self.use_proxy = False
         else:
             self.logger.info("Proxy kullanılmıyor")
     
     def _select_proxy(self) -> Optional[str]:
-        """Kullanılabilir bir proxy seçer"""
-        if not self.proxy_list:
-            return None
-        
-        # Başarısız proxy'leri hariç tut
-        available_proxies = [p for p in self.proxy_list if p not in self.failed_proxies]
-        
-        if not available_proxies:
-            self.logger.warning("Tüm proxy'ler başarısız! Proxy'siz devam ediliyor.")
-            self.use_proxy = False
-            return None
-        
-        # Random proxy seç
-        proxy = random.choice(available_proxies)
+        """Havuzdan sağlık puanına göre bir proxy seçer; kullanılabilir proxy yoksa None (doğrudan gidilir)"""
+        proxy = self.proxy_pool.select()
+        if proxy is None and self.current_proxy is not None:
+            # Devre dışı proxy'ler cooldown sonrası havuza dönünce tekrar seçilir
+            self.logger.warning("Kullanılabilir proxy yok! Proxy'siz devam ediliyor.")
+        elif proxy is not None and proxy != self.current_proxy:
+            self.logger.debug(f"Proxy seçildi: {proxy}")
         self.current_proxy = proxy
-        
-        # Session'a proxy ayarla
-        proxy_dict = self._parse_proxy(proxy)
-        if proxy_dict:
-            self.session.proxies.update(proxy_dict)
-            self.logger.info(f"Proxy seçildi: {proxy}")
-            return proxy
-        else:
-            self.failed_proxies.add(proxy)
-            return self._select_proxy()  # Başka proxy dene
+        return proxy
     
-    def _parse_proxy(self, proxy_url: str) -> Optional[Dict[str, str]]:
-        """Proxy URL'ini parse eder"""
-        try:
-            if proxy_url.startswith('http://') or proxy_url.startswith('https://'):
-                return {
-                    'http': proxy_url,
-                    'https': proxy_url
-                }
-            elif proxy_url.startswith('socks4://') or proxy_url.startswith('socks5://'):
-                return {
-                    'http': proxy_url,
-                    'https': proxy_url
-                }
-            else:
-                # Format belirtilmemişse HTTP olarak varsay
-                formatted_proxy = f"http://{proxy_url}"
-                return {
-                    'http': formatted_proxy,
-                    'https': formatted_proxy
-                }
-        except Exception as e:
-            self.logger.error(f"Proxy parse hatası {proxy_url}: {e}")
+    def _request_proxy(self, rotate: bool = False) -> Optional[str]:
+        """
+        İsteğin gideceği proxy'yi belirler
+        
+        Rotasyon açıksa her istek havuzdan seçilen proxy ile gider; kapalıysa
+        mevcut proxy hata alana kadar kullanılır. Session'ın proxy ayarı
+        değiştirilmez, rota istekle birlikte gönderilir.
+        
+        Args:
+            rotate: Mevcut proxy yerine yenisini seç (tekrar denemelerde)
+            
+        Returns:
+            Proxy URL'i veya doğrudan gidilecekse None
+        """
+        if not self.use_proxy:
             return None
+        from .config import PROXY_ROTATION
+        if rotate or PROXY_ROTATION or self.current_proxy is None:
+            return self._select_proxy()
+        return self.current_proxy
     
-    def _rotate_proxy(self):
-        """Proxy rotasyonu yapar"""
-        if self.use_proxy and self.proxy_list:
-            from .config import PROXY_ROTATION
-            if PROXY_ROTATION:
-                old_proxy = self.current_proxy
-                new_proxy = self._select_proxy()
-                if new_proxy and new_proxy != old_proxy:
-                    self.logger.debug(f"Proxy değiştirildi: {old_proxy} -> {new_proxy}")
+    def _request_proxies(self, proxy: Optional[str]) -> Optional[Dict[str, str]]:
+        """Proxy için isteğin ``proxies`` parametresi (None: doğrudan rota)"""
+        return self.proxy_pool.proxies_for(proxy) if proxy is not None else None
     
-    def _handle_proxy_failure(self):
-        """Proxy başarısızlığını işler"""
-        if self.current_proxy:
-            self.failed_proxies.add(self.current_proxy)
-            self.logger.warning(f"Proxy başarısız olarak işaretlendi: {self.current_proxy}")
-            
-            # Yeni proxy dene
-            new_proxy = self._select_proxy()
-            if not new_proxy:
-                self.logger.warning("Kullanılabilir proxy kalmadı, proxy'siz devam ediliyor")
-                self.use_proxy = False
-                self.session.proxies.clear()
+    def _handle_proxy_failure(self, proxy: Optional[str]):
+        """Proxy başarısızlığını havuza bildirir; mevcut proxy ise yenisini seçer"""
+        if proxy is None:
+            return
+        self.proxy_pool.record_failure(proxy)
+        self.logger.warning(f"Proxy hatası kaydedildi: {proxy}")
+        if proxy == self.current_proxy:
+            self._select_proxy()
     
     def _setup_domain_blocking(self, blocked_domains: List[str] = None):
         """Domain engelleme ayarlarını yapar"""
@@ -191,6 +218,12 @@ class DomainDetector:
             self.logger.info("Domain engelleme kullanılmıyor")
             return
         
+        # Önceden derlenmiş liste verildiyse tekrar derleme
+        if self.domain_blocklist is not None:
+            self.blocked_domains = self.domain_blocklist.domains
+            self.logger.info(f"Domain engelleme: paylaşılan liste kullanılıyor ({len(self.blocked_domains)} domain, mod: {self.domain_blocklist.mode})")
+            return
+        
         # Engellenen domain'leri ayarla
         if blocked_domains:
             self.blocked_domains.update(domain.lower().strip() for domain in blocked_domains)
@@ -200,62 +233,23 @@ class DomainDetector:
             self.blocked_domains.update(domain.lower().strip() for domain in DEFAULT_BLOCKED_DOMAINS)
             self.logger.info(f"Domain engelleme: {len(DEFAULT_BLOCKED_DOMAINS)} varsayılan domain eklendi")
         
+        # Engelleme listesini moda göre bir kez derle
+        self.domain_blocklist = DomainBlocklist(self.blocked_domains)
+        self.blocked_domains = self.domain_blocklist.domains
+        
         self.logger.info(f"Toplam engellenen domain sayısı: {len(self.blocked_domains)}")
     
+    @metrics.timed('domain_blocking')
     def _is_domain_blocked(self, url: str) -> bool:
         """URL'nin domain'inin engellenip engellenmediğini kontrol eder"""
-        self.logger.debug(f"Domain engelleme kontrolü başlatıldı: use_domain_blocking={self.use_domain_blocking}, blocked_domains_count={len(self.blocked_domains)}")
-        
-        if not self.use_domain_blocking or not self.blocked_domains:
-            self.logger.debug(f"Domain engelleme devre dışı veya engellenen domain yok")
+        if not self.use_domain_blocking or not self.domain_blocklist:
             return False
         
         try:
-            from .config import DOMAIN_BLOCKING_MODE
-            parsed = urlparse(url)
-            domain = parsed.netloc.lower()
-            
-            # Port numarasını kaldır
-            if ':' in domain:
-                domain = domain.split(':')[0]
-            
-            # www. prefix'ini kaldır
-            if domain.startswith('www.'):
-                domain = domain[4:]
-            
-            self.logger.debug(f"Kontrol edilen domain: {domain}, mod: {DOMAIN_BLOCKING_MODE}")
-            
-            for blocked_domain in self.blocked_domains:
-                # Engellenen domain'den de www. prefix'ini kaldır
-                normalized_blocked = blocked_domain
-                if normalized_blocked.startswith('www.'):
-                    normalized_blocked = normalized_blocked[4:]
-                
-                self.logger.debug(f"Karşılaştırma: {domain} vs {normalized_blocked}")
-                
-                if DOMAIN_BLOCKING_MODE == 'exact':
-                    # Tam eşleşme
-                    if domain == normalized_blocked:
-                        self.logger.debug(f"EXACT eşleşme bulundu: {domain} == {normalized_blocked}")
-                        return True
-                elif DOMAIN_BLOCKING_MODE == 'subdomain':
-                    # Alt domain dahil
-                    if domain == normalized_blocked or domain.endswith('.' + normalized_blocked):
-                        self.logger.debug(f"SUBDOMAIN eşleşme bulundu: {domain} matches {normalized_blocked}")
-                        return True
-                elif DOMAIN_BLOCKING_MODE == 'contains':
-                    # İçeren
-                    if normalized_blocked in domain:
-                        self.logger.debug(f"CONTAINS eşleşme bulundu: {normalized_blocked} in {domain}")
-                        return True
-            
-            self.logger.debug(f"Hiç eşleşme bulunamadı: {domain}")
-            return False
-            
+            return self.domain_blocklist.is_blocked(url)
         except Exception as e:
             self.logger.debug(f"Domain engelleme kontrolü hatası {url}: {e}")
             return False
-            return False
     
     def _log_blocked_domain(self, url: str):
         """Engellenen domain'i loglar"""
@@ -283,148 +277,126 @@ class DomainDetector:
         return bool(re.match(domain_pattern, domain))
     
     def validate_domain_exists(self, domain: str) -> bool:
-        """Domain'in gerçekten var olup olmadığını kontrol eder"""
+        """
+        Domain'in gerçekten var olup olmadığını kontrol eder
+        
+        Raises:
+            socket.gaierror: Geçici DNS hatası; DNSValidator sonucu önbelleğe yazmaz
+        """
         if not self.validate_domains:
             return True
             
         try:
-            # DNS lookup ile domain'in var olup olmadığını kontrol et
-            socket.gethostbyname(domain)
-            return True
-        except socket.gaierror:
-            # DNS çözümlenemedi, domain geçersiz
-            return False
-        except Exception as e:
+            # DNS lookup ile domain'in var olup olmadığını kontrol et (NXDOMAIN ise False)
+            return resolve_domain(domain)
+        except socket.gaierror as e:
             self.logger.warning(f"Domain doğrulama hatası {domain}: {e}")
-            return False
+            raise
     
     def get_page_content(self, url: str) -> BeautifulSoup:
         """Sayfa içeriğini alır"""
-        max_retries = 3
-        
-        for attempt in range(max_retries):
+        while True:
             try:
-                # Random user agent kullanılıyorsa güncelle
-                self._update_user_agent_if_needed()
-                
-                # Proxy rotasyonu
-                if attempt > 0:  # İlk denemede rotasyon yapma
-                    self._rotate_proxy()
-                
-                response = self.session.get(url, timeout=self.timeout)
-                response.raise_for_status()
-                
-                content_type = response.headers.get('content-type', '').lower()
-                if 'text/html' not in content_type:
-                    return None
-                
-                return BeautifulSoup(response.content, 'html.parser')
-                
-            except requests.exceptions.ProxyError as e:
-                self.logger.warning(f"Proxy hatası {url} (Deneme {attempt + 1}/{max_retries}): {e}")
-                self._handle_proxy_failure()
-                if attempt == max_retries - 1:
-                    self.logger.error(f"Tüm proxy denemeleri başarısız: {url}")
-                    return None
-                continue
-                
-            except requests.exceptions.Timeout as e:
-                self.logger.warning(f"Timeout {url} (Deneme {attempt + 1}/{max_retries}): {e}")
-                if self.use_proxy:
-                    self._rotate_proxy()
-                if attempt == max_retries - 1:
-                    return None
-                continue
-                
-            except requests.RequestException as e:
-                self.logger.error(f"Sayfa alınamadı {url} (Deneme {attempt + 1}/{max_retries}): {e}")
-                if self.use_proxy and "proxy" in str(e).lower():
-                    self._handle_proxy_failure()
-                if attempt == max_retries - 1:
-                    return None
-                continue
+                content = self._fetch_content(url)
+                break
+            except RetryLater as e:
+                # Tek sayfalık istekte kuyruk yoktur; tekrar deneme zamanı beklenir
+                time.sleep(max(0.0, e.not_before - time.monotonic()))
+        if content is None:
+            return None
         
-        return None
+        return BeautifulSoup(content, 'html.parser')
     
+    def _fetch_content(self, url: str) -> Optional[Union[str, bytes]]:
+        """Sayfanın ham HTML içeriğini indirir (host zamanlayıcısı ve retry ile)"""
+        # Önbellekteki taze kopya ağa gidilmeden kullanılır, eskisi koşullu istekle doğrulanır
+        cached = self.http_cache.lookup(url) if self.http_cache is not None else None
+        if cached is not None and cached.fresh:
+            return self.http_cache.reuse(cached)
+        
+        # Rate limiting (host bazlı)
+        self.scheduler.wait(url)
+        
+        # İsteğin rotası (tekrar denemelerde farklı proxy seçilir)
+        attempt = self.retry_policy.attempts(url)
+        proxy = self._request_proxy(rotate=attempt > 0)
+        
+        try:
+            # Random user agent kullanılıyorsa istek header'ına ekle
+            headers = self._get_request_headers()
+            if cached is not None:
+                headers.update(cached.conditional_headers())
+            
+            # Gövde, header'lar kontrol edildikten sonra akış halinde okunur
+            with self.session.get(url, headers=headers, timeout=self.timeout, stream=True,
+                                  proxies=self._request_proxies(proxy)) as response:
+                self.scheduler.record_response(url, response.status_code, response.elapsed.total_seconds())
+                if proxy is not None:
+                    self.proxy_pool.record_success(proxy, response.elapsed.total_seconds())
+                if self.http_cache is not None:
+                    content = self.http_cache.read(url, response, self.body_reader, cached)
+                else:
+                    response.raise_for_status()
+                    content = self.body_reader.read(response)
+        except requests.RequestException as e:
+            self._handle_fetch_error(url, e, attempt, proxy)
+            return None
+        
+        self.retry_policy.succeeded(url)
+        return content
+    
+    def _handle_fetch_error(self, url: str, error: requests.RequestException, attempt: int,
+                            proxy: Optional[str]) -> None:
+        """
+        İstek hatasını loglar, proxy/zamanlayıcı durumunu günceller ve retry politikasına bildirir
+        
+        Raises:
+            RetryLater: URL ertelenip daha sonra tekrar denenmeli
+        """
+        if isinstance(error, requests.exceptions.ProxyError):
+            self.logger.warning(f"Proxy hatası {url} (Deneme {attempt + 1}): {error}")
+            self._handle_proxy_failure(proxy)
+        elif isinstance(error, requests.exceptions.Timeout):
+            self.logger.warning(f"Timeout {url} (Deneme {attempt + 1}): {error}")
+            self.scheduler.record_timeout(url)
+            self._handle_proxy_failure(proxy)
+        else:
+            self.logger.error(f"Sayfa alınamadı {url} (Deneme {attempt + 1}): {error}")
+            if proxy is not None and "proxy" in str(error).lower():
+                self._handle_proxy_failure(proxy)
+        
+        # Tekrar denenecekse RetryLater yükselir ve URL çağıranın kuyruğuna geri konur
+        reason = self.retry_policy.failed(url, error, self.scheduler)
+        self.logger.warning(f"Tekrar denenmeyecek ({reason}): {url}")
+    
+    @metrics.timed('extract')
     def extract_domains_from_page(self, url: str, soup: BeautifulSoup) -> Set[str]:
         """Sayfa içeriğinden domain'leri çıkarır"""
+        return self.extract_domains_from_urls(PageData.from_soup(soup, url).all_urls)
+    
+    @metrics.timed('extract')
+    def extract_domains_from_urls(self, absolute_urls: List[str]) -> Set[str]:
+        """
+        Sayfadaki absolute URL'lerden (a/link/img/script) domain'leri çıkarır
+        
+        Args:
+            absolute_urls: Sayfadan çıkarılmış absolute URL'ler
+            
+        Returns:
+            Engellenmemiş domain'ler
+        """
         domains = set()
         
-        # <a> etiketlerinden href'leri al
-        for link in soup.find_all('a', href=True):
-            href = link['href'].strip()
-            if href:
-                absolute_url = urljoin(url, href)
-                domain = self.extract_domain(absolute_url)
-                
-                if self.is_valid_domain_format(domain):
-                    # Domain engelleme kontrolü
-                    test_url = f"https://{domain}"
-                    is_blocked = self._is_domain_blocked(test_url)
-                    self.logger.debug(f"Domain engelleme kontrolü (a): {domain} -> {is_blocked}")
-                    
-                    if not is_blocked:
-                        domains.add(domain)
-                        
-                        if domain not in self.domain_urls:
-                            self.domain_urls[domain] = set()
-                        self.domain_urls[domain].add(absolute_url)
-                    else:
-                        self.logger.info(f"🚫 Domain engellendi (sayfa içi a): {domain}")
-        
-        # <link> etiketlerinden href'leri al
-        for link in soup.find_all('link', href=True):
-            href = link['href'].strip()
-            if href:
-                absolute_url = urljoin(url, href)
-                domain = self.extract_domain(absolute_url)
-                
-                if self.is_valid_domain_format(domain):
-                    # Domain engelleme kontrolü
-                    if not self._is_domain_blocked(f"https://{domain}"):
-                        domains.add(domain)
-                        
-                        if domain not in self.domain_urls:
-                            self.domain_urls[domain] = set()
-                        self.domain_urls[domain].add(absolute_url)
-                    else:
-                        self.logger.info(f"🚫 Domain engellendi (sayfa içi): {domain}")
-        
-        # <img> etiketlerinden src'leri al
-        for img in soup.find_all('img', src=True):
-            src = img['src'].strip()
-            if src:
-                absolute_url = urljoin(url, src)
-                domain = self.extract_domain(absolute_url)
-                
-                if self.is_valid_domain_format(domain):
-                    # Domain engelleme kontrolü
-                    if not self._is_domain_blocked(f"https://{domain}"):
-                        domains.add(domain)
-                        
-                        if domain not in self.domain_urls:
-                            self.domain_urls[domain] = set()
-                        self.domain_urls[domain].add(absolute_url)
-                    else:
-                        self.logger.info(f"🚫 Domain engellendi (sayfa içi): {domain}")
-        
-        # <script> etiketlerinden src'leri al
-        for script in soup.find_all('script', src=True):
-            src = script['src'].strip()
-            if src:
-                absolute_url = urljoin(url, src)
-                domain = self.extract_domain(absolute_url)
-                
-                if self.is_valid_domain_format(domain):
-                    # Domain engelleme kontrolü
-                    if not self._is_domain_blocked(f"https://{domain}"):
-                        domains.add(domain)
-                        
-                        if domain not in self.domain_urls:
-                            self.domain_urls[domain] = set()
-                        self.domain_urls[domain].add(absolute_url)
-                    else:
-                        self.logger.info(f"🚫 Domain engellendi (sayfa içi): {domain}")
+        for absolute_url in absolute_urls:
+            domain = self.extract_domain(absolute_url)
+            
+            if self.is_valid_domain_format(domain):
+                # Domain engelleme kontrolü
+                if not self._is_domain_blocked(f"https://{domain}"):
+                    domains.add(domain)
+                    self.domain_urls.add(domain, absolute_url)
+                else:
+                    self.logger.info(f"🚫 Domain engellendi (sayfa içi): {domain}")
         
         return domains
     
@@ -435,70 +407,144 @@ class DomainDetector:
             self._log_blocked_domain(url)
             return set()
         
+        # robots.txt kontrolü (host'un robots.txt'si ilk kontrolde indirilir)
+        if self.robots_cache is not None and not self.robots_cache.allowed(
+                url, self.session, self._get_request_headers(), self.scheduler,
+                self._request_proxies(self._request_proxy())):
+            self.logger.info(f"robots.txt tarafından yasaklandı: {url}")
+            return set()
+        
         self.logger.info(f"Domain tespiti yapılıyor: {url}")
         
-        # Sayfa içeriğini al
-        soup = self.get_page_content(url)
-        if not soup:
+        # Sayfa içeriğini al (crawler aynı sayfayı indirdiyse pipeline önbelleğinden gelir)
+        page = self.page_pipeline.get(url, self._fetch_content)
+        if page is None:
             return set()
         
         # Domain'leri çıkar
-        domains = self.extract_domains_from_page(url, soup)
+        domains = self.extract_domains_from_urls(page.all_urls)
         
         # Bulunan domain'leri kaydet (engelleme kontrolü ile)
+        new_domains = []
         for domain in domains:
             # Domain'in kendisini kontrol et (URL formatında)
             test_url = f"https://{domain}"
             if not self._is_domain_blocked(test_url):
-                if domain not in self.found_domains:
-                    self.found_domains.add(domain)
+                with self._found_lock:
+                    is_new = domain not in self.found_domains
+                    if is_new:
+                        self.found_domains.add(domain)
+                if is_new:
                     self.logger.info(f"Yeni domain bulundu: {domain}")
+                    new_domains.append(domain)
             else:
                 self.logger.info(f"🚫 Domain engellendi: {domain}")
         
+        # Doğrulama sayfa işleme devam ederken arka planda başlar
+        self._schedule_validations(new_domains)
+        
         return domains
     
+    def _schedule_validations(self, domains: List[str]) -> None:
+        """Domain'ler için arka planda DNS doğrulaması başlatır"""
+        if not self.validate_domains or not domains:
+            return
+        
+        # Kalıcı önbellekte olanlar tek sorguda yüklenir
+        self.dns_validator.prefetch(domains)
+        
+        for domain in domains:
+            # Doğrudan yanıt alınmış host zaten çözümlenmiştir, tekrar sorgulanmaz
+            if self.connection_pool.has_responded(domain):
+                self.dns_validator.mark_resolved(domain)
+            else:
+                self.dns_validator.submit(domain, self.validate_domain_exists)
+    
+    @metrics.timed('domain_validation')
     def validate_all_domains(self) -> None:
-        """Bulunan tüm domain'leri doğrular"""
+        """Bulunan tüm domain'lerin doğrulamasının bitmesini bekler ve sonuçları kaydeder"""
         if not self.validate_domains:
             self.valid_domains = self.found_domains.copy()
+            if self.result_stream is not None:
+                for domain in sorted(self.valid_domains):
+                    self.result_stream.domain(domain)
             return
             
-        self.logger.info(f"Domain doğrulama başlatılıyor ({len(self.found_domains)} domain)...")
+        domains = list(self.found_domains)
+        self.logger.info(f"Domain doğrulama tamamlanıyor ({len(domains)} domain)...")
         
-        for i, domain in enumerate(self.found_domains, 1):
-            self.logger.info(f"Doğrulanıyor ({i}/{len(self.found_domains)}): {domain}")
-            
-            if self.validate_domain_exists(domain):
+        # Henüz sorgusu başlatılmamış domain'ler (örn. dışarıdan eklenenler)
+        self._schedule_validations(domains)
+        
+        def on_result(domain, resolved):
+            if resolved:
                 self.valid_domains.add(domain)
                 self.logger.info(f"✅ Geçerli domain: {domain}")
             else:
                 self.invalid_domains.add(domain)
                 self.logger.warning(f"❌ Geçersiz domain: {domain}")
-            
-            # Rate limiting
-            if i < len(self.found_domains):
-                time.sleep(0.1)  # DNS sorguları için kısa bekleme
+            if self.result_stream is not None:
+                self.result_stream.domain(domain, valid=resolved)
+            if metrics.registry is not None:
+                metrics.registry.inc('domains_valid' if resolved else 'domains_invalid')
         
-        self.logger.info(f"Domain doğrulama tamamlandı. Geçerli: {len(self.valid_domains)}, Geçersiz: {len(self.invalid_domains)}")
+        self.dns_validator.results(domains, on_result)
+        
+        stats = self.dns_validator.stats
+        self.logger.info(f"Domain doğrulama tamamlandı. Geçerli: {len(self.valid_domains)}, Geçersiz: {len(self.invalid_domains)} "
+                         f"(DNS sorgusu: {stats['lookups']}, önbellekten: {stats['cached']}, bilinen host: {stats['known']}, "
+                         f"zaman aşımı: {stats['timeouts']})")
     
-    def detect_domains_from_urls(self, urls: List[str]) -> Dict:
-        """Birden fazla URL'den domain'leri tespit eder"""
+    def detect_domains_from_urls(self, urls: List[str], concurrency: int = None) -> Dict:
+        """
+        Birden fazla URL'den domain'leri tespit eder
+        
+        Args:
+            urls: İşlenecek URL'ler
+            concurrency: Aynı anda işlenecek URL sayısı (varsayılan: config.DETECTOR_WORKERS).
+                Farklı host'lar paralel işlenir; aynı host'a yapılan istekler
+                yine de zamanlayıcı tarafından sıraya konur.
+        """
+        if concurrency is None:
+            from .config import DETECTOR_WORKERS
+            concurrency = DETECTOR_WORKERS
         self.logger.info(f"Toplam {len(urls)} URL'den domain tespiti başlatılıyor")
         
-        for i, url in enumerate(urls, 1):
+        # Tekrar denenecek URL'ler: (not_before, sıra, url)
+        deferred = []
+        deferred_lock = threading.Lock()
+        
+        def process(item):
+            i, url = item
             self.logger.info(f"İşleniyor ({i}/{len(urls)}): {url}")
             
             try:
                 self.detect_domains_from_url(url)
-                
-                # Rate limiting
-                if i < len(urls):
-                    time.sleep(self.delay)
-                    
+            except RetryLater as e:
+                self.logger.info(f"Tekrar denenecek ({e.reason}): {url}")
+                with deferred_lock:
+                    heapq.heappush(deferred, (e.not_before, i, url))
             except Exception as e:
                 self.logger.error(f"URL işlenirken hata {url}: {e}")
-                continue
+        
+        def run(items):
+            if concurrency > 1 and len(items) > 1:
+                with ThreadPoolExecutor(max_workers=concurrency) as executor:
+                    list(executor.map(process, items))
+            else:
+                for item in items:
+                    process(item)
+        
+        run(list(enumerate(urls, 1)))
+        
+        # Ertelenen URL'ler zamanı geldikçe gruplar halinde tekrar işlenir
+        while deferred:
+            time.sleep(max(0.0, deferred[0][0] - time.monotonic()))
+            due = []
+            while deferred and deferred[0][0] <= time.monotonic():
+                _, i, url = heapq.heappop(deferred)
+                due.append((i, url))
+            run(due)
         
         # Domain doğrulama
         self.validate_all_domains()
@@ -512,8 +558,11 @@ class DomainDetector:
             'valid_domains': sorted(list(self.valid_domains)),
             'invalid_domains': sorted(list(self.invalid_domains)) if self.validate_domains else [],
             'validation_enabled': self.validate_domains,
+            'retries': self.retry_policy.summary(),
             'analysis_time': time.time()
         }
+        if self.scheduler.adaptive:
+            results['host_rates'] = self.scheduler.rates()
         
         self.logger.info(f"Domain tespiti tamamlandı. Geçerli: {len(self.valid_domains)} domain bulundu.")
         return results
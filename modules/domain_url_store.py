@@ -0,0 +1,336 @@
+"""
+Spider Domain Crawler - Domain URL Deposu Modülü
+
+Bir domain'e referans veren URL'ler (sayfadaki link, görsel, script vb.)
+tam string olarak değil, parçalanıp sıkıştırılmış olarak saklanır:
+
+- ``scheme://host`` önekleri bir kez saklanır ve numaralandırılır
+- yol (path + query) kısımları tek bir byte arena'da tekrarsız tutulur;
+  ``/``, ``/favicon.ico`` gibi yollar tüm host'lar için bir kez saklanır
+- her domain'in URL'leri ``array('Q')`` içinde (önek no, yol no) çifti olarak
+  paketlenmiş 8 byte'lık girdilerdir
+
+Copyright (c) 2025 Hasan Yasin Yaşar
+Licensed under PSH 1.1 (Pasha Software License)
+"""
+
+import json
+import random
+import re
+import sys
+import threading
+from array import array
+from typing import Dict, Iterator, List, Tuple
+
+DOMAIN_URL_SAMPLING_MODES = ('first', 'reservoir')
+
+# Paketlenmiş girdi: üst 24 bit önek no, alt 40 bit yol no
+_PATH_BITS = 40
+_PATH_MASK = (1 << _PATH_BITS) - 1
+_MAX_PREFIXES = 1 << (64 - _PATH_BITS)
+
+# scheme://host kısmından sonra yolun başladığı ilk karakter
+_PATH_START = re.compile(r'[/?#]')
+
+# Tekrarlar bu boyuttan küçük listelerde ayıklanmaz
+_COMPACT_MIN = 32
+
+
+class _PathArena:
+    """
+    Yolları tek bir bytearray içinde tekrarsız saklayan arena
+
+    Tekrar kontrolü ``array('Q')`` üzerinde açık adresli bir hash tablosu ile
+    yapılır; yol başına Python nesnesi oluşturulmaz. Yol başına maliyet:
+    UTF-8 uzunluğu + 8 byte offset + ~16-32 byte tablo.
+    """
+
+    def __init__(self, initial_slots: int = 1024):
+        self.data = bytearray()
+        self.offsets = array('Q', [0])
+        # Her slot: (hash'in üst 24 biti << 40) | (yol no + 1); 0 = boş
+        self._table = array('Q', bytes(8 * initial_slots))
+        self._mask = initial_slots - 1
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def get(self, index: int) -> str:
+        return self.data[self.offsets[index]:self.offsets[index + 1]].decode('utf-8', 'surrogatepass')
+
+    def _probe(self, encoded: bytes, hashed: int) -> Tuple[int, int]:
+        """Yolun slotunu döndürür: (slot, yol no veya -1)"""
+        tag = (hashed >> 40) & 0xFFFFFF
+        table, mask, data, offsets = self._table, self._mask, self.data, self.offsets
+        slot = hashed & mask
+        while True:
+            entry = table[slot]
+            if not entry:
+                return slot, -1
+            index = (entry & _PATH_MASK) - 1
+            if entry >> _PATH_BITS == tag and data[offsets[index]:offsets[index + 1]] == encoded:
+                return slot, index
+            slot = (slot + 1) & mask
+
+    def find(self, path: str) -> int:
+        """Yolun numarasını veya yoksa -1 döndürür"""
+        encoded = path.encode('utf-8', 'surrogatepass')
+        return self._probe(encoded, hash(encoded) & 0xFFFFFFFFFFFFFFFF)[1]
+
+    def intern(self, path: str) -> int:
+        """Yolu (yoksa ekleyerek) numarasını döndürür"""
+        encoded = path.encode('utf-8', 'surrogatepass')
+        hashed = hash(encoded) & 0xFFFFFFFFFFFFFFFF
+        slot, index = self._probe(encoded, hashed)
+        if index >= 0:
+            return index
+
+        index = len(self.offsets) - 1
+        self.data += encoded
+        self.offsets.append(len(self.data))
+        self._table[slot] = (((hashed >> 40) & 0xFFFFFF) << _PATH_BITS) | (index + 1)
+        # Doluluk oranı %50'yi geçince tablo iki katına çıkarılır
+        if 2 * (index + 1) > len(self._table):
+            self._resize()
+        return index
+
+    def _resize(self) -> None:
+        size = 2 * len(self._table)
+        table = array('Q', bytes(8 * size))
+        mask = size - 1
+        data, offsets = self.data, self.offsets
+        for index in range(len(offsets) - 1):
+            hashed = hash(bytes(data[offsets[index]:offsets[index + 1]])) & 0xFFFFFFFFFFFFFFFF
+            slot = hashed & mask
+            while table[slot]:
+                slot = (slot + 1) & mask
+            table[slot] = (((hashed >> 40) & 0xFFFFFF) << _PATH_BITS) | (index + 1)
+        self._table = table
+        self._mask = mask
+
+    def memory_bytes(self) -> int:
+        return sys.getsizeof(self.data) + sys.getsizeof(self.offsets) + sys.getsizeof(self._table)
+
+
+class DomainURLStore:
+    """
+    Domain'e referans veren URL'lerin sıkıştırılmış deposu
+
+    ``max_per_domain`` verilirse her domain için en fazla bu kadar URL saklanır:
+    ``'first'`` modunda ilk görülenler tutulur, ``'reservoir'`` modunda
+    reservoir örneklemesiyle (Algorithm R) tüm referanslar arasından eşit
+    olasılıklı bir örnek tutulur. Reservoir'dan çıkan bir URL tekrar
+    görülürse yeniden aday olur; sık referans verilen URL'lerin örneğe girme
+    olasılığı biraz daha yüksektir. Thread-safe'dir.
+    """
+
+    def __init__(self, max_per_domain: int = None, sampling: str = None, seed: int = None):
+        """
+        DomainURLStore başlatıcı
+
+        Args:
+            max_per_domain: Domain başına saklanacak maksimum URL, 0 veya None ise sınırsız
+                (varsayılan: config.DOMAIN_URLS_MAX_PER_DOMAIN)
+            sampling: Sınır dolunca davranış: 'first' veya 'reservoir'
+                (varsayılan: config.DOMAIN_URLS_SAMPLING)
+            seed: Reservoir örneklemesinin rastgele sayı tohumu
+        """
+        from .config import DOMAIN_URLS_MAX_PER_DOMAIN, DOMAIN_URLS_SAMPLING
+        self.max_per_domain = DOMAIN_URLS_MAX_PER_DOMAIN if max_per_domain is None else max_per_domain
+        self.sampling = DOMAIN_URLS_SAMPLING if sampling is None else sampling
+        if self.sampling not in DOMAIN_URL_SAMPLING_MODES:
+            raise ValueError(f"Geçersiz örnekleme modu: {self.sampling} "
+                             f"(seçenekler: {', '.join(DOMAIN_URL_SAMPLING_MODES)})")
+
+        self._domain_ids: Dict[str, int] = {}
+        self._domains: List[str] = []
+        self._entries: List[array] = []
+        # Son tekrar ayıklamasından sonraki tekrarsız girdi sayısı
+        self._compacted: List[int] = []
+        # Reservoir modunda domain başına görülen aday sayısı
+        self._offered: List[int] = []
+
+        self._prefix_ids: Dict[str, int] = {}
+        self._prefixes: List[str] = []
+        self._paths = _PathArena()
+
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._counters = {
+            'references': 0,
+            'dropped': 0
+        }
+
+    @staticmethod
+    def split_url(url: str) -> Tuple[str, str]:
+        """URL'yi ``scheme://host`` öneki ve yol kısmına ayırır"""
+        scheme_end = url.find('://')
+        if scheme_end < 0:
+            return '', url
+        match = _PATH_START.search(url, scheme_end + 3)
+        if match is None:
+            return url, ''
+        return url[:match.start()], url[match.start():]
+
+    def _domain_index(self, domain: str) -> int:
+        index = self._domain_ids.get(domain)
+        if index is None:
+            index = self._domain_ids[domain] = len(self._domains)
+            self._domains.append(domain)
+            self._entries.append(array('Q'))
+            self._compacted.append(0)
+            self._offered.append(0)
+        return index
+
+    def _prefix_index(self, prefix: str) -> int:
+        index = self._prefix_ids.get(prefix)
+        if index is None:
+            index = len(self._prefixes)
+            if index >= _MAX_PREFIXES:
+                raise OverflowError("Domain URL deposunda önek sınırına ulaşıldı")
+            self._prefix_ids[prefix] = index
+            self._prefixes.append(prefix)
+        return index
+
+    def _compact(self, index: int) -> array:
+        """Domain'in girdilerindeki tekrarları ilk görülme sırasını koruyarak ayıklar"""
+        entries = self._entries[index]
+        if len(entries) > self._compacted[index]:
+            entries = self._entries[index] = array('Q', dict.fromkeys(entries))
+            self._compacted[index] = len(entries)
+        return entries
+
+    def add(self, domain: str, url: str) -> None:
+        """
+        Domain'e referans veren URL'yi kaydeder
+
+        Girdiler önce tekrar kontrolü yapılmadan eklenir; liste son ayıklamadaki
+        boyutunun iki katına ulaşınca tekrarlar toplu olarak ayıklanır
+        (eklenen URL başına amortize sabit maliyet).
+
+        Args:
+            domain: URL'nin ait olduğu domain
+            url: Absolute URL
+        """
+        prefix, path = self.split_url(url)
+        limit = self.max_per_domain
+        with self._lock:
+            self._counters['references'] += 1
+            index = self._domain_index(domain)
+            entries = self._entries[index]
+
+            if limit and len(entries) >= limit:
+                entries = self._compact(index)
+            if not limit or len(entries) < limit:
+                entries.append((self._prefix_index(prefix) << _PATH_BITS) | self._paths.intern(path))
+                if len(entries) >= max(_COMPACT_MIN, 2 * self._compacted[index]):
+                    self._compact(index)
+                return
+
+            if self.sampling == 'first':
+                self._counters['dropped'] += 1
+                return
+
+            # Reservoir dolu: zaten örnekte olan URL tekrar aday olmaz
+            prefix_index = self._prefix_ids.get(prefix)
+            path_index = self._paths.find(path)
+            if prefix_index is not None and path_index >= 0:
+                if (prefix_index << _PATH_BITS) | path_index in entries:
+                    return
+            self._offered[index] += 1
+            slot = self._random.randrange(limit + self._offered[index])
+            if slot < limit:
+                entries[slot] = (self._prefix_index(prefix) << _PATH_BITS) | self._paths.intern(path)
+            self._counters['dropped'] += 1
+
+    def _decode(self, entry: int) -> str:
+        return self._prefixes[entry >> _PATH_BITS] + self._paths.get(entry & _PATH_MASK)
+
+    def domains(self) -> List[str]:
+        """URL kaydedilmiş domain'leri döndürür"""
+        with self._lock:
+            return list(self._domains)
+
+    def urls(self, domain: str) -> List[str]:
+        """
+        Domain'e referans veren URL'leri döndürür
+
+        Args:
+            domain: Domain
+
+        Returns:
+            İlk görülme sırasıyla URL'ler (reservoir modunda örnek), domain yoksa boş liste
+        """
+        with self._lock:
+            index = self._domain_ids.get(domain)
+            if index is None:
+                return []
+            return [self._decode(entry) for entry in self._compact(index)]
+
+    def __contains__(self, domain: str) -> bool:
+        return domain in self._domain_ids
+
+    def __len__(self) -> int:
+        """Saklanan toplam (tekrarsız) URL sayısı"""
+        with self._lock:
+            return sum(len(self._compact(index)) for index in range(len(self._domains)))
+
+    def items(self) -> Iterator[Tuple[str, List[str]]]:
+        """(domain, URL'ler) çiftlerini domain sırasıyla döndürür"""
+        for domain in sorted(self.domains()):
+            yield domain, self.urls(domain)
+
+    def to_dict(self) -> Dict[str, List[str]]:
+        """Tüm depoyu ``{domain: [url, ...]}`` sözlüğü olarak döndürür"""
+        return dict(self.items())
+
+    def export(self, filename: str) -> int:
+        """
+        Depoyu ``{domain: [url, ...]}`` biçiminde JSON dosyasına yazar
+
+        Domain'ler tek tek kodlanıp yazıldığından tüm depo bellekte ikinci
+        kez string olarak oluşturulmaz.
+
+        Args:
+            filename: Çıktı dosyası
+
+        Returns:
+            Yazılan URL sayısı
+        """
+        written = 0
+        with open(filename, 'w', encoding='utf-8') as f:
+            f.write('{')
+            for position, (domain, urls) in enumerate(self.items()):
+                f.write(',\n' if position else '\n')
+                f.write(json.dumps(domain, ensure_ascii=False) + ': ')
+                f.write(json.dumps(urls, ensure_ascii=False))
+                written += len(urls)
+            f.write('\n}\n')
+        return written
+
+    def memory_bytes(self) -> int:
+        """Deponun yaklaşık bellek kullanımı (byte)"""
+        with self._lock:
+            total = self._paths.memory_bytes()
+            for container in (self._domain_ids, self._domains, self._entries, self._compacted,
+                              self._offered, self._prefix_ids, self._prefixes):
+                total += sys.getsizeof(container)
+            total += sum(sys.getsizeof(entries) for entries in self._entries)
+            total += sum(sys.getsizeof(name) for name in self._domains)
+            total += sum(sys.getsizeof(prefix) for prefix in self._prefixes)
+            return total
+
+    def stats(self) -> Dict:
+        """Domain, host, URL ve yol sayılarını ve bellek kullanımını döndürür"""
+        stats = {
+            'domains': len(self._domains),
+            'hosts': len(self._prefixes),
+            'urls': len(self),
+            'unique_paths': len(self._paths),
+            'path_bytes': len(self._paths.data),
+            'memory_bytes': self.memory_bytes(),
+            'max_per_domain': self.max_per_domain,
+            'sampling': self.sampling
+        }
+        stats.update(self._counters)
+        return stats
@@ -0,0 +1,153 @@
+"""
+Spider Domain Crawler - URL Frontier Modülü
+
+Copyright (c) 2025 Hasan Yasin Yaşar
+Licensed under PSH 1.1 (Pasha Software License)
+"""
+
+import heapq
+import itertools
+import time
+from typing import Dict, List, Optional, Tuple
+
+from .seen_set import SeenSet, create_seen_set
+
+
+class URLFrontier:
+    """
+    Öncelikli crawl kuyruğu (frontier)
+
+    URL'ler (derinlik, öncelik, sıra) anahtarıyla bir heap'te tutulur; varsayılan
+    öncelikte bu deterministik bir BFS sırası verir. Aynı URL kuyruğa ikinci kez
+    eklenmez. ``max_depth`` ve ``max_fetches`` bütçesi burada uygulanır ve ne
+    kadarının kullanıldığı ``budget_report`` ile raporlanır. Tekrar denenecek
+    URL'ler ``defer`` ile zamanı gelene kadar ayrı bir heap'te bekler.
+    """
+
+    def __init__(self, max_depth: int, max_fetches: int, seen: SeenSet = None):
+        """
+        URLFrontier başlatıcı
+
+        Args:
+            max_depth: Kuyruğa alınabilecek maksimum derinlik
+            max_fetches: Kuyruktan çıkarılabilecek (indirilecek) maksimum URL sayısı
+            seen: Kuyruğa alınmış URL'lerin kümesi (varsayılan: config.SEEN_SET_BACKEND)
+        """
+        self.max_depth = max_depth
+        self.max_fetches = max_fetches
+
+        self._heap: List[Tuple[int, int, int, str]] = []
+        # Tekrar denenecek URL'ler: (not_before, sıra, derinlik, url)
+        self._deferred: List[Tuple[float, int, int, str]] = []
+        self._sequence = itertools.count()
+        self._seen = create_seen_set() if seen is None else seen
+
+        self.enqueued = 0
+        self.fetched = 0
+        self.duplicates_skipped = 0
+        self.depth_skipped = 0
+        self.retries = 0
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def __contains__(self, url: str) -> bool:
+        return url in self._seen
+
+    @property
+    def budget_left(self) -> int:
+        """Kalan indirme bütçesi"""
+        return max(0, self.max_fetches - self.fetched)
+
+    def push(self, url: str, depth: int, priority: int = 0) -> bool:
+        """
+        URL'yi kuyruğa ekler
+
+        Args:
+            url: Eklenecek URL
+            depth: URL'nin crawl derinliği
+            priority: Aynı derinlikteki URL'ler arasında öncelik (küçük olan önce)
+
+        Returns:
+            URL kuyruğa eklendiyse True
+        """
+        if depth > self.max_depth:
+            self.depth_skipped += 1
+            return False
+
+        if not self._seen.add(url):
+            self.duplicates_skipped += 1
+            return False
+
+        heapq.heappush(self._heap, (depth, priority, next(self._sequence), url))
+        self.enqueued += 1
+        return True
+
+    def pop_batch(self, size: int = 1) -> List[Tuple[str, int]]:
+        """
+        Bütçe dahilinde en öncelikli URL'leri kuyruktan çıkarır
+
+        Args:
+            size: Çıkarılacak maksimum URL sayısı
+
+        Returns:
+            (url, derinlik) listesi
+        """
+        self._release_due()
+        batch = []
+        count = min(size, self.budget_left, len(self._heap))
+        for _ in range(count):
+            depth, _, _, url = heapq.heappop(self._heap)
+            batch.append((url, depth))
+        self.fetched += len(batch)
+        return batch
+
+    def defer(self, url: str, depth: int, not_before: float) -> None:
+        """
+        İndirilemeyen URL'yi zamanı gelince tekrar çıkarılmak üzere kuyruğa geri koyar
+
+        Tekrar denemeler indirme bütçesinden düşülmez.
+
+        Args:
+            url: Tekrar denenecek URL
+            depth: URL'nin crawl derinliği
+            not_before: Bu zamandan (time.monotonic) önce çıkarılmaz
+        """
+        heapq.heappush(self._deferred, (not_before, next(self._sequence), depth, url))
+        self.fetched -= 1
+        self.retries += 1
+
+    def next_retry_in(self) -> Optional[float]:
+        """En yakın ertelenmiş URL'nin zamanına kalan süre; ertelenmiş URL yoksa None"""
+        if not self._deferred:
+            return None
+        return max(0.0, self._deferred[0][0] - time.monotonic())
+
+    def _release_due(self) -> None:
+        """Zamanı gelen ertelenmiş URL'leri ana kuyruğa taşır"""
+        now = time.monotonic()
+        while self._deferred and self._deferred[0][0] <= now:
+            _, sequence, depth, url = heapq.heappop(self._deferred)
+            heapq.heappush(self._heap, (depth, 0, sequence, url))
+
+    def seen_stats(self) -> Dict:
+        """Görülen URL kümesinin backend ve bellek kullanımını döndürür"""
+        return self._seen.stats()
+
+    def close(self) -> None:
+        """Görülen URL kümesini kapatır (disk backend'inde geçici dosya silinir)"""
+        self._seen.close()
+
+    def budget_report(self) -> Dict[str, int]:
+        """Derinlik ve indirme bütçesinin kullanım raporunu döndürür"""
+        return {
+            'max_depth': self.max_depth,
+            'max_fetches': self.max_fetches,
+            'fetched': self.fetched,
+            'enqueued': self.enqueued,
+            'pending': len(self._heap),
+            'deferred': len(self._deferred),
+            'retries': self.retries,
+            'duplicates_skipped': self.duplicates_skipped,
+            'depth_skipped': self.depth_skipped
+        }
@@ -0,0 +1,299 @@
+"""
+Spider Domain Crawler - Kalıcı HTTP Yanıt Önbelleği Modülü
+
+Copyright (c) 2025 Hasan Yasin Yaşar
+Licensed under PSH 1.1 (Pasha Software License)
+"""
+
+import os
+import re
+import sqlite3
+import threading
+import time
+import zlib
+from typing import Dict, Optional, Union
+from urllib.parse import urlsplit, urlunsplit
+
+import requests
+
+_DEFAULT_PORTS = {'http': 80, 'https': 443}
+_MAX_AGE_RE = re.compile(r'max-age\s*=\s*(\d+)', re.IGNORECASE)
+
+
+def cache_key(url: str) -> str:
+    """
+    URL'yi önbellek anahtarına normalize eder
+
+    Scheme ve host küçük harfe çevrilir, varsayılan port ve fragment
+    kaldırılır; path ve query olduğu gibi kalır.
+    """
+    parts = urlsplit(url)
+    scheme = parts.scheme.lower()
+    netloc = parts.netloc.lower()
+    if parts.port is not None and parts.port == _DEFAULT_PORTS.get(scheme):
+        netloc = netloc.rsplit(':', 1)[0]
+    return urlunsplit((scheme, netloc, parts.path or '/', parts.query, ''))
+
+
+class CachedPage:
+    """Önbellekteki tek bir sayfa"""
+
+    __slots__ = ('key', 'etag', 'last_modified', 'encoding', 'body', 'size', 'fresh_until')
+
+    def __init__(self, key: str, etag: Optional[str], last_modified: Optional[str],
+                 encoding: Optional[str], body: bytes, size: int, fresh_until: float):
+        """
+        Args:
+            key: Normalize edilmiş URL
+            etag: Sunucunun ETag değeri
+            last_modified: Sunucunun Last-Modified değeri
+            encoding: İçerik decode edilmiş str olarak saklandıysa 'utf-8', ham bytes ise None
+            body: zlib ile sıkıştırılmış gövde
+            size: Gövdenin sıkıştırılmamış boyutu (byte)
+            fresh_until: Bu zamana kadar ağa gidilmeden kullanılır (epoch)
+        """
+        self.key = key
+        self.etag = etag
+        self.last_modified = last_modified
+        self.encoding = encoding
+        self.body = body
+        self.size = size
+        self.fresh_until = fresh_until
+
+    @property
+    def fresh(self) -> bool:
+        return self.fresh_until > time.time()
+
+    def content(self) -> Union[str, bytes]:
+        """Gövdeyi ``BodyReader.read`` ile aynı türde döndürür"""
+        raw = zlib.decompress(self.body)
+        return raw.decode(self.encoding) if self.encoding else raw
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """Yeniden doğrulama isteği için If-None-Match / If-Modified-Since header'ları"""
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+
+class HTTPCache:
+    """
+    SQLite tabanlı kalıcı HTTP yanıt önbelleği
+
+    HTML yanıtlar normalize edilmiş URL ile ETag/Last-Modified değerleri ve
+    zlib ile sıkıştırılmış gövdeleriyle saklanır. ``fresh_ttl`` içinde tekrar
+    istenen sayfalar ağa gidilmeden önbellekten döner; daha eski kayıtlar
+    koşullu istekle yeniden doğrulanır ve 304 yanıtında gövde tekrar
+    indirilmez. ``Cache-Control: no-store`` yanıtlar saklanmaz, ``no-cache``
+    yanıtlar her seferinde yeniden doğrulanır. Thread-safe'dir; crawler ve
+    detector aynı örneği paylaşabilir.
+    """
+
+    def __init__(self, path: str = None, fresh_ttl: float = None, max_age: float = None,
+                 flush_every: int = 50):
+        """
+        HTTPCache başlatıcı
+
+        Args:
+            path: SQLite dosya yolu (varsayılan: config.HTTP_CACHE_FILE)
+            fresh_ttl: Sayfanın ağa gidilmeden kullanılacağı süre (saniye)
+            max_age: Bu süreden uzun süredir doğrulanmamış kayıtlar silinir (saniye)
+            flush_every: Bu kadar yeni kayıt biriktiğinde diske yazılır
+        """
+        from .config import HTTP_CACHE_FILE, HTTP_CACHE_FRESH_TTL, HTTP_CACHE_MAX_AGE
+        self.path = HTTP_CACHE_FILE if path is None else path
+        self.fresh_ttl = HTTP_CACHE_FRESH_TTL if fresh_ttl is None else fresh_ttl
+        self.max_age = HTTP_CACHE_MAX_AGE if max_age is None else max_age
+        self.flush_every = flush_every
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS http_cache ('
+            'url TEXT PRIMARY KEY, etag TEXT, last_modified TEXT, encoding TEXT, '
+            'body BLOB NOT NULL, size INTEGER NOT NULL, fresh_until REAL NOT NULL, validated REAL NOT NULL)'
+        )
+        self._conn.execute('DELETE FROM http_cache WHERE validated <= ?', (time.time() - self.max_age,))
+        self._conn.commit()
+
+        # Henüz diske yazılmamış kayıtlar: url -> (CachedPage, doğrulanma zamanı)
+        self._pending: Dict[str, tuple] = {}
+        self.stats = {
+            'lookups': 0,
+            'fresh_hits': 0,
+            'revalidated': 0,
+            'misses': 0,
+            'stores': 0,
+            'requests_saved': 0,
+            'bytes_saved': 0
+        }
+
+    def _count(self, key: str, value: int = 1) -> None:
+        with self._lock:
+            self.stats[key] += value
+
+    def lookup(self, url: str) -> Optional[CachedPage]:
+        """
+        URL'nin önbellekteki kaydını döndürür
+
+        Args:
+            url: Sayfa URL'i
+
+        Returns:
+            CachedPage veya kayıt yoksa None
+        """
+        key = cache_key(url)
+        with self._lock:
+            self.stats['lookups'] += 1
+            pending = self._pending.get(key)
+            if pending is not None:
+                return pending[0]
+            if self._conn is None:
+                return None
+            row = self._conn.execute(
+                'SELECT etag, last_modified, encoding, body, size, fresh_until FROM http_cache WHERE url = ?', (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        return CachedPage(key, *row)
+
+    def reuse(self, cached: CachedPage) -> Union[str, bytes]:
+        """
+        Taze kaydı ağa gidilmeden kullanır
+
+        Args:
+            cached: ``fresh`` olan kayıt
+
+        Returns:
+            Sayfa içeriği
+        """
+        content = cached.content()
+        with self._lock:
+            self.stats['fresh_hits'] += 1
+            self.stats['requests_saved'] += 1
+            self.stats['bytes_saved'] += cached.size
+        return content
+
+    def read(self, url: str, response: requests.Response, body_reader,
+             cached: CachedPage = None) -> Optional[Union[str, bytes]]:
+        """
+        (Koşullu) isteğin yanıtını işler
+
+        304 yanıtında önbellekteki gövde döner ve kaydın tazeliği yenilenir;
+        başarılı yanıtta gövde ``body_reader`` ile okunup saklanır. HTTP hata
+        kodları ``raise_for_status`` ile yükseltilir.
+
+        Args:
+            url: Sayfa URL'i
+            response: ``stream=True`` ile alınmış yanıt
+            body_reader: Gövdeyi okuyacak BodyReader
+            cached: İstek gönderilmeden önce ``lookup`` ile alınan kayıt
+
+        Returns:
+            Sayfa içeriği veya HTML değilse/limit aşıldıysa None
+        """
+        if response.status_code == 304 and cached is not None:
+            content = cached.content()
+            self._revalidated(cached, response.headers)
+            with self._lock:
+                self.stats['revalidated'] += 1
+                self.stats['bytes_saved'] += cached.size
+            return content
+
+        response.raise_for_status()
+        content = body_reader.read(response)
+        if cached is None:
+            self._count('misses')
+        if content is not None and response.status_code == 200:
+            self.store(url, response.headers, content)
+        return content
+
+    def _fresh_until(self, headers) -> Optional[float]:
+        """Yanıt header'larına göre tazelik süresinin sonu; saklanmayacaksa None"""
+        cache_control = headers.get('cache-control', '').lower()
+        if 'no-store' in cache_control:
+            return None
+        now = time.time()
+        if 'no-cache' in cache_control:
+            return now
+        match = _MAX_AGE_RE.search(cache_control)
+        if match is not None:
+            return now + min(self.fresh_ttl, int(match.group(1)))
+        return now + self.fresh_ttl
+
+    def store(self, url: str, headers, content: Union[str, bytes]) -> None:
+        """
+        Sayfayı önbelleğe yazar
+
+        Args:
+            url: Sayfa URL'i
+            headers: Yanıt header'ları (ETag, Last-Modified, Cache-Control)
+            content: ``BodyReader.read`` ile okunan içerik
+        """
+        fresh_until = self._fresh_until(headers)
+        if fresh_until is None:
+            return
+        if isinstance(content, str):
+            encoding, raw = 'utf-8', content.encode('utf-8', 'surrogatepass')
+        else:
+            encoding, raw = None, content
+        cached = CachedPage(cache_key(url), headers.get('etag'), headers.get('last-modified'),
+                            encoding, zlib.compress(raw, 6), len(raw), fresh_until)
+        with self._lock:
+            self._pending[cached.key] = (cached, time.time())
+            self.stats['stores'] += 1
+            if len(self._pending) >= self.flush_every:
+                self._flush()
+
+    def _revalidated(self, cached: CachedPage, headers) -> None:
+        """304 sonrası kaydın tazeliğini ve (gönderildiyse) yeni doğrulayıcılarını günceller"""
+        fresh_until = self._fresh_until(headers)
+        if fresh_until is None:
+            return
+        cached.fresh_until = fresh_until
+        cached.etag = headers.get('etag') or cached.etag
+        cached.last_modified = headers.get('last-modified') or cached.last_modified
+        with self._lock:
+            self._pending[cached.key] = (cached, time.time())
+            if len(self._pending) >= self.flush_every:
+                self._flush()
+
+    def _flush(self) -> None:
+        """Biriken kayıtları diske yazar (kilit altında çağrılmalı)"""
+        if not self._pending or self._conn is None:
+            return
+        self._conn.executemany(
+            'INSERT OR REPLACE INTO http_cache (url, etag, last_modified, encoding, body, size, fresh_until, validated) '
+            'VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+            [(key, cached.etag, cached.last_modified, cached.encoding, cached.body, cached.size,
+              cached.fresh_until, validated)
+             for key, (cached, validated) in self._pending.items()]
+        )
+        self._conn.commit()
+        self._pending.clear()
+
+    def flush(self) -> None:
+        """Biriken kayıtları diske yazar"""
+        with self._lock:
+            self._flush()
+
+    def summary(self) -> Dict[str, int]:
+        """İstatistiklerin bir kopyasını döndürür"""
+        with self._lock:
+            return dict(self.stats)
+
+    def close(self) -> None:
+        """Biriken kayıtları yazar ve veritabanını kapatır"""
+        with self._lock:
+            if self._conn is None:
+                return
+            self._flush()
+            self._conn.close()
+            self._conn = None
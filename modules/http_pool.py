@@ -0,0 +1,363 @@
+"""
+Spider Domain Crawler - Paylaşılan HTTP Bağlantı Havuzu Modülü
+
+Copyright (c) 2025 Hasan Yasin Yaşar
+Licensed under PSH 1.1 (Pasha Software License)
+"""
+
+import socket
+import threading
+import time
+from urllib.parse import urlparse
+from typing import Dict, Optional, Set
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.utils import select_proxy
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import NewConnectionError
+from urllib3.poolmanager import PoolManager
+from urllib3.util.connection import allowed_gai_family
+
+from . import metrics
+from .dns_cache import DNSCache, is_nxdomain
+
+
+class _TimedConnectionMixin:
+    """
+    Bağlantı kurulumunu dns/connect/tls aşamalarına ayırarak ölçer
+
+    Ölçüm açıkken host bir kez çözümlenir ve bulunan adreslere sırayla
+    bağlanılır; kapalıyken urllib3'ün kendi akışı aynen kullanılır.
+    """
+
+    _setup_seconds = 0.0
+
+    def _new_conn(self):
+        current = metrics.registry
+        if current is None:
+            return super()._new_conn()
+
+        start = time.perf_counter()
+        try:
+            addresses = socket.getaddrinfo(self._dns_host, self.port, allowed_gai_family(), socket.SOCK_STREAM)
+        except socket.gaierror:
+            current.observe('dns', time.perf_counter() - start, self.host)
+            # Hata urllib3'ün kendi istisnasıyla yükseltilsin
+            return super()._new_conn()
+        resolved = time.perf_counter()
+        current.observe('dns', resolved - start, self.host)
+
+        dns_host = self._dns_host
+        error = None
+        for address in addresses:
+            self._dns_host = address[4][0]
+            try:
+                sock = super()._new_conn()
+                break
+            except NewConnectionError as e:
+                error = e
+            finally:
+                self._dns_host = dns_host
+        else:
+            raise error
+
+        connected = time.perf_counter()
+        current.observe('connect', connected - resolved, self.host)
+        self._setup_seconds = connected - start
+        metrics.add_connect_time(self._setup_seconds)
+        return sock
+
+
+class _TimedHTTPConnection(_TimedConnectionMixin, HTTPConnection):
+    pass
+
+
+class _TimedHTTPSConnection(_TimedConnectionMixin, HTTPSConnection):
+
+    def connect(self):
+        current = metrics.registry
+        if current is None:
+            return super().connect()
+        self._setup_seconds = 0.0
+        start = time.perf_counter()
+        super().connect()
+        # Proxy üzerinden açılan tünelin (CONNECT) süresi de TLS'e dahildir
+        tls = time.perf_counter() - start - self._setup_seconds
+        current.observe('tls', tls, self._tunnel_host or self.host)
+        metrics.add_connect_time(tls)
+
+
+class _TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _TimedHTTPConnection
+
+
+class _TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _TimedHTTPSConnection
+
+
+_TIMED_POOL_CLASSES = {'http': _TimedHTTPConnectionPool, 'https': _TimedHTTPSConnectionPool}
+
+
+class _HostSizedPoolManager(PoolManager):
+    """Host bazlı maksimum bağlantı sayısı uygulayan PoolManager"""
+
+    def __init__(self, owner: 'ConnectionPool', *args, **kwargs):
+        self._owner = owner
+        super().__init__(*args, **kwargs)
+        self.pool_classes_by_scheme = _TIMED_POOL_CLASSES
+
+    def _new_pool(self, scheme, host, port, request_context=None):
+        if request_context is None:
+            request_context = self.connection_pool_kw.copy()
+        request_context['maxsize'] = self._owner.get_host_maxsize(host, request_context.get('maxsize'))
+        return super()._new_pool(scheme, host, port, request_context)
+
+
+class _PooledAdapter(HTTPAdapter):
+    """ConnectionPool'a bağlı transport adapter'ı"""
+
+    def __init__(self, owner: 'ConnectionPool'):
+        self._owner = owner
+        self._proxy_lock = threading.Lock()
+        super().__init__(pool_connections=owner.pool_connections, pool_maxsize=owner.pool_maxsize)
+
+    def init_poolmanager(self, connections, maxsize, block=False, **pool_kwargs):
+        self._pool_connections = connections
+        self._pool_maxsize = maxsize
+        self._pool_block = block
+        self.poolmanager = _HostSizedPoolManager(
+            self._owner, num_pools=connections, maxsize=maxsize, block=block, **pool_kwargs
+        )
+
+    def proxy_manager_for(self, proxy, **proxy_kwargs):
+        # Her proxy kendi havuzuna sahiptir; eşzamanlı ilk isteklerde havuz bir kez oluşturulur
+        with self._proxy_lock:
+            if proxy in self.proxy_manager:
+                return self.proxy_manager[proxy]
+            manager = super().proxy_manager_for(proxy, **proxy_kwargs)
+            if not proxy.lower().startswith('socks'):
+                manager.pool_classes_by_scheme = _TIMED_POOL_CLASSES
+            return manager
+
+    def send(self, request, **kwargs):
+        proxy = select_proxy(request.url, kwargs.get('proxies'))
+        self._owner._touch(request.url, proxy)
+        dns_cache = self._owner.dns_cache if proxy is None else None
+        host = (urlparse(request.url).hostname or '').lower()
+
+        if dns_cache is not None:
+            if dns_cache.peek(host) is False:
+                # Önbellekte çözümlenemeyen olarak kayıtlı host'a bağlantı denenmez
+                raise requests.exceptions.ConnectionError(
+                    socket.gaierror(f"DNS önbelleği: {host} çözümlenemiyor"), request=request
+                )
+
+        current = metrics.registry
+        if current is not None:
+            metrics.take_connect_time()
+            start = time.perf_counter()
+
+        try:
+            response = super().send(request, **kwargs)
+        except requests.exceptions.ConnectionError as e:
+            if dns_cache is not None and is_nxdomain(e):
+                # Sadece kesin NXDOMAIN cevabı saklanır; geçici DNS hataları önbelleğe yazılmaz
+                dns_cache.put(host, False)
+            if current is not None:
+                current.inc('errors', host=host)
+            raise
+        except requests.RequestException:
+            if current is not None:
+                current.inc('errors', host=host)
+            raise
+
+        if current is not None:
+            # Header'lar gelene kadar geçen süreden yeni bağlantının kurulumu düşülür
+            current.observe('ttfb', time.perf_counter() - start - metrics.take_connect_time(), host)
+            current.inc('requests', host=host)
+
+        if proxy is None:
+            # Proxy'siz yanıt alındıysa host DNS'te çözümlenmiş demektir
+            self._owner._mark_responded(request.url)
+        return response
+
+    def close(self):
+        # Session.close() paylaşılan havuzu kapatmaz; kapatma ConnectionPool.close() ile yapılır
+        pass
+
+
+class ConnectionPool:
+    """
+    Süreç genelinde paylaşılan HTTP bağlantı havuzu
+
+    Tek bir transport adapter'ı birden fazla ``requests.Session``'a mount edilir.
+    Böylece her session kendi header ayarlarını korurken aynı host'a
+    yapılan istekler (ana sayfa, iç sayfalar, detector'ın tekrar indirmesi)
+    açık keep-alive bağlantılarını tekrar kullanır. Doğrudan rota ve her
+    proxy ayrı bir havuza sahiptir; proxy istekle birlikte (``proxies=``)
+    verildiğinden rotasyon açık bağlantıları kapatmaz ve farklı proxy'ler
+    üzerinden eşzamanlı istekler aynı session'ı paylaşabilir. Uzun süre
+    kullanılmayan host havuzları ``idle_timeout`` sonunda kapatılır.
+    """
+
+    def __init__(self, pool_connections: int = None, pool_maxsize: int = None,
+                 host_maxsize: Dict[str, int] = None, idle_timeout: float = None,
+                 dns_cache: DNSCache = None):
+        """
+        ConnectionPool başlatıcı
+
+        Args:
+            pool_connections: Aynı anda açık tutulacak maksimum host havuzu sayısı
+            pool_maxsize: Host başına varsayılan maksimum bağlantı sayısı
+            host_maxsize: Belirli host'lar için maksimum bağlantı sayısı (örn: {'example.com': 2})
+            idle_timeout: Bu süre (saniye) boyunca kullanılmayan host havuzu kapatılır
+            dns_cache: Verilirse proxy'siz isteklerde DNS sonuçları buraya yazılır ve
+                çözümlenemeyen olarak kayıtlı host'lara istek gönderilmez
+        """
+        from .config import HTTP_POOL_CONNECTIONS, HTTP_POOL_MAXSIZE, HTTP_POOL_IDLE_TIMEOUT
+        self.pool_connections = HTTP_POOL_CONNECTIONS if pool_connections is None else pool_connections
+        self.pool_maxsize = HTTP_POOL_MAXSIZE if pool_maxsize is None else pool_maxsize
+        self.idle_timeout = HTTP_POOL_IDLE_TIMEOUT if idle_timeout is None else idle_timeout
+        self.host_maxsize = {host.lower(): size for host, size in (host_maxsize or {}).items()}
+        self.dns_cache = dns_cache
+
+        self._lock = threading.Lock()
+        self._last_used: Dict[str, float] = {}
+        self._responded_hosts: Set[str] = set()
+        self._last_eviction = time.monotonic()
+        self._evicted = {'requests': 0, 'connections': 0, 'pools': 0}
+        self.adapter = _PooledAdapter(self)
+
+    def get_host_maxsize(self, host: str, default: int = None) -> int:
+        """Host için maksimum bağlantı sayısını döndürür"""
+        host = (host or '').lower()
+        return self.host_maxsize.get(host, self.pool_maxsize if default is None else default)
+
+    def set_host_maxsize(self, host: str, maxsize: int) -> None:
+        """Host için maksimum bağlantı sayısını ayarlar (yeni açılacak havuzlara uygulanır)"""
+        self.host_maxsize[host.lower()] = maxsize
+
+    def mount(self, session: requests.Session) -> requests.Session:
+        """
+        Paylaşılan adapter'ı session'a bağlar
+
+        Args:
+            session: Bağlantı havuzunu kullanacak session
+
+        Returns:
+            Aynı session
+        """
+        session.mount('http://', self.adapter)
+        session.mount('https://', self.adapter)
+        return session
+
+    def session(self) -> requests.Session:
+        """Paylaşılan havuzu kullanan yeni bir session oluşturur"""
+        return self.mount(requests.Session())
+
+    def _touch(self, url: str, proxy: Optional[str] = None) -> None:
+        """Host'un son kullanım zamanını günceller ve gerekirse boşta kalan havuzları kapatır"""
+        now = time.monotonic()
+        with self._lock:
+            for used in (url, proxy):
+                if used:
+                    self._last_used[(urlparse(used).hostname or '').lower()] = now
+            due = now - self._last_eviction >= self.idle_timeout
+            if due:
+                self._last_eviction = now
+        if due:
+            self.evict_idle()
+
+    def _mark_responded(self, url: str) -> None:
+        """Doğrudan (proxy'siz) yanıt alınan host'u kaydeder"""
+        host = (urlparse(url).hostname or '').lower()
+        if not host:
+            return
+        with self._lock:
+            if host in self._responded_hosts:
+                return
+            self._responded_hosts.add(host)
+        if self.dns_cache is not None:
+            self.dns_cache.put(host, True)
+
+    def has_responded(self, host: str) -> bool:
+        """Host'tan daha önce doğrudan bir HTTP yanıtı alındıysa True döndürür"""
+        with self._lock:
+            return host.lower() in self._responded_hosts
+
+    def _pool_managers(self):
+        """Adapter'ın doğrudan ve proxy üzerinden kullandığı PoolManager'lar"""
+        return [self.adapter.poolmanager] + list(self.adapter.proxy_manager.values())
+
+    def evict_idle(self) -> int:
+        """
+        ``idle_timeout`` süresince kullanılmayan host havuzlarını kapatır
+
+        Returns:
+            Kapatılan havuz sayısı
+        """
+        now = time.monotonic()
+        evicted = 0
+        for manager in self._pool_managers():
+            for key in list(manager.pools.keys()):
+                host = (key.key_host or '').lower()
+                with self._lock:
+                    idle = now - self._last_used.get(host, 0) >= self.idle_timeout
+                if not idle:
+                    continue
+                pool = manager.pools.get(key)
+                if pool is None:
+                    continue
+                with self._lock:
+                    self._evicted['requests'] += pool.num_requests
+                    self._evicted['connections'] += pool.num_connections
+                    self._evicted['pools'] += 1
+                # RecentlyUsedContainer silinen havuzu kapatır
+                manager.pools.pop(key, None)
+                evicted += 1
+        return evicted
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Bağlantı tekrar kullanım istatistiklerini döndürür
+
+        Returns:
+            requests: Havuz üzerinden yapılan istek sayısı
+            connections: Açılan yeni bağlantı sayısı
+            reused: Açık bağlantı üzerinden yapılan istek sayısı
+            reuse_ratio: reused / requests
+            open_pools: Şu an açık host havuzu sayısı
+            evicted_pools: Boşta kaldığı için kapatılan havuz sayısı
+            proxy_routes: Havuzu açılmış proxy sayısı
+        """
+        with self._lock:
+            total_requests = self._evicted['requests']
+            total_connections = self._evicted['connections']
+            evicted_pools = self._evicted['pools']
+
+        open_pools = 0
+        for manager in self._pool_managers():
+            for key in list(manager.pools.keys()):
+                pool = manager.pools.get(key)
+                if pool is None:
+                    continue
+                open_pools += 1
+                total_requests += pool.num_requests
+                total_connections += pool.num_connections
+
+        reused = max(0, total_requests - total_connections)
+        return {
+            'requests': total_requests,
+            'connections': total_connections,
+            'reused': reused,
+            'reuse_ratio': reused / total_requests if total_requests else 0.0,
+            'open_pools': open_pools,
+            'evicted_pools': evicted_pools,
+            'proxy_routes': len(self.adapter.proxy_manager)
+        }
+
+    def close(self) -> None:
+        """Tüm açık bağlantıları kapatır"""
+        HTTPAdapter.close(self.adapter)
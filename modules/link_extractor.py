@@ -0,0 +1,114 @@
+"""
+Spider Domain Crawler - Akışlı Link Çıkarıcı Modülü
+
+Parse ağacı kurmadan, HTML tokenize edilirken ilgili etiketlerin href/src
+attribute'larını toplar. BeautifulSoup'un 'html.parser' builder'ı ile aynı
+tokenizer'ı kullandığı için ``PageData.from_soup`` ile aynı sonucu üretir.
+
+Copyright (c) 2025 Hasan Yasin Yaşar
+Licensed under PSH 1.1 (Pasha Software License)
+"""
+
+import codecs
+from html.parser import HTMLParser
+from urllib.parse import urljoin
+from typing import List, Optional, Union
+
+from bs4.dammit import UnicodeDammit
+
+from .page_pipeline import LINK_TAGS, ASSET_TAGS, PageData
+
+
+class LinkExtractor(HTMLParser):
+    """
+    Olay tabanlı, tek geçişli link çıkarıcı
+
+    İçerik ``feed`` ile parça parça verilebilir; her parça geldikçe tokenize
+    edilir ve sadece a/link/img/script etiketlerinin URL attribute'ları tutulur.
+    ``close`` çağrıldığında sonuç ``PageData`` olarak döner.
+
+    Bytes verilirse ve ``encoding`` biliniyorsa parçalar artımlı decode edilir.
+    Encoding bilinmiyorsa BeautifulSoup ile aynı sonucu vermek için bytes
+    ``close``'a kadar biriktirilir ve UnicodeDammit ile decode edilir.
+    """
+
+    def __init__(self, base_url: str, encoding: Optional[str] = None):
+        """
+        LinkExtractor başlatıcı
+
+        Args:
+            base_url: Relative URL'ler için temel URL
+            encoding: Bytes parçalarının encoding'i (bilinmiyorsa None)
+        """
+        super().__init__(convert_charrefs=False)
+        self.base_url = base_url
+        self.links: List[str] = []
+        self.assets: List[str] = []
+        self._decoder = codecs.getincrementaldecoder(encoding)('replace') if encoding else None
+        self._pending: List[bytes] = []
+
+    def handle_starttag(self, tag, attrs):
+        if tag in LINK_TAGS:
+            name, target = LINK_TAGS[tag], self.links
+        elif tag in ASSET_TAGS:
+            name, target = ASSET_TAGS[tag], self.assets
+        else:
+            return
+
+        # Tekrarlanan attribute'larda BeautifulSoup gibi son değer geçerlidir
+        value = None
+        for attr, attr_value in attrs:
+            if attr == name:
+                value = attr_value
+
+        if value is None:
+            return
+        value = value.strip()
+        if value:
+            # Relative URL'leri absolute'a çevir
+            target.append(urljoin(self.base_url, value))
+
+    def feed(self, data: Union[str, bytes]) -> None:
+        """
+        Bir içerik parçasını işler
+
+        Args:
+            data: HTML parçası (str veya bytes)
+        """
+        if isinstance(data, str):
+            super().feed(data)
+        elif self._decoder is not None:
+            super().feed(self._decoder.decode(data))
+        else:
+            self._pending.append(data)
+
+    def close(self) -> PageData:
+        """
+        Kalan içeriği işler ve sonucu döndürür
+
+        Returns:
+            PageData objesi
+        """
+        if self._decoder is not None:
+            super().feed(self._decoder.decode(b'', final=True))
+        elif self._pending:
+            super().feed(UnicodeDammit(b''.join(self._pending), is_html=True).unicode_markup or '')
+            self._pending = []
+        super().close()
+        return PageData(self.base_url, self.links, self.assets)
+
+
+def extract_page_data(content: Union[str, bytes], base_url: str) -> PageData:
+    """
+    Tam bir HTML içeriğinden tek geçişte PageData üretir
+
+    Args:
+        content: Sayfanın içeriği (decode edilmiş str veya ham bytes)
+        base_url: Relative URL'ler için temel URL
+
+    Returns:
+        PageData objesi
+    """
+    extractor = LinkExtractor(base_url)
+    extractor.feed(content)
+    return extractor.close()
@@ -0,0 +1,338 @@
+"""
+Spider Domain Crawler - Metrik Modülü
+
+Copyright (c) 2025 Hasan Yasin Yaşar
+Licensed under PSH 1.1 (Pasha Software License)
+"""
+
+import functools
+import json
+import os
+import threading
+import time
+from bisect import bisect_left
+from typing import Callable, Dict, List, Optional
+
+# Histogram üst sınırları (saniye); son kova +Inf
+BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Özet tablosundaki aşama sırası (istek yaşam döngüsüne göre)
+STAGES = ('dns', 'connect', 'tls', 'ttfb', 'body', 'parse', 'extract', 'url_validation',
+          'domain_blocking', 'domain_validation')
+
+# Etkin kayıt defteri; None ise ölçüm yapılmaz (çağrı noktaları sadece bunu kontrol eder)
+registry: Optional['MetricsRegistry'] = None
+
+# Bu thread'de devam eden istek için açılan bağlantının süresi (TTFB'den düşülür)
+_connect_time = threading.local()
+
+
+class Histogram:
+    """Sabit kovalı gecikme histogramı"""
+
+    __slots__ = ('counts', 'sum', 'count')
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, seconds: float) -> None:
+        self.counts[bisect_left(BUCKETS, seconds)] += 1
+        self.sum += seconds
+        self.count += 1
+
+    def quantile(self, q: float) -> float:
+        """Yüzdeliğin tahmini (kova içinde doğrusal interpolasyon, +Inf kovasında son sınır)"""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for index, count in enumerate(self.counts):
+            if count and seen + count >= rank:
+                if index == len(BUCKETS):
+                    return BUCKETS[-1]
+                lower = BUCKETS[index - 1] if index else 0.0
+                return lower + (BUCKETS[index] - lower) * (rank - seen) / count
+            seen += count
+        return BUCKETS[-1]
+
+
+def _escape(value: str) -> str:
+    """Prometheus etiket değerini escape eder"""
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+class MetricsRegistry:
+    """
+    Sayaç ve gecikme histogramları
+
+    Her aşama (dns, connect, tls, ttfb, body, parse, ...) için bir histogram,
+    olaylar (requests, errors, bytes, ...) için sayaçlar tutulur. Host
+    verilen ölçümler ayrıca host bazlı toplamlara (sayı ve toplam süre)
+    eklenir. ``path`` verilirse anlık görüntü ``interval`` saniyede bir
+    arka planda dosyaya yazılır: ``.json`` uzantılı dosyalar JSON, diğerleri
+    Prometheus metin formatında. Thread-safe'dir.
+    """
+
+    def __init__(self, path: str = None, interval: float = None):
+        """
+        MetricsRegistry başlatıcı
+
+        Args:
+            path: Anlık görüntünün yazılacağı dosya (None ise dosyaya yazılmaz)
+            interval: Dosyaya yazma aralığı, saniye (varsayılan: config.METRICS_DUMP_INTERVAL)
+        """
+        from .config import METRICS_DUMP_INTERVAL
+        self.path = path
+        self.interval = METRICS_DUMP_INTERVAL if interval is None else interval
+        self.started = time.time()
+
+        self._lock = threading.Lock()
+        self.counters: Dict[str, int] = {}
+        self.histograms: Dict[str, Histogram] = {}
+        # host -> {aşama: [sayı, toplam süre]}, host -> {olay: değer}
+        self.host_stages: Dict[str, Dict[str, List[float]]] = {}
+        self.host_counters: Dict[str, Dict[str, int]] = {}
+
+        self._stop = threading.Event()
+        self._dumper = None
+        if path is not None and self.interval > 0:
+            self._dumper = threading.Thread(target=self._dump_loop, name='metrics-dump', daemon=True)
+            self._dumper.start()
+
+    def inc(self, name: str, value: int = 1, host: str = None) -> None:
+        """
+        Sayacı artırır
+
+        Args:
+            name: Olay adı
+            value: Artış miktarı
+            host: Verilirse host bazlı sayaç da artırılır
+        """
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+            if host is not None:
+                counters = self.host_counters.get(host)
+                if counters is None:
+                    counters = self.host_counters[host] = {}
+                counters[name] = counters.get(name, 0) + value
+
+    def observe(self, stage: str, seconds: float, host: str = None) -> None:
+        """
+        Aşamanın süresini kaydeder
+
+        Args:
+            stage: Aşama adı
+            seconds: Süre (saniye)
+            host: Verilirse host bazlı toplamlara da eklenir
+        """
+        with self._lock:
+            histogram = self.histograms.get(stage)
+            if histogram is None:
+                histogram = self.histograms[stage] = Histogram()
+            histogram.observe(seconds)
+            if host is not None:
+                stages = self.host_stages.get(host)
+                if stages is None:
+                    stages = self.host_stages[host] = {}
+                total = stages.get(stage)
+                if total is None:
+                    stages[stage] = [1, seconds]
+                else:
+                    total[0] += 1
+                    total[1] += seconds
+
+    def snapshot(self) -> Dict:
+        """Tüm metriklerin JSON'a yazılabilir kopyası"""
+        with self._lock:
+            return {
+                'started': self.started,
+                'timestamp': time.time(),
+                'buckets': list(BUCKETS),
+                'counters': dict(self.counters),
+                'stages': {stage: {'count': histogram.count, 'sum': histogram.sum,
+                                   'buckets': list(histogram.counts)}
+                           for stage, histogram in self.histograms.items()},
+                'hosts': {host: {'stages': {stage: {'count': total[0], 'sum': total[1]}
+                                            for stage, total in self.host_stages.get(host, {}).items()},
+                                 'counters': dict(self.host_counters.get(host, {}))}
+                          for host in set(self.host_stages) | set(self.host_counters)}
+            }
+
+    def to_prometheus(self) -> str:
+        """Anlık görüntüyü Prometheus metin formatında döndürür"""
+        snapshot = self.snapshot()
+        lines = ['# TYPE spider_stage_seconds histogram']
+        for stage, data in sorted(snapshot['stages'].items()):
+            cumulative = 0
+            for bound, count in zip(list(BUCKETS) + ['+Inf'], data['buckets']):
+                cumulative += count
+                lines.append(f'spider_stage_seconds_bucket{{stage="{stage}",le="{bound}"}} {cumulative}')
+            lines.append(f'spider_stage_seconds_sum{{stage="{stage}"}} {data["sum"]:.6f}')
+            lines.append(f'spider_stage_seconds_count{{stage="{stage}"}} {data["count"]}')
+
+        lines.append('# TYPE spider_events_total counter')
+        for name, value in sorted(snapshot['counters'].items()):
+            lines.append(f'spider_events_total{{event="{name}"}} {value}')
+
+        lines.append('# TYPE spider_host_stage_seconds summary')
+        for host, data in sorted(snapshot['hosts'].items()):
+            label = _escape(host)
+            for stage, total in sorted(data['stages'].items()):
+                lines.append(f'spider_host_stage_seconds_sum{{host="{label}",stage="{stage}"}} {total["sum"]:.6f}')
+                lines.append(f'spider_host_stage_seconds_count{{host="{label}",stage="{stage}"}} {total["count"]}')
+
+        lines.append('# TYPE spider_host_events_total counter')
+        for host, data in sorted(snapshot['hosts'].items()):
+            label = _escape(host)
+            for name, value in sorted(data['counters'].items()):
+                lines.append(f'spider_host_events_total{{host="{label}",event="{name}"}} {value}')
+        return '\n'.join(lines) + '\n'
+
+    def dump(self, path: str = None) -> str:
+        """
+        Anlık görüntüyü dosyaya yazar (yarım dosya okunmasın diye önce geçici dosyaya)
+
+        Args:
+            path: Hedef dosya (varsayılan: başlatıcıda verilen path)
+
+        Returns:
+            Yazılan dosya yolu
+        """
+        path = path or self.path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        if path.endswith('.json'):
+            content = json.dumps(self.snapshot(), ensure_ascii=False)
+        else:
+            content = self.to_prometheus()
+        temp_path = f"{path}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        os.replace(temp_path, path)
+        return path
+
+    def _dump_loop(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.dump()
+
+    def summary_rows(self) -> List[Dict]:
+        """Aşama bazlı özet: sayı, toplam süre, ortalama, p50, p99 (saniye)"""
+        with self._lock:
+            histograms = dict(self.histograms)
+        order = {stage: index for index, stage in enumerate(STAGES)}
+        rows = []
+        for stage in sorted(histograms, key=lambda name: (order.get(name, len(order)), name)):
+            histogram = histograms[stage]
+            rows.append({'stage': stage, 'count': histogram.count, 'total': histogram.sum,
+                         'mean': histogram.sum / histogram.count if histogram.count else 0.0,
+                         'p50': histogram.quantile(0.50), 'p99': histogram.quantile(0.99)})
+        return rows
+
+    def top_hosts(self, limit: int = 10) -> List[Dict]:
+        """Toplam istek süresine göre en yavaş host'lar"""
+        with self._lock:
+            rows = []
+            for host, stages in self.host_stages.items():
+                counters = self.host_counters.get(host, {})
+                rows.append({'host': host, 'requests': counters.get('requests', 0),
+                             'errors': counters.get('errors', 0), 'bytes': counters.get('bytes', 0),
+                             'seconds': sum(total[1] for total in stages.values())})
+        rows.sort(key=lambda row: row['seconds'], reverse=True)
+        return rows[:limit]
+
+    def close(self) -> None:
+        """Arka plan yazıcısını durdurur ve son anlık görüntüyü yazar"""
+        self._stop.set()
+        if self._dumper is not None:
+            self._dumper.join()
+            self._dumper = None
+        if self.path is not None:
+            self.dump()
+
+
+def enable(path: str = None, interval: float = None) -> MetricsRegistry:
+    """
+    Ölçümü başlatır
+
+    Args:
+        path: Anlık görüntünün periyodik olarak yazılacağı dosya
+        interval: Yazma aralığı (saniye)
+
+    Returns:
+        Etkin kayıt defteri
+    """
+    global registry
+    disable()
+    registry = MetricsRegistry(path, interval)
+    return registry
+
+
+def disable() -> None:
+    """Ölçümü durdurur (dosya verilmişse son anlık görüntü yazılır)"""
+    global registry
+    current, registry = registry, None
+    if current is not None:
+        current.close()
+
+
+def timed(stage: str) -> Callable:
+    """
+    Fonksiyonun süresini ``stage`` aşamasına kaydeden dekoratör
+
+    Ölçüm kapalıyken sadece ``registry`` kontrolü yapılır.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            current = registry
+            if current is None:
+                return func(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                current.observe(stage, time.perf_counter() - start)
+        return wrapper
+    return decorator
+
+
+def add_connect_time(seconds: float) -> None:
+    """Bu thread'de açılan bağlantının süresini (dns + connect + tls) biriktirir"""
+    _connect_time.value = getattr(_connect_time, 'value', 0.0) + seconds
+
+
+def take_connect_time() -> float:
+    """Biriken bağlantı süresini döndürür ve sıfırlar"""
+    value = getattr(_connect_time, 'value', 0.0)
+    _connect_time.value = 0.0
+    return value
+
+
+def print_summary(current: MetricsRegistry, hosts: int = 10) -> None:
+    """
+    Aşama ve host bazlı özet tabloyu yazdırır
+
+    Args:
+        current: Kayıt defteri
+        hosts: Gösterilecek en yavaş host sayısı
+    """
+    print(f"\n📈 AŞAMA SÜRELERİ:")
+    print(f"   {'aşama':<18} {'sayı':>8} {'toplam sn':>10} {'ort. ms':>9} {'p50 ms':>9} {'p99 ms':>9}")
+    for row in current.summary_rows():
+        print(f"   {row['stage']:<18} {row['count']:>8} {row['total']:>10.2f} {row['mean'] * 1000:>9.2f} "
+              f"{row['p50'] * 1000:>9.1f} {row['p99'] * 1000:>9.1f}")
+
+    counters = current.counters
+    if counters:
+        print(f"   Olaylar: " + ', '.join(f"{name}={value}" for name, value in sorted(counters.items())))
+
+    top = current.top_hosts(hosts)
+    if top:
+        print(f"\n🐢 En yavaş {len(top)} host:")
+        print(f"   {'host':<40} {'istek':>6} {'hata':>5} {'KB':>8} {'süre sn':>8}")
+        for row in top:
+            print(f"   {row['host'][:40]:<40} {row['requests']:>6} {row['errors']:>5} "
+                  f"{row['bytes'] / 1024:>8.0f} {row['seconds']:>8.2f}")
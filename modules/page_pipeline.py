@@ -0,0 +1,212 @@
+"""
+Spider Domain Crawler - Sayfa Pipeline Modülü
+
+Bir sayfayı tek seferde indirip parse eder; hem URLCrawler'ın takip ettiği
+linkleri hem de DomainDetector'ın domain çıkardığı kaynakları (a/link/img/script)
+aynı yanıttan üretir.
+
+Copyright (c) 2025 Hasan Yasin Yaşar
+Licensed under PSH 1.1 (Pasha Software License)
+"""
+
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ProcessPoolExecutor
+from urllib.parse import urljoin
+from typing import Callable, Dict, List, Optional, Union
+
+from bs4 import BeautifulSoup
+
+from . import metrics
+from .retry import RetryLater
+from .url_record import parse_url
+
+# Etiket -> URL içeren attribute eşlemesi
+LINK_TAGS = {'a': 'href', 'link': 'href'}
+ASSET_TAGS = {'img': 'src', 'script': 'src'}
+
+
+class PageData:
+    """Bir sayfadan çıkarılmış absolute URL listeleri"""
+
+    __slots__ = ('url', 'links', 'assets')
+
+    def __init__(self, url: str, links: List[str], assets: List[str]):
+        """
+        Args:
+            url: Sayfanın URL'i
+            links: <a href> ve <link href> kaynaklı absolute URL'ler
+            assets: <img src> ve <script src> kaynaklı absolute URL'ler
+        """
+        self.url = url
+        self.links = links
+        self.assets = assets
+
+    @property
+    def all_urls(self) -> List[str]:
+        """Sayfadaki tüm absolute URL'ler"""
+        return self.links + self.assets
+
+    @classmethod
+    def from_soup(cls, soup: BeautifulSoup, base_url: str) -> 'PageData':
+        """Parse edilmiş sayfadan tek geçişte link ve kaynak listelerini çıkarır"""
+        links = []
+        assets = []
+
+        for tag in soup.find_all(list(LINK_TAGS) + list(ASSET_TAGS)):
+            if tag.name in LINK_TAGS:
+                value, target = tag.get(LINK_TAGS[tag.name]), links
+            else:
+                value, target = tag.get(ASSET_TAGS[tag.name]), assets
+
+            if value is None:
+                continue
+            value = value.strip()
+            if value:
+                # Relative URL'leri absolute'a çevir
+                target.append(urljoin(base_url, value))
+
+        return cls(base_url, links, assets)
+
+
+def parse_page(content: Union[str, bytes], base_url: str) -> PageData:
+    """
+    HTML içeriğinden tek geçişte PageData üretir
+
+    Parse ağacı kurulmaz; linkler tokenize sırasında toplanır.
+
+    Args:
+        content: Sayfanın içeriği (decode edilmiş str veya ham bytes)
+        base_url: Relative URL'ler için temel URL
+
+    Returns:
+        PageData objesi
+    """
+    from .link_extractor import extract_page_data
+    return extract_page_data(content, base_url)
+
+
+class PagePipeline:
+    """
+    Paylaşılan indirme/parse pipeline'ı
+
+    Aynı URL için yapılan istekler tek bir indirmede birleştirilir: URL daha
+    önce işlendiyse sonuç önbellekten döner, o anda indiriliyorsa bekleyen
+    çağrılar aynı sonucu paylaşır. Önbellek kanonik URL'ye göre tutulur; aynı
+    sayfanın farklı yazımları (``http://a.com`` ve ``http://A.com/``) tek
+    girdiyi paylaşır. Önbellekte sadece kompakt link listeleri
+    tutulur, sayfa içeriği veya parse ağacı saklanmaz.
+
+    ``parse_workers`` verilirse HTML parse işlemi bir process pool'da yapılır:
+    worker'a ham içerik ve temel URL gider, geriye sadece link listeleri döner.
+    """
+
+    def __init__(self, max_cached_pages: int = None, parse_workers: int = None):
+        """
+        PagePipeline başlatıcı
+
+        Args:
+            max_cached_pages: Önbellekte tutulacak maksimum sayfa sayısı (LRU)
+            parse_workers: Parse için kullanılacak process sayısı (0: aynı thread'de parse et)
+        """
+        from .config import PAGE_CACHE_SIZE, PARSE_WORKERS
+        if max_cached_pages is None:
+            max_cached_pages = PAGE_CACHE_SIZE
+        if parse_workers is None:
+            parse_workers = PARSE_WORKERS
+
+        self.max_cached_pages = max_cached_pages
+        self.parse_workers = parse_workers
+        self._parse_pool: Optional[ProcessPoolExecutor] = None
+        self._cache: 'OrderedDict[str, Optional[PageData]]' = OrderedDict()
+        self._inflight: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self.stats = {
+            'fetches': 0,
+            'cache_hits': 0,
+            'coalesced': 0
+        }
+
+    def get(self, url: str, fetch_content: Callable[[str], Optional[Union[str, bytes]]]) -> Optional[PageData]:
+        """
+        URL'nin PageData'sını döndürür, gerekirse indirir
+
+        Args:
+            url: Sayfa URL'i
+            fetch_content: Önbellekte yoksa çağrılacak indirme fonksiyonu
+                (URL alır, HTML içeriği veya None döndürür)
+
+        Returns:
+            PageData veya sayfa alınamadıysa None
+
+        Raises:
+            RetryLater: Sayfa daha sonra tekrar denenecek (sonuç önbelleğe yazılmaz)
+        """
+        record = parse_url(url)
+        key = record.url if record is not None else url
+        with self._lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                self.stats['cache_hits'] += 1
+                return self._cache[key]
+
+            future = self._inflight.get(key)
+            if future is not None:
+                self.stats['coalesced'] += 1
+                owner = False
+            else:
+                future = Future()
+                self._inflight[key] = future
+                self.stats['fetches'] += 1
+                owner = True
+
+        if not owner:
+            return future.result()
+
+        page = None
+        retry = None
+        try:
+            content = fetch_content(url)
+            if content is not None:
+                page = self.parse(content, url)
+        except RetryLater as e:
+            retry = e
+            raise
+        finally:
+            with self._lock:
+                # Ertelenen sayfa önbelleğe yazılmaz; bir sonraki çağrı tekrar indirir
+                if retry is None:
+                    self._store(key, page)
+                del self._inflight[key]
+            if retry is None:
+                future.set_result(page)
+            else:
+                future.set_exception(retry)
+
+        return page
+
+    @metrics.timed('parse')
+    def parse(self, content: Union[str, bytes], base_url: str) -> PageData:
+        """İçeriği yapılandırmaya göre yerinde veya process pool'da parse eder"""
+        if self.parse_workers <= 0:
+            return parse_page(content, base_url)
+
+        with self._lock:
+            if self._parse_pool is None:
+                self._parse_pool = ProcessPoolExecutor(max_workers=self.parse_workers)
+            pool = self._parse_pool
+
+        return pool.submit(parse_page, content, base_url).result()
+
+    def close(self) -> None:
+        """Parse process pool'unu kapatır"""
+        with self._lock:
+            pool, self._parse_pool = self._parse_pool, None
+        if pool is not None:
+            pool.shutdown()
+
+    def _store(self, url: str, page: Optional[PageData]) -> None:
+        """Sonucu LRU önbelleğe yazar (kilit altında çağrılmalı)"""
+        self._cache[url] = page
+        while len(self._cache) > self.max_cached_pages:
+            self._cache.popitem(last=False)
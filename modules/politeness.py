@@ -0,0 +1,248 @@
+"""
+Spider Domain Crawler - Politeness (Nezaket) Zamanlayıcı Modülü
+
+Copyright (c) 2025 Hasan Yasin Yaşar
+Licensed under PSH 1.1 (Pasha Software License)
+"""
+
+import threading
+import time
+from urllib.parse import urlparse
+from typing import Dict
+
+
+class HostScheduler:
+    """
+    Host bazlı istek zamanlayıcısı
+
+    Aynı host'a yapılan ardışık istekler arasında minimum bekleme süresini
+    uygular. Farklı host'lara yapılan istekler birbirini beklemez; böylece
+    toplam süre sayfa sayısına değil en yoğun host'a göre ölçeklenir.
+    Thread-safe'dir, crawler ve detector arasında paylaşılabilir.
+
+    ``adaptive`` açıksa host'un istek hızı AIMD ile ayarlanır: sağlıklı her
+    yanıtta hız (istek/sn) sabit miktarda artırılır; 429/503, zaman aşımı
+    veya TTFB'nin host'un en iyi değerinin belirgin üstüne çıkması hızı
+    çarpımsal olarak düşürür. Bekleme süresi her zaman MIN_DELAY/MAX_DELAY
+    ve varsa robots.txt Crawl-delay değeriyle sınırlıdır.
+    """
+
+    def __init__(self, delay: float = None, min_delay: float = None, max_delay: float = None,
+                 adaptive: bool = None):
+        """
+        HostScheduler başlatıcı
+
+        Args:
+            delay: Host başına varsayılan (uyarlamalı modda başlangıç) bekleme süresi (saniye)
+            min_delay: İzin verilen minimum bekleme süresi (varsayılan: config.MIN_DELAY)
+            max_delay: İzin verilen maksimum bekleme süresi (varsayılan: config.MAX_DELAY)
+            adaptive: Host hızlarını yanıtlara göre ayarla (varsayılan: config.ADAPTIVE_DELAY)
+        """
+        from .config import (DEFAULT_DELAY, MIN_DELAY, MAX_DELAY, ADAPTIVE_DELAY, ADAPTIVE_RATE_INCREASE,
+                             ADAPTIVE_BACKOFF, ADAPTIVE_LATENCY_FACTOR, ADAPTIVE_COOLDOWN)
+
+        self.min_delay = MIN_DELAY if min_delay is None else min_delay
+        self.max_delay = MAX_DELAY if max_delay is None else max_delay
+        self.default_interval = self._clamp(DEFAULT_DELAY if delay is None else delay)
+        self.adaptive = ADAPTIVE_DELAY if adaptive is None else adaptive
+        self.rate_increase = ADAPTIVE_RATE_INCREASE
+        self.backoff = ADAPTIVE_BACKOFF
+        self.latency_factor = ADAPTIVE_LATENCY_FACTOR
+        self.cooldown = ADAPTIVE_COOLDOWN
+
+        self._intervals: Dict[str, float] = {}
+        self._next_slot: Dict[str, float] = {}
+        # robots.txt Crawl-delay alt sınırları
+        self._floors: Dict[str, float] = {}
+        # host -> [TTFB EWMA, en düşük EWMA, kalan bekleme yanıtı, artış sayısı, azaltma sayısı]
+        self._feedback: Dict[str, list] = {}
+        self._lock = threading.Lock()
+
+    def _clamp(self, interval: float, host: str = None) -> float:
+        """Bekleme süresini MIN_DELAY/MAX_DELAY aralığına (ve host'un alt sınırına) sıkıştırır"""
+        interval = max(self.min_delay, min(self.max_delay, interval))
+        if host is not None:
+            interval = max(interval, self._floors.get(host, 0.0))
+        return interval
+
+    @staticmethod
+    def host_key(url: str) -> str:
+        """URL'den zamanlama anahtarı olarak kullanılan host'u çıkarır"""
+        if '://' not in url:
+            return url.lower()
+        return urlparse(url).netloc.lower()
+
+    def set_interval(self, host: str, interval: float) -> None:
+        """Belirli bir host için bekleme süresini ayarlar"""
+        with self._lock:
+            self._intervals[host] = self._clamp(interval, host)
+
+    def set_min_interval(self, host: str, interval: float) -> None:
+        """
+        Host için alt sınır koyar (örn. robots.txt Crawl-delay); uyarlamalı hız bunun altına inmez
+
+        Args:
+            host: Host anahtarı
+            interval: Minimum bekleme süresi (saniye, MAX_DELAY ile sınırlı)
+        """
+        with self._lock:
+            self._floors[host] = min(self.max_delay, interval)
+            self._intervals[host] = self._clamp(self._intervals.get(host, self.default_interval), host)
+
+    def get_interval(self, host: str) -> float:
+        """Host için geçerli bekleme süresini döndürür"""
+        return self._intervals.get(host, self.default_interval)
+
+    def reserve(self, url: str) -> float:
+        """
+        Host için bir sonraki istek zamanını ayırır
+
+        Args:
+            url: İstek yapılacak URL (veya doğrudan host)
+
+        Returns:
+            İstek yapılmadan önce beklenmesi gereken süre (saniye)
+        """
+        host = self.host_key(url)
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(host, now))
+            self._next_slot[host] = slot + self.get_interval(host)
+        return slot - now
+
+    def hold(self, url: str, seconds: float) -> None:
+        """
+        Host'a ``seconds`` boyunca istek yapılmasını engeller (örn. Retry-After)
+
+        Args:
+            url: İstek yapılan URL (veya doğrudan host)
+            seconds: Bekleme süresi
+        """
+        host = self.host_key(url)
+        with self._lock:
+            until = time.monotonic() + seconds
+            if until > self._next_slot.get(host, 0.0):
+                self._next_slot[host] = until
+
+    def record_response(self, url: str, status: int, latency: float) -> None:
+        """
+        Yanıtı uyarlamalı hız kontrolüne bildirir (adaptive kapalıysa bir şey yapmaz)
+
+        Args:
+            url: İstek yapılan URL
+            status: HTTP durum kodu
+            latency: İlk byte'a kadar geçen süre (saniye)
+        """
+        if not self.adaptive:
+            return
+        host = self.host_key(url)
+        with self._lock:
+            feedback = self._feedback_for(host, latency)
+            if status in (429, 503):
+                self._slow_down(host, feedback)
+                return
+
+            ewma, best = feedback[0], feedback[1]
+            feedback[0] = ewma = ewma + 0.3 * (latency - ewma)
+            # En iyi değer yavaşça yükselir; kalıcı olarak yavaşlayan host sürekli cezalandırılmaz
+            feedback[1] = best = min(best * 1.01, ewma)
+            if feedback[2] > 0:
+                # Son azaltmanın etkisi görülene kadar bekle
+                feedback[2] -= 1
+            elif ewma > best * self.latency_factor and ewma - best > 0.05:
+                self._slow_down(host, feedback)
+            elif status < 400:
+                self._speed_up(host, feedback)
+
+    def record_timeout(self, url: str) -> None:
+        """Zaman aşımını uyarlamalı hız kontrolüne bildirir"""
+        if not self.adaptive:
+            return
+        host = self.host_key(url)
+        with self._lock:
+            self._slow_down(host, self._feedback_for(host, None))
+
+    def _feedback_for(self, host: str, latency) -> list:
+        """Host'un geri bildirim kaydını döndürür (kilit altında çağrılmalı)"""
+        feedback = self._feedback.get(host)
+        if feedback is None:
+            feedback = self._feedback[host] = [latency, latency, 0, 0, 0] if latency is not None else [0.0, float('inf'), 0, 0, 0]
+        elif feedback[1] == float('inf') and latency is not None:
+            feedback[0] = feedback[1] = latency
+        return feedback
+
+    def _speed_up(self, host: str, feedback: list) -> None:
+        """Toplamsal artış: hız rate_increase istek/sn artar (kilit altında çağrılmalı)"""
+        interval = self.get_interval(host)
+        if interval <= 0:
+            return
+        new_interval = self._clamp(1.0 / (1.0 / interval + self.rate_increase), host)
+        if new_interval < interval:
+            self._intervals[host] = new_interval
+            feedback[3] += 1
+
+    def _slow_down(self, host: str, feedback: list) -> None:
+        """Çarpımsal azaltma: hız backoff ile çarpılır (kilit altında çağrılmalı)"""
+        # Aralık 0 ise azaltma 0.1 sn'den başlar
+        interval = max(self.get_interval(host), 0.1)
+        self._intervals[host] = self._clamp(interval / self.backoff, host)
+        feedback[2] = self.cooldown
+        feedback[4] += 1
+
+    def rates(self) -> Dict[str, Dict]:
+        """
+        Uyarlamalı hız kontrolündeki host'ların güncel durumu
+
+        Returns:
+            host -> {'interval', 'rate' (istek/sn), 'latency_ms' (TTFB EWMA), 'increases', 'decreases'}
+        """
+        with self._lock:
+            rates = {}
+            for host, feedback in self._feedback.items():
+                interval = self.get_interval(host)
+                rates[host] = {
+                    'interval': round(interval, 3),
+                    'rate': round(1.0 / interval, 2) if interval > 0 else None,
+                    'latency_ms': round(feedback[0] * 1000, 1),
+                    'increases': feedback[3],
+                    'decreases': feedback[4]
+                }
+            return rates
+
+    def state(self) -> Dict:
+        """
+        Checkpoint için host bekleme süreleri ve sıradaki istek zamanlarını döndürür
+
+        Sıradaki istek zamanları ``time.time()`` cinsinden yazılır; monotonic
+        saat process'ler arasında taşınamaz.
+        """
+        with self._lock:
+            offset = time.time() - time.monotonic()
+            return {
+                'intervals': dict(self._intervals),
+                'floors': dict(self._floors),
+                'next_slots': {host: slot + offset for host, slot in self._next_slot.items()}
+            }
+
+    def restore(self, state: Dict) -> None:
+        """
+        ``state`` ile alınan zamanlamayı yükler; süresi geçmiş slotlar atlanır
+
+        Args:
+            state: ``state`` metodunun döndürdüğü sözlük
+        """
+        with self._lock:
+            offset = time.time() - time.monotonic()
+            now = time.monotonic()
+            self._floors.update(state.get('floors', {}))
+            for host, interval in state.get('intervals', {}).items():
+                self._intervals[host] = self._clamp(interval, host)
+            for host, slot in state.get('next_slots', {}).items():
+                if slot - offset > now:
+                    self._next_slot[host] = slot - offset
+
+    def wait(self, url: str) -> None:
+        """Host'un sırası gelene kadar bekler (bloklayan)"""
+        wait_time = self.reserve(url)
+        if wait_time > 0:
+            time.sleep(wait_time)
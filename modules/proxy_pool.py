@@ -0,0 +1,266 @@
+"""
+Spider Domain Crawler - Proxy Havuzu Modülü
+
+Copyright (c) 2025 Hasan Yasin Yaşar
+Licensed under PSH 1.1 (Pasha Software License)
+"""
+
+import logging
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+
+import requests
+
+# Devre kesici durumları
+CLOSED = 'closed'        # Proxy kullanımda
+OPEN = 'open'            # Proxy devre dışı, cooldown bekleniyor
+HALF_OPEN = 'half_open'  # Cooldown bitti, doğrulama isteği sürüyor
+
+
+def proxy_dict(proxy_url: str) -> Dict[str, str]:
+    """
+    Proxy URL'ini requests ``proxies`` sözlüğüne çevirir
+
+    Şema belirtilmemişse HTTP proxy olarak varsayılır.
+    """
+    if not proxy_url.startswith(('http://', 'https://', 'socks4://', 'socks5://')):
+        proxy_url = f"http://{proxy_url}"
+    return {'http': proxy_url, 'https': proxy_url}
+
+
+class ProxyHealth:
+    """Tek bir proxy'nin ölçülen sağlık durumu"""
+
+    __slots__ = ('proxy', 'successes', 'failures', 'consecutive_failures', 'latency',
+                 'state', 'opened_at', 'cooldown', 'ejections')
+
+    def __init__(self, proxy: str, cooldown: float):
+        self.proxy = proxy
+        self.successes = 0
+        self.failures = 0
+        self.consecutive_failures = 0
+        # Başarılı isteklerin yanıt süresi EWMA'sı (saniye, ölçülmediyse None)
+        self.latency: Optional[float] = None
+        self.state = CLOSED
+        self.opened_at = 0.0
+        self.cooldown = cooldown
+        self.ejections = 0
+
+    @property
+    def success_rate(self) -> float:
+        """Laplace düzeltmeli başarı oranı (hiç ölçüm yoksa 0.5)"""
+        return (self.successes + 1) / (self.successes + self.failures + 2)
+
+
+class ProxyPool:
+    """
+    Sağlık puanlı ve devre kesicili proxy havuzu
+
+    ``validate`` tüm proxy'leri ``PROXY_VALIDATION_URL``'e eşzamanlı istek
+    atarak test eder. ``select`` proxy'yi ölçülen başarı oranı / yanıt
+    süresi ağırlığıyla seçer. Art arda ``failure_threshold`` kez başarısız
+    olan proxy devre dışı bırakılır (devre açılır); cooldown dolunca arka
+    planda doğrulama isteği atılır, başarılıysa havuza geri alınır, değilse
+    cooldown iki katına çıkar. Thread-safe'dir; crawler ve detector aynı
+    havuzu paylaşabilir.
+    """
+
+    def __init__(self, proxies: List[str], validation_url: str = None, validation_timeout: float = None,
+                 failure_threshold: int = None, cooldown: float = None, max_cooldown: float = None,
+                 workers: int = None, seed: int = None):
+        """
+        ProxyPool başlatıcı
+
+        Args:
+            proxies: Proxy URL'leri (tekrarlar bir kez alınır)
+            validation_url: Doğrulama isteklerinin gönderileceği URL (varsayılan: config.PROXY_VALIDATION_URL)
+            validation_timeout: Doğrulama isteği timeout'u (varsayılan: config.PROXY_VALIDATION_TIMEOUT)
+            failure_threshold: Devreyi açan art arda hata sayısı (varsayılan: config.PROXY_FAILURE_THRESHOLD)
+            cooldown: Devre açıldıktan sonra ilk doğrulamaya kadar bekleme (varsayılan: config.PROXY_COOLDOWN)
+            max_cooldown: Cooldown üst sınırı (varsayılan: config.PROXY_MAX_COOLDOWN)
+            workers: Eşzamanlı doğrulama isteği sayısı (varsayılan: config.PROXY_VALIDATION_WORKERS)
+            seed: Ağırlıklı seçim için rastgele sayı üreteci tohumu
+        """
+        from .config import (PROXY_VALIDATION_URL, PROXY_VALIDATION_TIMEOUT, PROXY_FAILURE_THRESHOLD,
+                             PROXY_COOLDOWN, PROXY_MAX_COOLDOWN, PROXY_VALIDATION_WORKERS)
+        self.validation_url = PROXY_VALIDATION_URL if validation_url is None else validation_url
+        self.validation_timeout = PROXY_VALIDATION_TIMEOUT if validation_timeout is None else validation_timeout
+        self.failure_threshold = PROXY_FAILURE_THRESHOLD if failure_threshold is None else failure_threshold
+        self.cooldown = PROXY_COOLDOWN if cooldown is None else cooldown
+        self.max_cooldown = PROXY_MAX_COOLDOWN if max_cooldown is None else max_cooldown
+        self.workers = PROXY_VALIDATION_WORKERS if workers is None else workers
+
+        self._health: Dict[str, ProxyHealth] = {}
+        for proxy in proxies:
+            if proxy not in self._health:
+                self._health[proxy] = ProxyHealth(proxy, self.cooldown)
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._probe_executor: Optional[ThreadPoolExecutor] = None
+        self._next_probe_check = 0.0
+        self.logger = logging.getLogger(__name__)
+        self.stats = {
+            'validated': 0,
+            'validation_failed': 0,
+            'ejections': 0,
+            'readmissions': 0
+        }
+
+    def __len__(self) -> int:
+        return len(self._health)
+
+    @staticmethod
+    def proxies_for(proxy: str) -> Dict[str, str]:
+        """Proxy için requests ``proxies`` sözlüğü"""
+        return proxy_dict(proxy)
+
+    def _probe(self, proxy: str) -> Optional[float]:
+        """Proxy üzerinden doğrulama URL'ine istek atar; başarılıysa yanıt süresini döndürür"""
+        from .config import TARASSUT_USER_AGENT
+        start = time.monotonic()
+        try:
+            response = requests.get(self.validation_url, proxies=proxy_dict(proxy), timeout=self.validation_timeout,
+                                    headers={'User-Agent': TARASSUT_USER_AGENT})
+            response.close()
+        except requests.RequestException as e:
+            self.logger.debug(f"Proxy doğrulama hatası {proxy}: {e}")
+            return None
+        if response.status_code != 200:
+            self.logger.debug(f"Proxy doğrulama başarısız: {proxy} (Status: {response.status_code})")
+            return None
+        return time.monotonic() - start
+
+    def validate(self) -> int:
+        """
+        Tüm proxy'leri eşzamanlı olarak doğrular; başarısız olanların devresini açar
+
+        Returns:
+            Kullanılabilir proxy sayısı
+        """
+        proxies = list(self._health)
+        if not proxies:
+            return 0
+        with ThreadPoolExecutor(max_workers=max(1, min(self.workers, len(proxies)))) as executor:
+            latencies = list(executor.map(self._probe, proxies))
+
+        with self._lock:
+            for proxy, latency in zip(proxies, latencies):
+                health = self._health[proxy]
+                if latency is None:
+                    self.stats['validation_failed'] += 1
+                    health.failures += 1
+                    self._open(health)
+                else:
+                    self.stats['validated'] += 1
+                    health.successes += 1
+                    health.latency = latency
+            return sum(1 for health in self._health.values() if health.state == CLOSED)
+
+    def _open(self, health: ProxyHealth) -> None:
+        """Proxy'nin devresini açar (kilit altında çağrılmalı)"""
+        health.state = OPEN
+        health.opened_at = time.monotonic()
+        health.ejections += 1
+        self.stats['ejections'] += 1
+
+    def _start_probes(self) -> None:
+        """Cooldown'u dolan proxy'ler için arka planda doğrulama başlatır (kilit altında çağrılmalı)"""
+        now = time.monotonic()
+        # Havuz her seçimde değil, saniyede en fazla bir kez taranır
+        if now < self._next_probe_check:
+            return
+        self._next_probe_check = now + 1.0
+        for health in self._health.values():
+            if health.state == OPEN and now - health.opened_at >= health.cooldown:
+                health.state = HALF_OPEN
+                if self._probe_executor is None:
+                    self._probe_executor = ThreadPoolExecutor(max_workers=max(1, min(self.workers, 4)))
+                self._probe_executor.submit(self._readmit, health)
+
+    def _readmit(self, health: ProxyHealth) -> None:
+        """Cooldown doğrulamasının sonucuna göre proxy'yi havuza geri alır veya tekrar devre dışı bırakır"""
+        latency = self._probe(health.proxy)
+        with self._lock:
+            if latency is not None:
+                health.state = CLOSED
+                health.consecutive_failures = 0
+                health.cooldown = self.cooldown
+                health.latency = latency
+                self.stats['readmissions'] += 1
+                self.logger.info(f"Proxy tekrar kullanımda: {health.proxy}")
+            else:
+                health.cooldown = min(self.max_cooldown, health.cooldown * 2)
+                self._open(health)
+
+    def select(self) -> Optional[str]:
+        """
+        Başarı oranı ve yanıt süresine göre ağırlıklı rastgele proxy seçer
+
+        Returns:
+            Proxy URL'i veya kullanılabilir proxy yoksa None
+        """
+        with self._lock:
+            self._start_probes()
+            candidates = [health for health in self._health.values() if health.state == CLOSED]
+            if not candidates:
+                return None
+            # Yanıt süresi ölçülmemiş proxy'ler ölçülenlerin ortalamasıyla değerlendirilir
+            measured = [health.latency for health in candidates if health.latency is not None]
+            default_latency = sum(measured) / len(measured) if measured else 1.0
+            weights = [health.success_rate / max(0.05, default_latency if health.latency is None else health.latency)
+                       for health in candidates]
+            return self._random.choices(candidates, weights)[0].proxy
+
+    def record_success(self, proxy: str, latency: float) -> None:
+        """
+        Proxy üzerinden başarılı yanıt alındığını kaydeder
+
+        Args:
+            proxy: Kullanılan proxy
+            latency: Yanıt süresi (saniye)
+        """
+        with self._lock:
+            health = self._health.get(proxy)
+            if health is None:
+                return
+            health.successes += 1
+            health.consecutive_failures = 0
+            health.latency = latency if health.latency is None else health.latency + 0.3 * (latency - health.latency)
+
+    def record_failure(self, proxy: str) -> None:
+        """Proxy hatasını kaydeder; art arda hata eşiği aşılırsa devreyi açar"""
+        with self._lock:
+            health = self._health.get(proxy)
+            if health is None:
+                return
+            health.failures += 1
+            health.consecutive_failures += 1
+            if health.state == CLOSED and health.consecutive_failures >= self.failure_threshold:
+                self._open(health)
+                self.logger.warning(f"Proxy devre dışı bırakıldı ({health.cooldown:.0f} sn): {proxy}")
+
+    def summary(self) -> Dict:
+        """Havuzun durumu ve sayaçları"""
+        with self._lock:
+            states = [health.state for health in self._health.values()]
+            return dict(self.stats, total=len(states), healthy=states.count(CLOSED),
+                        ejected=states.count(OPEN) + states.count(HALF_OPEN))
+
+    def health_report(self) -> List[Dict]:
+        """Proxy başına başarı/hata sayıları, yanıt süresi ve devre durumu"""
+        with self._lock:
+            return [{'proxy': health.proxy, 'state': health.state, 'successes': health.successes,
+                     'failures': health.failures,
+                     'latency_ms': round(health.latency * 1000, 1) if health.latency is not None else None,
+                     'ejections': health.ejections}
+                    for health in self._health.values()]
+
+    def close(self) -> None:
+        """Arka plan doğrulama thread'lerini kapatır (süren doğrulamalar beklenmez)"""
+        with self._lock:
+            executor, self._probe_executor = self._probe_executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
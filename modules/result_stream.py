@@ -0,0 +1,214 @@
+"""
+Spider Domain Crawler - Akışlı (NDJSON) Sonuç Yazıcı Modülü
+
+Sonuçlar çalışma sonunda tek bir JSON olarak yazılmak yerine bulundukça
+satır satır (NDJSON) yazılır. ``read_results`` akıştan bugünkü JSON
+çıktısının aynısını yeniden oluşturur (komut satırı: ``convert_stream.py``).
+
+Copyright (c) 2025 Hasan Yasin Yaşar
+Licensed under PSH 1.1 (Pasha Software License)
+"""
+
+import gzip
+import json
+import threading
+import time
+from typing import Dict, Iterator, List
+
+# Sonuç sözlüğünde akışa kayıt olarak yazılan listeler: (kayıt türü, sıralı mı);
+# özet kaydına bu listeler yazılmaz, okuyucu kayıtlardan yeniden oluşturur.
+# Sıralı olmayan listeler bulunma sırasını korur.
+STREAMED_LISTS = {
+    'valid_domains': ('domain', True),
+    'invalid_domains': ('invalid_domain', True),
+    'found_pages': ('page', True),
+    'crawl_stats.found_urls': ('page', False)
+}
+
+_GZIP_MAGIC = b'\x1f\x8b'
+
+
+class ResultStreamWriter:
+    """
+    Bulunan domain, sayfa ve olayları NDJSON satırları olarak yazan yazıcı
+
+    Kayıtlar bellekte biriktirilir; ``buffer_records`` kayda ulaşıldığında veya
+    son yazmadan ``flush_interval`` saniye geçtiğinde dosyaya aktarılır.
+    Dosya adı ``.gz`` ile bitiyorsa (veya ``compress`` verilirse) gzip ile
+    sıkıştırılır. Thread-safe'dir.
+    """
+
+    def __init__(self, path: str, compress: bool = None, flush_interval: float = None,
+                 buffer_records: int = None, append: bool = False):
+        """
+        ResultStreamWriter başlatıcı
+
+        Args:
+            path: Çıktı dosyası
+            compress: gzip kullanılsın mı (varsayılan: dosya adı .gz ile bitiyorsa)
+            flush_interval: Kayıtların en geç kaç saniyede bir yazılacağı
+                (varsayılan: config.RESULT_STREAM_FLUSH_INTERVAL)
+            buffer_records: Bu kadar kayıt biriktiğinde yazılır
+                (varsayılan: config.RESULT_STREAM_BUFFER_RECORDS)
+            append: Dosyanın sonuna ekle (örn. checkpoint'ten devam ederken)
+        """
+        from .config import RESULT_STREAM_FLUSH_INTERVAL, RESULT_STREAM_BUFFER_RECORDS
+        self.path = path
+        self.compress = path.endswith('.gz') if compress is None else compress
+        self.flush_interval = RESULT_STREAM_FLUSH_INTERVAL if flush_interval is None else flush_interval
+        self.buffer_records = max(1, RESULT_STREAM_BUFFER_RECORDS if buffer_records is None else buffer_records)
+
+        mode = 'at' if append else 'wt'
+        if self.compress:
+            self._file = gzip.open(path, mode, encoding='utf-8')
+        else:
+            self._file = open(path, mode, encoding='utf-8')
+
+        self._buffer: List[str] = []
+        self._lock = threading.Lock()
+        self._last_flush = time.monotonic()
+        self.counts: Dict[str, int] = {}
+
+    def write(self, record_type: str, **fields) -> None:
+        """
+        Tek bir kayıt yazar
+
+        Args:
+            record_type: Kayıt türü ('domain', 'invalid_domain', 'page', 'event', 'summary')
+            fields: Kayda eklenecek alanlar
+        """
+        record = {'type': record_type, 'time': round(time.time(), 3)}
+        record.update(fields)
+        line = json.dumps(record, ensure_ascii=False, separators=(',', ':'))
+        with self._lock:
+            if self._file is None:
+                return
+            self._buffer.append(line)
+            self.counts[record_type] = self.counts.get(record_type, 0) + 1
+            if (len(self._buffer) >= self.buffer_records
+                    or time.monotonic() - self._last_flush >= self.flush_interval):
+                self._flush()
+
+    def domain(self, domain: str, valid: bool = True, **fields) -> None:
+        """Bulunan (geçerli veya geçersiz) domain'i yazar"""
+        self.write('domain' if valid else 'invalid_domain', domain=domain, **fields)
+
+    def page(self, url: str, **fields) -> None:
+        """Bulunan sayfayı yazar"""
+        self.write('page', url=url, **fields)
+
+    def event(self, name: str, **fields) -> None:
+        """Crawl olayını (örn. tamamlanan spider işi) yazar"""
+        self.write('event', name=name, **fields)
+
+    def summary(self, results: Dict) -> None:
+        """
+        Özet kaydını yazar
+
+        Kayıt olarak zaten yazılmış listeler (``STREAMED_LISTS``) özete
+        eklenmez; hangilerinin çıkarıldığı ``streamed`` alanında belirtilir.
+
+        Args:
+            results: Bugünkü JSON çıktısıyla aynı biçimdeki sonuç sözlüğü
+        """
+        summary = dict(results)
+        streamed = []
+        for key in STREAMED_LISTS:
+            parent, _, name = key.rpartition('.')
+            container = summary
+            if parent:
+                if not isinstance(summary.get(parent), dict):
+                    continue
+                container = summary[parent] = dict(summary[parent])
+            if name in container:
+                del container[name]
+                streamed.append(key)
+        self.write('summary', results=summary, streamed=streamed, records=dict(self.counts))
+
+    def _flush(self) -> None:
+        """Biriken kayıtları dosyaya yazar (kilit altında çağrılmalı)"""
+        if self._buffer:
+            self._file.write('\n'.join(self._buffer) + '\n')
+            self._buffer.clear()
+        self._file.flush()
+        self._last_flush = time.monotonic()
+
+    def flush(self) -> None:
+        """Biriken kayıtları dosyaya yazar"""
+        with self._lock:
+            if self._file is not None:
+                self._flush()
+
+    def close(self) -> None:
+        """Biriken kayıtları yazar ve dosyayı kapatır"""
+        with self._lock:
+            if self._file is None:
+                return
+            self._flush()
+            self._file.close()
+            self._file = None
+
+
+def iter_records(path: str) -> Iterator[Dict]:
+    """
+    Akıştaki kayıtları sırayla döndürür
+
+    gzip'li dosyalar otomatik tanınır. Çalışma yarıda kesildiyse yarım
+    yazılmış son satır (veya tamamlanmamış gzip bloğu) atlanır.
+    """
+    with open(path, 'rb') as f:
+        compressed = f.read(2) == _GZIP_MAGIC
+    opener = gzip.open if compressed else open
+    with opener(path, 'rt', encoding='utf-8') as f:
+        try:
+            for line in f:
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    return
+        except EOFError:
+            return
+
+
+def read_results(path: str) -> Dict:
+    """
+    Akıştan bugünkü JSON çıktı biçimini yeniden oluşturur
+
+    Args:
+        path: ``ResultStreamWriter`` ile yazılmış dosya
+
+    Returns:
+        Sonuç sözlüğü; özet kaydı yoksa (çalışma yarıda kesildiyse) kayıtlardan
+        hesaplanan toplamlar ve ``'complete': False``
+    """
+    values = {record_type: {} for record_type, _ in STREAMED_LISTS.values()}
+    summary = None
+    for record in iter_records(path):
+        record_type = record.get('type')
+        if record_type in ('domain', 'invalid_domain'):
+            values[record_type][record['domain']] = None
+        elif record_type == 'page':
+            values['page'][record['url']] = None
+        elif record_type == 'summary':
+            summary = record
+
+    if summary is None:
+        return {
+            'total_domains_found': len(values['domain']) + len(values['invalid_domain']),
+            'total_valid_domains': len(values['domain']),
+            'total_invalid_domains': len(values['invalid_domain']),
+            'total_pages_found': len(values['page']),
+            'valid_domains': sorted(values['domain']),
+            'invalid_domains': sorted(values['invalid_domain']),
+            'found_pages': sorted(values['page']),
+            'complete': False
+        }
+
+    results = summary['results']
+    for key in summary.get('streamed', []):
+        parent, _, name = key.rpartition('.')
+        container = results.setdefault(parent, {}) if parent else results
+        record_type, ordered = STREAMED_LISTS[key]
+        container[name] = sorted(values[record_type]) if ordered else list(values[record_type])
+    return results
+
@@ -0,0 +1,186 @@
+"""
+Spider Domain Crawler - Retry Politikası Modülü
+
+Copyright (c) 2025 Hasan Yasin Yaşar
+Licensed under PSH 1.1 (Pasha Software License)
+"""
+
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional
+
+import requests
+
+from .dns_cache import is_name_resolution_error
+
+# Tekrar denendiğinde düzelebilecek hata sınıfları
+RETRYABLE = ('timeout', 'connection', 'proxy', 'rate_limited', 'server_error')
+# Tekrar denenecek HTTP durum kodları
+RETRY_STATUSES = {429: 'rate_limited', 500: 'server_error', 502: 'server_error',
+                  503: 'server_error', 504: 'server_error'}
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Retry-After header'ını saniyeye çevirir
+
+    Args:
+        value: Saniye ("120") veya HTTP tarihi ("Wed, 21 Oct 2015 07:28:00 GMT")
+
+    Returns:
+        Beklenecek süre (saniye) veya header yok/geçersizse None
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError, IndexError, OverflowError):
+        return None
+
+
+class RetryLater(Exception):
+    """Sayfa şu an alınamadı; ``not_before`` (time.monotonic) zamanından sonra tekrar denenmeli"""
+
+    def __init__(self, url: str, not_before: float, reason: str):
+        super().__init__(f"{url} {reason} nedeniyle tekrar denenecek")
+        self.url = url
+        self.not_before = not_before
+        self.reason = reason
+
+
+class RetryPolicy:
+    """
+    Başarısız istekler için tekrar deneme politikası
+
+    Hatalar sınıflandırılır: zaman aşımı, bağlantı/proxy hataları, 429 ve
+    5xx yanıtları tekrar denenir; DNS hataları ve diğer 4xx yanıtları
+    denenmez. Tekrar deneme zamanı üstel geri çekilme ve jitter ile
+    hesaplanır, ``Retry-After`` header'ı varsa ondan önce denenmez. Worker
+    beklemez: ``failed`` bir ``RetryLater`` yükseltir ve URL çağıran tarafın
+    kuyruğuna ertelenmiş olarak geri konur. Thread-safe'dir; crawler ve
+    detector aynı örneği paylaşabilir.
+    """
+
+    def __init__(self, max_retries: int = None, base_delay: float = None, max_delay: float = None,
+                 retry_after_limit: float = None, seed: int = None):
+        """
+        RetryPolicy başlatıcı
+
+        Args:
+            max_retries: URL başına ilk denemeden sonraki maksimum tekrar sayısı (varsayılan: config.MAX_RETRIES)
+            base_delay: İlk tekrar öncesi bekleme, her tekrarda iki katına çıkar (varsayılan: config.RETRY_DELAY)
+            max_delay: Geri çekilme süresinin üst sınırı (varsayılan: config.RETRY_MAX_DELAY)
+            retry_after_limit: Retry-After bundan uzunsa URL tekrar denenmez (varsayılan: config.RETRY_AFTER_MAX)
+            seed: Jitter için rastgele sayı üreteci tohumu
+        """
+        from .config import MAX_RETRIES, RETRY_DELAY, RETRY_MAX_DELAY, RETRY_AFTER_MAX
+        self.max_retries = MAX_RETRIES if max_retries is None else max_retries
+        self.base_delay = RETRY_DELAY if base_delay is None else base_delay
+        self.max_delay = RETRY_MAX_DELAY if max_delay is None else max_delay
+        self.retry_after_limit = RETRY_AFTER_MAX if retry_after_limit is None else retry_after_limit
+
+        self._random = random.Random(seed)
+        self._attempts: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        # Hata sınıfı -> {'failures', 'retried', 'gave_up'}
+        self.stats: Dict[str, Dict[str, int]] = {}
+
+    @staticmethod
+    def classify(error: Exception) -> str:
+        """
+        İstek hatasını sınıflandırır
+
+        Args:
+            error: ``requests`` tarafından yükseltilen hata
+
+        Returns:
+            'timeout', 'connection', 'proxy', 'dns', 'rate_limited', 'server_error', 'client_error' veya 'other'
+        """
+        if isinstance(error, requests.exceptions.ProxyError):
+            return 'proxy'
+        if isinstance(error, requests.exceptions.Timeout):
+            return 'timeout'
+        if isinstance(error, requests.exceptions.HTTPError) and error.response is not None:
+            status = error.response.status_code
+            return RETRY_STATUSES.get(status, 'client_error' if status < 500 else 'other')
+        if isinstance(error, requests.exceptions.ConnectionError):
+            return 'dns' if is_name_resolution_error(error) else 'connection'
+        return 'other'
+
+    def attempts(self, url: str) -> int:
+        """URL için şimdiye kadar yapılmış başarısız deneme sayısı"""
+        with self._lock:
+            return self._attempts.get(url, 0)
+
+    def backoff(self, attempt: int, retry_after: float = None) -> float:
+        """
+        Tekrar denemeden önce beklenecek süre
+
+        Args:
+            attempt: Kaçıncı tekrar (1'den başlar)
+            retry_after: Sunucunun Retry-After değeri (saniye)
+
+        Returns:
+            Bekleme süresi (saniye); yarısı sabit, yarısı rastgeledir
+        """
+        delay = min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+        with self._lock:
+            delay = delay / 2 + self._random.uniform(0, delay / 2)
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+        return delay
+
+    def failed(self, url: str, error: Exception, scheduler=None) -> str:
+        """
+        Başarısız isteği kaydeder; tekrar denenecekse ``RetryLater`` yükseltir
+
+        Args:
+            url: İstek yapılan URL
+            error: Yükseltilen hata
+            scheduler: Verilirse Retry-After süresince host'a başka istek yapılmaz (HostScheduler)
+
+        Returns:
+            Hata sınıfı (URL tekrar denenmeyecekse)
+
+        Raises:
+            RetryLater: URL ertelenip tekrar denenmeli
+        """
+        reason = self.classify(error)
+        retry_after = None
+        response = getattr(error, 'response', None)
+        if reason in ('rate_limited', 'server_error') and response is not None:
+            retry_after = parse_retry_after(response.headers.get('Retry-After'))
+            if retry_after is not None and scheduler is not None:
+                scheduler.hold(url, min(retry_after, self.retry_after_limit))
+
+        with self._lock:
+            counters = self.stats.setdefault(reason, {'failures': 0, 'retried': 0, 'gave_up': 0})
+            counters['failures'] += 1
+            attempt = self._attempts.get(url, 0) + 1
+            retry = (reason in RETRYABLE and attempt <= self.max_retries
+                     and (retry_after is None or retry_after <= self.retry_after_limit))
+            if retry:
+                self._attempts[url] = attempt
+                counters['retried'] += 1
+            else:
+                self._attempts.pop(url, None)
+                counters['gave_up'] += 1
+
+        if not retry:
+            return reason
+        raise RetryLater(url, time.monotonic() + self.backoff(attempt, retry_after), reason)
+
+    def succeeded(self, url: str) -> None:
+        """Başarılı istekten sonra URL'nin deneme sayacını temizler"""
+        with self._lock:
+            self._attempts.pop(url, None)
+
+    def summary(self) -> Dict[str, Dict[str, int]]:
+        """Hata sınıfı başına sayaçların bir kopyasını döndürür"""
+        with self._lock:
+            return {reason: dict(counters) for reason, counters in self.stats.items()}
@@ -0,0 +1,392 @@
+"""
+Spider Domain Crawler - robots.txt Modülü
+
+Copyright (c) 2025 Hasan Yasin Yaşar
+Licensed under PSH 1.1 (Pasha Software License)
+"""
+
+import os
+import re
+import sqlite3
+import threading
+import time
+import weakref
+from concurrent.futures import Future
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+import requests
+
+from .politeness import HostScheduler
+
+
+def user_agent_token(user_agent: str) -> str:
+    """User-Agent string'inden robots.txt eşleştirmesinde kullanılan ürün adını döndürür"""
+    return re.split(r'[\s/]', user_agent.strip(), 1)[0].lower()
+
+
+def origin_of(url: str) -> str:
+    """URL'nin robots.txt'sinin geçerli olduğu ``scheme://host[:port]`` kısmını döndürür"""
+    parts = urlsplit(url)
+    return f"{parts.scheme.lower()}://{parts.netloc.lower()}"
+
+
+class RobotsRules:
+    """
+    Tek bir host'un robots.txt kuralları (derlenmiş)
+
+    RFC 9309'a göre bizim user agent'ımıza en özel uyan grup (yoksa ``*``)
+    seçilir. Kurallar uzunluklarına göre sıralanır; ilk eşleşen kural (en uzun
+    eşleşme, eşitlikte Allow) sonucu belirler. Joker karakter içermeyen
+    kurallar ``str.startswith`` ile, ``*``/``$`` içerenler önceden derlenmiş
+    regex ile kontrol edilir.
+    """
+
+    __slots__ = ('_rules', 'crawl_delay', 'sitemaps', 'allow_all', 'disallow_all')
+
+    def __init__(self, rules: List[Tuple[str, bool]] = (), crawl_delay: Optional[float] = None,
+                 sitemaps: List[str] = (), disallow_all: bool = False):
+        """
+        Args:
+            rules: (yol deseni, izin mi) listesi
+            crawl_delay: Host'un istediği istekler arası minimum süre (saniye)
+            sitemaps: robots.txt'de bildirilen sitemap URL'leri
+            disallow_all: robots.txt alınamadıysa (5xx/ağ hatası) tüm yollar yasak
+        """
+        compiled = []
+        for pattern, allow in rules:
+            if not pattern:
+                continue
+            if '*' in pattern or pattern.endswith('$'):
+                anchored = pattern.endswith('$')
+                body = pattern[:-1] if anchored else pattern
+                regex = '.*'.join(re.escape(part) for part in body.split('*')) + (r'\Z' if anchored else '')
+                matcher = re.compile(regex, re.DOTALL).match
+            else:
+                matcher = pattern
+            compiled.append((len(pattern), allow, matcher))
+        # En uzun desen önce; eşit uzunlukta Allow önce
+        compiled.sort(key=lambda rule: (-rule[0], not rule[1]))
+        self._rules = [(allow, matcher) for _, allow, matcher in compiled]
+        self.crawl_delay = crawl_delay
+        self.sitemaps = list(sitemaps)
+        self.disallow_all = disallow_all
+        self.allow_all = not disallow_all and all(allow for allow, _ in self._rules)
+
+    @classmethod
+    def parse(cls, text: str, user_agent: str) -> 'RobotsRules':
+        """
+        robots.txt içeriğini parse eder
+
+        Args:
+            text: robots.txt içeriği
+            user_agent: Eşleştirilecek ürün adı (örn. 'tarassut')
+
+        Returns:
+            Bu user agent için geçerli kurallar
+        """
+        groups: List[Tuple[List[str], List[Tuple[str, bool]], List[Optional[float]]]] = []
+        sitemaps = []
+        current = None
+        in_agents = False
+
+        for line in text.splitlines():
+            line = line.split('#', 1)[0].strip()
+            if ':' not in line:
+                continue
+            key, value = line.split(':', 1)
+            key = key.strip().lower()
+            value = value.strip()
+
+            if key == 'user-agent':
+                # Ardışık user-agent satırları aynı grubu oluşturur
+                if not in_agents:
+                    current = ([], [], [None])
+                    groups.append(current)
+                    in_agents = True
+                current[0].append(value.lower())
+                continue
+            if key == 'sitemap':
+                if value:
+                    sitemaps.append(value)
+                continue
+
+            in_agents = False
+            if current is None:
+                continue
+            if key in ('allow', 'disallow'):
+                current[1].append((value, key == 'allow'))
+            elif key == 'crawl-delay':
+                try:
+                    current[2][0] = max(0.0, float(value))
+                except ValueError:
+                    pass
+
+        # Ürün adımızla eşleşen gruplar birleştirilir, yoksa '*' grupları kullanılır
+        matched = [group for group in groups if user_agent in group[0]]
+        if not matched:
+            matched = [group for group in groups if '*' in group[0]]
+
+        rules = [rule for group in matched for rule in group[1]]
+        delays = [group[2][0] for group in matched if group[2][0] is not None]
+        return cls(rules, max(delays) if delays else None, sitemaps)
+
+    def allowed(self, path: str) -> bool:
+        """
+        Yolun (path + query) crawl edilip edilemeyeceğini döndürür
+
+        Args:
+            path: ``/`` ile başlayan yol
+        """
+        if self.disallow_all:
+            return path == '/robots.txt'
+        if self.allow_all:
+            return True
+        for allow, matcher in self._rules:
+            if matcher.__class__ is str:
+                if path.startswith(matcher):
+                    return allow
+            elif matcher(path):
+                return allow
+        return True
+
+
+class RobotsCache:
+    """
+    Host bazlı robots.txt önbelleği
+
+    Her host'un robots.txt'si bir kez indirilir, derlenip bellekte ve
+    SQLite'ta ``ttl`` süresince saklanır. Aynı host için
+    eşzamanlı istekler tek indirmede birleştirilir. 4xx yanıtları "her şey
+    serbest", 5xx ve ağ hataları "her şey yasak" sayılır (RFC 9309); hatalar
+    ``error_ttl`` kadar kısa süre saklanır. ``Crawl-delay`` değerleri
+    ``attach`` ile bağlanan host zamanlayıcılarına uygulanır. Thread-safe'dir.
+    """
+
+    def __init__(self, user_agent: str = None, ttl: float = None, error_ttl: float = None,
+                 path: str = None, timeout: float = 10, max_size: int = None, flush_every: int = 100):
+        """
+        RobotsCache başlatıcı
+
+        Args:
+            user_agent: Eşleştirmede kullanılacak user agent (varsayılan: config.TARASSUT_USER_AGENT)
+            ttl: Kuralların saklanma süresi (varsayılan: config.ROBOTS_TXT_CACHE_TIME)
+            error_ttl: Alınamayan robots.txt'lerin saklanma süresi (varsayılan: config.ROBOTS_TXT_ERROR_CACHE_TIME)
+            path: SQLite dosya yolu (varsayılan: config.ROBOTS_TXT_CACHE_FILE, ':memory:' ile sadece bellekte)
+            timeout: robots.txt indirme zaman aşımı (saniye)
+            max_size: Okunacak maksimum robots.txt boyutu (varsayılan: config.ROBOTS_TXT_MAX_SIZE)
+            flush_every: Bu kadar yeni kayıt biriktiğinde diske yazılır
+        """
+        from .config import (TARASSUT_USER_AGENT, ROBOTS_TXT_CACHE_TIME, ROBOTS_TXT_ERROR_CACHE_TIME,
+                             ROBOTS_TXT_CACHE_FILE, ROBOTS_TXT_MAX_SIZE)
+        self.user_agent = user_agent_token(TARASSUT_USER_AGENT if user_agent is None else user_agent)
+        self.ttl = ROBOTS_TXT_CACHE_TIME if ttl is None else ttl
+        self.error_ttl = ROBOTS_TXT_ERROR_CACHE_TIME if error_ttl is None else error_ttl
+        self.timeout = timeout
+        self.max_size = ROBOTS_TXT_MAX_SIZE if max_size is None else max_size
+        self.path = ROBOTS_TXT_CACHE_FILE if path is None else path
+        self.flush_every = flush_every
+
+        self._lock = threading.Lock()
+        # origin -> (RobotsRules, expires)
+        self._memory: Dict[str, Tuple[RobotsRules, float]] = {}
+        self._inflight: Dict[str, Future] = {}
+        self._schedulers = weakref.WeakSet()
+        self._pending: Dict[str, tuple] = {}
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS robots_cache ('
+            'origin TEXT PRIMARY KEY, status INTEGER NOT NULL, body TEXT NOT NULL, expires REAL NOT NULL)'
+        )
+        self._conn.execute('DELETE FROM robots_cache WHERE expires <= ?', (time.time(),))
+        self._conn.commit()
+
+        self.stats = {
+            'fetches': 0,
+            'disk_hits': 0,
+            'errors': 0,
+            'allowed': 0,
+            'disallowed': 0
+        }
+
+    def attach(self, scheduler: HostScheduler) -> None:
+        """
+        Host zamanlayıcısını bağlar; bilinen ve sonradan öğrenilen Crawl-delay değerleri uygulanır
+
+        Args:
+            scheduler: Crawler veya detector'ın host zamanlayıcısı
+        """
+        with self._lock:
+            self._schedulers.add(scheduler)
+            known = [(origin, rules.crawl_delay) for origin, (rules, _) in self._memory.items()
+                     if rules.crawl_delay]
+        for origin, delay in known:
+            self._apply_delay(scheduler, origin, delay)
+
+    @staticmethod
+    def _apply_delay(scheduler: HostScheduler, origin: str, delay: float) -> None:
+        # Crawl-delay bir alt sınırdır; daha uzun bekleme süresi kısaltılmaz, uyarlamalı hız altına inmez
+        scheduler.set_min_interval(scheduler.host_key(origin), delay)
+
+    def _from_disk(self, origin: str) -> Optional[Tuple[RobotsRules, float]]:
+        """Diskteki süresi dolmamış kaydı okur"""
+        with self._lock:
+            if self._conn is None:
+                return None
+            row = self._conn.execute(
+                'SELECT status, body, expires FROM robots_cache WHERE origin = ?', (origin,)
+            ).fetchone()
+        if row is None or row[2] <= time.time():
+            return None
+        status, body, expires = row
+        self.stats['disk_hits'] += 1
+        return self._rules_for(status, body), expires
+
+    def _rules_for(self, status: int, body: str) -> RobotsRules:
+        """Yanıt durumuna göre kuralları oluşturur (status 0: ağ hatası)"""
+        if 200 <= status < 300:
+            return RobotsRules.parse(body, self.user_agent)
+        if 400 <= status < 500:
+            return RobotsRules()
+        return RobotsRules(disallow_all=True)
+
+    def _download(self, origin: str, session: requests.Session, headers: Dict[str, str],
+                  scheduler: HostScheduler = None, proxies: Dict[str, str] = None) -> Tuple[int, str]:
+        """robots.txt'yi indirir: (HTTP durumu veya ağ hatasında 0, içerik)"""
+        robots_url = origin + '/robots.txt'
+        if scheduler is not None:
+            scheduler.wait(robots_url)
+        try:
+            with session.get(robots_url, headers=headers, timeout=self.timeout, stream=True,
+                             proxies=proxies) as response:
+                if not 200 <= response.status_code < 300:
+                    return response.status_code, ''
+                body = bytearray()
+                for chunk in response.iter_content(16 * 1024):
+                    body += chunk
+                    if len(body) >= self.max_size:
+                        # Sınırdan sonrası yok sayılır (yarım kalan son satır dahil)
+                        del body[self.max_size:]
+                        body = body[:body.rfind(b'\n') + 1]
+                        break
+                return response.status_code, body.decode('utf-8', 'replace')
+        except requests.RequestException:
+            return 0, ''
+
+    def rules(self, url: str, session: requests.Session, headers: Dict[str, str] = None,
+              scheduler: HostScheduler = None, proxies: Dict[str, str] = None) -> RobotsRules:
+        """
+        URL'nin host'u için kuralları döndürür, gerekirse robots.txt'yi indirir
+
+        Args:
+            url: Kontrol edilecek URL
+            session: robots.txt'nin indirileceği session
+            headers: İstek header'ları (örn. User-Agent)
+            scheduler: Verilirse robots.txt isteği de host sırasına göre yapılır
+            proxies: İsteğin rotası (requests ``proxies`` sözlüğü, None ise doğrudan)
+
+        Returns:
+            RobotsRules
+        """
+        origin = origin_of(url)
+        with self._lock:
+            entry = self._memory.get(origin)
+            if entry is not None and entry[1] > time.time():
+                return entry[0]
+            future = self._inflight.get(origin)
+            owner = future is None
+            if owner:
+                future = self._inflight[origin] = Future()
+        if not owner:
+            return future.result()
+
+        rules = None
+        try:
+            cached = self._from_disk(origin)
+            if cached is not None:
+                rules, expires = cached
+            else:
+                status, body = self._download(origin, session, headers or {}, scheduler, proxies)
+                rules = self._rules_for(status, body)
+                failed = status == 0 or status >= 500
+                expires = time.time() + (self.error_ttl if failed else self.ttl)
+                with self._lock:
+                    self.stats['fetches'] += 1
+                    if failed:
+                        self.stats['errors'] += 1
+                    self._pending[origin] = (status, body, expires)
+                    if len(self._pending) >= self.flush_every:
+                        self._flush()
+
+            with self._lock:
+                self._memory[origin] = (rules, expires)
+                schedulers = list(self._schedulers)
+            if rules.crawl_delay:
+                for attached in schedulers:
+                    self._apply_delay(attached, origin, rules.crawl_delay)
+        finally:
+            with self._lock:
+                del self._inflight[origin]
+            future.set_result(rules if rules is not None else RobotsRules())
+        return rules
+
+    def allowed(self, url: str, session: requests.Session, headers: Dict[str, str] = None,
+                scheduler: HostScheduler = None, proxies: Dict[str, str] = None) -> bool:
+        """
+        URL'nin robots.txt'ye göre crawl edilip edilemeyeceğini döndürür
+
+        Args:
+            url: Kontrol edilecek URL
+            session: Gerekirse robots.txt'nin indirileceği session
+            headers: İstek header'ları
+            scheduler: Verilirse robots.txt isteği de host sırasına göre yapılır
+            proxies: İsteğin rotası (requests ``proxies`` sözlüğü, None ise doğrudan)
+        """
+        parts = urlsplit(url)
+        path = (parts.path or '/') + ('?' + parts.query if parts.query else '')
+        result = self.rules(url, session, headers, scheduler, proxies).allowed(path)
+        with self._lock:
+            self.stats['allowed' if result else 'disallowed'] += 1
+        return result
+
+    def crawl_delay(self, url: str) -> Optional[float]:
+        """Host'un bilinen Crawl-delay değeri (robots.txt henüz alınmadıysa None)"""
+        entry = self._memory.get(origin_of(url))
+        return entry[0].crawl_delay if entry is not None else None
+
+    def sitemaps(self, url: str) -> List[str]:
+        """Host'un robots.txt'sinde bildirilen sitemap URL'leri"""
+        entry = self._memory.get(origin_of(url))
+        return list(entry[0].sitemaps) if entry is not None else []
+
+    def _flush(self) -> None:
+        """Biriken kayıtları diske yazar (kilit altında çağrılmalı)"""
+        if not self._pending or self._conn is None:
+            self._pending.clear()
+            return
+        self._conn.executemany(
+            'INSERT OR REPLACE INTO robots_cache (origin, status, body, expires) VALUES (?, ?, ?, ?)',
+            [(origin, status, body, expires) for origin, (status, body, expires) in self._pending.items()]
+        )
+        self._conn.commit()
+        self._pending.clear()
+
+    def summary(self) -> Dict[str, int]:
+        """İstatistiklerin bir kopyasını döndürür"""
+        with self._lock:
+            stats = dict(self.stats)
+            stats['hosts'] = len(self._memory)
+            stats['crawl_delays'] = sum(1 for rules, _ in self._memory.values() if rules.crawl_delay)
+            return stats
+
+    def close(self) -> None:
+        """Biriken kayıtları yazar ve veritabanını kapatır"""
+        with self._lock:
+            self._flush()
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -0,0 +1,340 @@
+"""
+Spider Domain Crawler - Görülen URL Kümesi (Seen Set) Modülü
+
+Copyright (c) 2025 Hasan Yasin Yaşar
+Licensed under PSH 1.1 (Pasha Software License)
+"""
+
+import hashlib
+import math
+import os
+import sqlite3
+import sys
+import tempfile
+import threading
+import weakref
+from abc import ABC, abstractmethod
+from typing import Dict, Iterator, List
+
+SEEN_SET_BACKENDS = ('memory', 'bloom', 'disk')
+
+
+def _digest(item: str) -> bytes:
+    """Öğenin 16 byte'lık özetini döndürür"""
+    return hashlib.blake2b(item.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+
+
+class SeenSet(ABC):
+    """
+    Görülen URL kümesi arayüzü
+
+    Tüm backend'ler ``add``, ``in`` ve ``len`` destekler. ``add`` öğe yeni
+    eklendiyse True döndürür; böylece kontrol ve ekleme tek adımda yapılır.
+    Sadece ``iterable`` olan backend'ler öğeleri geri verebilir.
+    """
+
+    backend = ''
+    iterable = False
+
+    @abstractmethod
+    def add(self, item: str) -> bool:
+        """Öğeyi ekler; öğe yeniyse True döndürür"""
+
+    @abstractmethod
+    def __contains__(self, item: str) -> bool:
+        """Öğenin daha önce görülüp görülmediğini döndürür"""
+
+    @abstractmethod
+    def __len__(self) -> int:
+        """Eklenen (farklı) öğe sayısını döndürür"""
+
+    def __iter__(self) -> Iterator[str]:
+        raise TypeError(f"'{self.backend}' görülen URL kümesi öğeleri saklamaz")
+
+    def update(self, items) -> None:
+        """Birden fazla öğe ekler"""
+        for item in items:
+            self.add(item)
+
+    def memory_bytes(self) -> int:
+        """Kümenin yaklaşık bellek kullanımı (byte)"""
+        return 0
+
+    def stats(self) -> Dict:
+        """Backend, öğe sayısı ve bellek/disk kullanımını döndürür"""
+        return {
+            'backend': self.backend,
+            'items': len(self),
+            'memory_bytes': self.memory_bytes()
+        }
+
+    def close(self) -> None:
+        """Kaynakları serbest bırakır"""
+
+
+class MemorySeenSet(SeenSet):
+    """Tam (exact) bellek içi küme; küçük ve orta ölçekli crawl'lar için"""
+
+    backend = 'memory'
+    iterable = True
+
+    def __init__(self):
+        self._items = set()
+        self._item_bytes = 0
+
+    def add(self, item: str) -> bool:
+        if item in self._items:
+            return False
+        self._items.add(item)
+        self._item_bytes += sys.getsizeof(item)
+        return True
+
+    def __contains__(self, item: str) -> bool:
+        return item in self._items
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._items)
+
+    def memory_bytes(self) -> int:
+        return sys.getsizeof(self._items) + self._item_bytes
+
+
+class _BloomSlice:
+    """Sabit kapasiteli tek bir Bloom filtresi"""
+
+    __slots__ = ('capacity', 'bits', 'hashes', 'count', 'array')
+
+    def __init__(self, capacity: int, error_rate: float):
+        self.capacity = capacity
+        # Optimum bit ve hash sayısı: m = -n ln(p) / ln(2)^2, k = m/n ln(2)
+        self.bits = max(8, int(math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2))))
+        self.hashes = max(1, int(round(self.bits / capacity * math.log(2))))
+        self.count = 0
+        self.array = bytearray((self.bits + 7) // 8)
+
+    def positions(self, h1: int, h2: int) -> List[int]:
+        # Kirsch-Mitzenmacher: k hash, iki bağımsız hash'in doğrusal birleşiminden türetilir
+        bits = self.bits
+        return [(h1 + i * h2) % bits for i in range(self.hashes)]
+
+    def contains(self, h1: int, h2: int) -> bool:
+        array = self.array
+        for position in self.positions(h1, h2):
+            if not array[position >> 3] & (1 << (position & 7)):
+                return False
+        return True
+
+    def add(self, h1: int, h2: int) -> None:
+        array = self.array
+        for position in self.positions(h1, h2):
+            array[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+
+class BloomSeenSet(SeenSet):
+    """
+    Ölçeklenebilir Bloom filtresi (Almeida vd., 2007)
+
+    Kapasite dolduğunda iki kat büyük ve daha düşük hata oranlı yeni bir
+    filtre eklenir; toplam yanlış pozitif oranı ``error_rate`` altında kalır.
+    Öğe başına ~2-4 byte kullanır, öğeleri saklamaz. Yanlış pozitif, hiç
+    görülmemiş bir URL'nin görülmüş sayılması (atlanması) demektir; yanlış
+    negatif yoktur.
+    """
+
+    backend = 'bloom'
+
+    # Her yeni filtrenin hata oranı bir öncekinin bu katı olur
+    TIGHTENING_RATIO = 0.5
+    GROWTH_FACTOR = 2
+
+    def __init__(self, initial_capacity: int = None, error_rate: float = None):
+        """
+        BloomSeenSet başlatıcı
+
+        Args:
+            initial_capacity: İlk filtrenin kapasitesi (varsayılan: config.SEEN_SET_INITIAL_CAPACITY)
+            error_rate: Hedef toplam yanlış pozitif oranı (varsayılan: config.SEEN_SET_ERROR_RATE)
+        """
+        from .config import SEEN_SET_INITIAL_CAPACITY, SEEN_SET_ERROR_RATE
+        self.initial_capacity = max(1, SEEN_SET_INITIAL_CAPACITY if initial_capacity is None else initial_capacity)
+        self.error_rate = SEEN_SET_ERROR_RATE if error_rate is None else error_rate
+        if not 0 < self.error_rate < 1:
+            raise ValueError(f"Bloom filtresi hata oranı 0 ile 1 arasında olmalı: {self.error_rate}")
+
+        self._slices: List[_BloomSlice] = []
+        self._count = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _hashes(item: str):
+        digest = _digest(item)
+        return int.from_bytes(digest[:8], 'little'), int.from_bytes(digest[8:], 'little') | 1
+
+    def _grow(self) -> _BloomSlice:
+        index = len(self._slices)
+        capacity = self.initial_capacity * (self.GROWTH_FACTOR ** index)
+        # Hata oranları geometrik seri: toplam = error_rate
+        error_rate = self.error_rate * (1 - self.TIGHTENING_RATIO) * (self.TIGHTENING_RATIO ** index)
+        bloom_slice = _BloomSlice(capacity, error_rate)
+        self._slices.append(bloom_slice)
+        return bloom_slice
+
+    def add(self, item: str) -> bool:
+        h1, h2 = self._hashes(item)
+        with self._lock:
+            for bloom_slice in self._slices:
+                if bloom_slice.contains(h1, h2):
+                    return False
+            current = self._slices[-1] if self._slices else None
+            if current is None or current.count >= current.capacity:
+                current = self._grow()
+            current.add(h1, h2)
+            self._count += 1
+        return True
+
+    def __contains__(self, item: str) -> bool:
+        h1, h2 = self._hashes(item)
+        return any(bloom_slice.contains(h1, h2) for bloom_slice in self._slices)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def memory_bytes(self) -> int:
+        return sum(len(bloom_slice.array) for bloom_slice in self._slices)
+
+    def stats(self) -> Dict:
+        stats = super().stats()
+        stats['error_rate'] = self.error_rate
+        stats['filters'] = len(self._slices)
+        return stats
+
+
+class DiskSeenSet(SeenSet):
+    """
+    Disk üzerinde tutulan, hash'lenmiş tam küme
+
+    Her URL'nin 64 bit özeti SQLite'ta tamsayı birincil anahtar olarak saklanır
+    (URL başına ~10-20 byte disk). Yeni öğeler bellekte biriktirilip toplu
+    yazılır. 100 milyon URL'de iki farklı URL'nin aynı özete düşme olasılığı
+    ~%0.03'tür. Dosya geçicidir ve ``close`` ile silinir.
+    """
+
+    backend = 'disk'
+
+    def __init__(self, directory: str = None, flush_every: int = 10000, cache_mb: int = 64):
+        """
+        DiskSeenSet başlatıcı
+
+        Args:
+            directory: Geçici SQLite dosyasının oluşturulacağı klasör (varsayılan: config.SEEN_SET_DIR)
+            flush_every: Bu kadar yeni öğe biriktiğinde diske yazılır
+            cache_mb: SQLite sayfa önbelleği boyutu (MB)
+        """
+        if directory is None:
+            from .config import SEEN_SET_DIR
+            directory = SEEN_SET_DIR
+        os.makedirs(directory, exist_ok=True)
+        fd, self.path = tempfile.mkstemp(prefix='seen_', suffix='.db', dir=directory)
+        os.close(fd)
+
+        self.flush_every = flush_every
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        # Kalıcılık gerekmiyor: journal ve fsync kapalı
+        self._conn.execute('PRAGMA journal_mode=OFF')
+        self._conn.execute('PRAGMA synchronous=OFF')
+        self._conn.execute(f'PRAGMA cache_size=-{cache_mb * 1024}')
+        self._conn.execute('CREATE TABLE seen (h INTEGER PRIMARY KEY)')
+        self._pending = set()
+        self._count = 0
+        self._lock = threading.Lock()
+        self._finalizer = weakref.finalize(self, DiskSeenSet._cleanup, self._conn, self.path)
+
+    @staticmethod
+    def _cleanup(conn: sqlite3.Connection, path: str) -> None:
+        conn.close()
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    @staticmethod
+    def _key(item: str) -> int:
+        return int.from_bytes(_digest(item)[:8], 'little', signed=True)
+
+    def _stored(self, key: int) -> bool:
+        """Özet diske yazılmış mı (kilit altında çağrılmalı)"""
+        return self._conn.execute('SELECT 1 FROM seen WHERE h = ?', (key,)).fetchone() is not None
+
+    def _flush(self) -> None:
+        """Biriken özetleri diske yazar (kilit altında çağrılmalı)"""
+        if not self._pending:
+            return
+        self._conn.executemany('INSERT OR IGNORE INTO seen (h) VALUES (?)', ((key,) for key in self._pending))
+        self._conn.commit()
+        self._pending.clear()
+
+    def add(self, item: str) -> bool:
+        key = self._key(item)
+        with self._lock:
+            if key in self._pending or self._stored(key):
+                return False
+            self._pending.add(key)
+            self._count += 1
+            if len(self._pending) >= self.flush_every:
+                self._flush()
+        return True
+
+    def __contains__(self, item: str) -> bool:
+        key = self._key(item)
+        with self._lock:
+            return key in self._pending or self._stored(key)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def memory_bytes(self) -> int:
+        return sys.getsizeof(self._pending) + len(self._pending) * 32
+
+    def stats(self) -> Dict:
+        stats = super().stats()
+        with self._lock:
+            self._flush()
+        try:
+            stats['disk_bytes'] = os.path.getsize(self.path)
+        except OSError:
+            stats['disk_bytes'] = 0
+        return stats
+
+    def close(self) -> None:
+        with self._lock:
+            self._pending.clear()
+            self._finalizer()
+
+
+def create_seen_set(backend: str = None, initial_capacity: int = None, error_rate: float = None) -> SeenSet:
+    """
+    Seçilen backend ile görülen URL kümesi oluşturur
+
+    Args:
+        backend: 'memory' (tam, bellekte), 'bloom' (ölçeklenebilir Bloom filtresi)
+            veya 'disk' (tam, hash'lenmiş SQLite); varsayılan config.SEEN_SET_BACKEND
+        initial_capacity: Bloom filtresinin ilk kapasitesi
+        error_rate: Bloom filtresinin yanlış pozitif oranı
+
+    Returns:
+        SeenSet örneği
+    """
+    if backend is None:
+        from .config import SEEN_SET_BACKEND
+        backend = SEEN_SET_BACKEND
+    if backend == 'memory':
+        return MemorySeenSet()
+    if backend == 'bloom':
+        return BloomSeenSet(initial_capacity, error_rate)
+    if backend == 'disk':
+        return DiskSeenSet()
+    raise ValueError(f"Geçersiz görülen URL kümesi backend'i: {backend} (seçenekler: {', '.join(SEEN_SET_BACKENDS)})")
@@ -0,0 +1,192 @@
+"""
+Spider Domain Crawler - Spider İş Kuyruğu Modülü
+
+Seviye bariyeri olmayan spider zamanlayıcısı: yeni bulunan her domain, kendi
+spider derinliği ile etiketlenip hemen kuyruğa alınır ve boşta olan ilk
+worker tarafından işlenir.
+
+Copyright (c) 2025 Hasan Yasin Yaşar
+Licensed under PSH 1.1 (Pasha Software License)
+"""
+
+import heapq
+import itertools
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from urllib.parse import urlparse
+from typing import Any, Callable, Dict, List, Set, Tuple
+
+
+class SpiderTask:
+    """Kuyruktaki tek bir spider işi"""
+
+    __slots__ = ('url', 'depth', 'kind')
+
+    def __init__(self, url: str, depth: int, kind: str = 'domain'):
+        """
+        Args:
+            url: İşlenecek URL
+            depth: Spider derinliği (başlangıç URL'leri için 0)
+            kind: İşin kaynağı ('domain' veya 'page'); seviye kotası buna göre uygulanır
+        """
+        self.url = url
+        self.depth = depth
+        self.kind = kind
+
+
+class SpiderWorkQueue:
+    """
+    Sürekli çalışan spider iş kuyruğu
+
+    ``max_depth``, seviye başına kotalar ve toplam domain limiti kuyruğa kabul
+    (admission) kuralı olarak uygulanır. İşler derinliğe göre sıralanır, yani
+    sığ işler önce başlar; ancak bir seviyenin bitmesi beklenmez.
+    """
+
+    def __init__(self, max_depth: int, level_quotas: Dict[str, int], workers: int = None,
+                 checkpoint=None):
+        """
+        SpiderWorkQueue başlatıcı
+
+        Args:
+            max_depth: Maksimum spider derinliği
+            level_quotas: Her derinlikte iş türü başına kabul edilecek maksimum iş
+                (örn: {'domain': 20}); başlangıç URL'leri kotaya tabi değildir
+            workers: Aynı anda işlenecek domain sayısı
+            checkpoint: Verilirse kabul edilen ve tamamlanan işler bu
+                ``CrawlCheckpoint``'e kaydedilir
+        """
+        if workers is None:
+            from .config import SPIDER_WORKERS
+            workers = SPIDER_WORKERS
+
+        self.max_depth = max_depth
+        self.level_quotas = level_quotas
+        self.workers = max(1, workers)
+        self.checkpoint = checkpoint
+
+        self.processed_domains: Set[str] = set()
+        self.queued_domains: Set[str] = set()
+        self.queued_urls: Set[str] = set()
+        self.admitted_per_level: Dict[Tuple[int, str], int] = {}
+        self.deepest_level = 0
+
+        self._pending: List[Tuple[int, int, SpiderTask]] = []
+        self._running: Dict[Any, SpiderTask] = {}
+        self._sequence = itertools.count()
+
+    @staticmethod
+    def domain_of(url: str) -> str:
+        """URL'den domain'i çıkarır"""
+        return urlparse(url).netloc.lower()
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def admit(self, url: str, depth: int, kind: str = 'domain') -> bool:
+        """
+        URL'yi kabul kurallarına göre kuyruğa ekler
+
+        Args:
+            url: Kuyruğa eklenecek URL
+            depth: URL'nin spider derinliği
+            kind: İş türü ('domain' veya 'page')
+
+        Returns:
+            URL kuyruğa alındıysa True
+        """
+        if depth >= self.max_depth or url in self.queued_urls:
+            return False
+
+        domain = self.domain_of(url)
+        if domain in self.processed_domains:
+            return False
+        if kind == 'domain' and domain in self.queued_domains:
+            return False
+
+        # Başlangıç URL'leri (derinlik 0) seviye kotasına tabi değil
+        if depth > 0:
+            key = (depth, kind)
+            if self.admitted_per_level.get(key, 0) >= self.level_quotas.get(kind, 0):
+                return False
+            self.admitted_per_level[key] = self.admitted_per_level.get(key, 0) + 1
+
+        self.queued_urls.add(url)
+        self.queued_domains.add(domain)
+        heapq.heappush(self._pending, (depth, next(self._sequence), SpiderTask(url, depth, kind)))
+        if self.checkpoint is not None:
+            self.checkpoint.admitted(url, depth, kind)
+        return True
+
+    def state(self) -> Dict:
+        """
+        Checkpoint için kuyruk durumunu döndürür
+
+        Çalışmakta olan işler de bekleyen iş olarak yazılır; devam edildiğinde
+        yarım kalan işler tekrar çalıştırılır.
+        """
+        tasks = list(self._running.values()) + [task for _, _, task in sorted(self._pending)]
+        return {
+            'pending': {task.url: [task.depth, task.kind] for task in tasks},
+            'queued_urls': self.queued_urls,
+            'processed_domains': self.processed_domains,
+            'admitted_per_level': self.admitted_per_level,
+            'deepest_level': self.deepest_level
+        }
+
+    def restore(self, state: Dict) -> None:
+        """
+        Checkpoint'ten okunan kuyruk durumunu yükler
+
+        Args:
+            state: ``CrawlCheckpoint.load`` ile okunan durum
+        """
+        self.queued_urls = set(state['queued_urls'])
+        self.queued_domains = {self.domain_of(url) for url in self.queued_urls}
+        self.processed_domains = set(state['processed_domains'])
+        self.admitted_per_level = dict(state['admitted_per_level'])
+        self.deepest_level = state['deepest_level']
+        self._pending = [
+            (depth, next(self._sequence), SpiderTask(url, depth, kind))
+            for url, (depth, kind) in state['pending'].items()
+        ]
+        heapq.heapify(self._pending)
+
+    def run(self, process: Callable[[SpiderTask], Any],
+            on_result: Callable[[SpiderTask, Any], None],
+            should_stop: Callable[[], bool] = lambda: False) -> None:
+        """
+        Kuyruk boşalana kadar işleri worker'lara dağıtır
+
+        Args:
+            process: Worker thread'inde çalışan iş fonksiyonu
+            on_result: Her iş bittiğinde çağıran thread'de çalışır; yeni URL'leri
+                ``admit`` ile kuyruğa ekleyebilir
+            should_stop: True döndüğünde yeni iş başlatılmaz (devam edenler tamamlanır)
+        """
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            running = self._running
+
+            while True:
+                while self._pending and len(running) < self.workers and not should_stop():
+                    _, _, task = heapq.heappop(self._pending)
+                    self.processed_domains.add(self.domain_of(task.url))
+                    self.deepest_level = max(self.deepest_level, task.depth)
+                    running[executor.submit(process, task)] = task
+
+                if not running:
+                    break
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    # İş, sonucu tamamen işlenene kadar çalışıyor sayılır (kesilirse checkpoint'te bekleyen kalır)
+                    task = running[future]
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        print(f"    ❌ Hata ({task.url}): {e}")
+                    else:
+                        on_result(task, result)
+                    del running[future]
+                    if self.checkpoint is not None:
+                        self.checkpoint.finished(task.url)
+                        self.checkpoint.maybe_sync()
@@ -7,14 +7,29 @@ Licensed under PSH 1.1 (Pasha Software License)
 
 import requests
 from bs4 import BeautifulSoup
-from urllib.parse import urljoin, urlparse
-import validators
+from urllib.parse import urlparse
 import time
 import json
 import random
 import socket
-from typing import Set, List, Dict, Optional
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Optional, Union
 import logging
+from .politeness import HostScheduler
+from .page_pipeline import PagePipeline, PageData
+from .http_pool import ConnectionPool
+from .body_reader import BodyReader
+from .http_cache import HTTPCache
+from .robots import RobotsCache
+from .retry import RetryPolicy, RetryLater
+from .proxy_pool import ProxyPool
+from .domain_blocklist import DomainBlocklist
+from .url_record import URLRecord, parse_url
+from .frontier import URLFrontier
+from .seen_set import create_seen_set
+from .result_stream import ResultStreamWriter
+from . import metrics
 
 class URLCrawler:
     """
@@ -24,7 +39,12 @@ class URLCrawler:
     def __init__(self, delay: float = 1.0, max_depth: int = 2, max_urls: int = 100, 
                  excluded_extensions: List[str] = None, use_random_user_agent: bool = False,
                  use_proxy: bool = False, proxy_list: List[str] = None, 
-                 blocked_domains: List[str] = None, use_domain_blocking: bool = False):
+                 blocked_domains: List[str] = None, use_domain_blocking: bool = False,
+                 scheduler: HostScheduler = None, page_pipeline: PagePipeline = None,
+                 connection_pool: ConnectionPool = None, body_reader: BodyReader = None,
+                 domain_blocklist: DomainBlocklist = None, result_stream: ResultStreamWriter = None,
+                 http_cache: HTTPCache = None, robots_cache: RobotsCache = None,
+                 retry_policy: RetryPolicy = None, proxy_pool: ProxyPool = None):
         """
         URLCrawler başlatıcı
         
@@ -38,21 +58,50 @@ class URLCrawler:
             proxy_list: Kullanılacak proxy listesi
             blocked_domains: Engellenen domain listesi
             use_domain_blocking: Domain engelleme kullan
+            scheduler: Paylaşılan host zamanlayıcısı (verilmezse delay ile oluşturulur)
+            page_pipeline: DomainDetector ile paylaşılan sayfa pipeline'ı
+            connection_pool: Paylaşılan HTTP bağlantı havuzu (verilmezse sınıfa özel oluşturulur)
+            body_reader: Paylaşılan yanıt gövdesi okuyucusu (boyut limiti ve istatistikler)
+            domain_blocklist: Önceden derlenmiş engelleme listesi (verilirse blocked_domains yerine kullanılır)
+            result_stream: Verilirse bulunan her URL bu akışa 'page' kaydı olarak yazılır
+            http_cache: Paylaşılan kalıcı HTTP önbelleği (verilirse sayfalar koşullu isteklerle yeniden doğrulanır)
+            robots_cache: Paylaşılan robots.txt önbelleği (verilirse yasaklanan URL'ler frontier'a eklenmez)
+            retry_policy: Paylaşılan tekrar deneme politikası (başarısız URL'ler frontier'a ertelenmiş olarak geri konur)
+            proxy_pool: Paylaşılan proxy havuzu (verilmezse proxy_list doğrulanarak oluşturulur)
         """
         self.delay = delay
+        self.scheduler = scheduler or HostScheduler(delay)
+        self.page_pipeline = page_pipeline or PagePipeline()
         self.max_depth = max_depth
         self.max_urls = max_urls
-        self.visited_urls: Set[str] = set()
-        self.found_urls: Set[str] = set()
-        self.session = requests.Session()
+        # Tekrar kontrolleri config.SEEN_SET_BACKEND ile seçilen kümelerle yapılır;
+        # found_urls sadece sonuç listesidir (max_urls ile sınırlı)
+        self.visited_urls = create_seen_set()
+        self.found_urls: List[str] = []
+        self._found_seen = create_seen_set()
+        self.frontier = URLFrontier(max_depth, max_urls)
+        self.connection_pool = connection_pool or ConnectionPool()
+        self.session = self.connection_pool.session()
+        self.body_reader = body_reader or BodyReader()
+        self.http_cache = http_cache
+        self.robots_cache = robots_cache
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.robots_blocked_count = 0
+        if robots_cache is not None:
+            # Crawl-delay değerleri bu zamanlayıcıya uygulanır
+            robots_cache.attach(self.scheduler)
         self.use_random_user_agent = use_random_user_agent
         self.use_proxy = use_proxy
         self.proxy_list = proxy_list or []
         self.current_proxy = None
-        self.failed_proxies: Set[str] = set()
+        self.proxy_pool = proxy_pool
         self.use_domain_blocking = use_domain_blocking
         self.blocked_domains = set()
+        self.domain_blocklist = domain_blocklist
+        self.result_stream = result_stream
         self.blocked_urls_count = 0
+        # Engellenen URL'lerin site anahtarları (URLRecord.registrable); her site bir kez loglanır
+        self.blocked_sites = set()
         
         # Excluded extensions ayarla
         if excluded_extensions is None:
@@ -60,6 +109,7 @@ class URLCrawler:
             self.excluded_extensions = set(ext.lower() for ext in DEFAULT_EXCLUDED_EXTENSIONS)
         else:
             self.excluded_extensions = set(ext.lower() for ext in excluded_extensions)
+        self._excluded_suffixes = tuple(self.excluded_extensions)
         
         # Logging ayarla
         logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -100,127 +150,81 @@ class URLCrawler:
         from .config import RANDOM_USER_AGENTS
         return random.choice(RANDOM_USER_AGENTS)
     
-    def _update_user_agent_if_needed(self):
-        """Gerekirse user agent'ı günceller"""
+    def _get_request_headers(self) -> Dict[str, str]:
+        """
+        İstek bazlı header'ları döndürür
+        
+        Session header'ları değiştirilmez; böylece aynı session eşzamanlı
+        isteklerde güvenle paylaşılabilir.
+        """
         if self.use_random_user_agent:
             from .config import RANDOM_USER_AGENT_PER_REQUEST
             if RANDOM_USER_AGENT_PER_REQUEST:
                 new_user_agent = self._get_random_user_agent()
-                self.session.headers.update({'User-Agent': new_user_agent})
                 self.logger.debug(f"User agent güncellendi: {new_user_agent}")
+                return {'User-Agent': new_user_agent}
+        return {}
     
     def _setup_proxy(self):
-        """Proxy ayarlarını yapar"""
-        if self.use_proxy and self.proxy_list:
-            self.logger.info(f"Proxy modu etkin: {len(self.proxy_list)} proxy mevcut")
+        """Proxy ayarlarını yapar (paylaşılan havuz yoksa proxy listesi doğrulanarak havuz oluşturulur)"""
+        if self.use_proxy and self.proxy_pool is None and self.proxy_list:
+            self.proxy_pool = ProxyPool(self.proxy_list)
+            healthy = self.proxy_pool.validate()
+            self.logger.info(f"Proxy doğrulaması: {healthy}/{len(self.proxy_pool)} proxy çalışıyor")
+        
+        if self.use_proxy and self.proxy_pool is not None:
+            self.logger.info(f"Proxy modu etkin: {len(self.proxy_pool)} proxy mevcut")
             self._select_proxy()
-        elif self.use_proxy and not self.proxy_list:
+        elif self.use_proxy:
             self.logger.warning("Proxy modu etkin ama proxy listesi boş!")
             self.use_proxy = False
         else:
             self.logger.info("Proxy kullanılmıyor")
     
     def _select_proxy(self) -> Optional[str]:
-        """Kullanılabilir bir proxy seçer"""
-        if not self.proxy_list:
-            return None
+        """Havuzdan sağlık puanına göre bir proxy seçer; kullanılabilir proxy yoksa None (doğrudan gidilir)"""
+        proxy = self.proxy_pool.select()
+        if proxy is None and self.current_proxy is not None:
+            # Devre dışı proxy'ler cooldown sonrası havuza dönünce tekrar seçilir
+            self.logger.warning("Kullanılabilir proxy yok! Proxy'siz devam ediliyor.")
+        elif proxy is not None and proxy != self.current_proxy:
+            self.logger.debug(f"Proxy seçildi: {proxy}")
+        self.current_proxy = proxy
+        return proxy
+    
+    def _request_proxy(self, rotate: bool = False) -> Optional[str]:
+        """
+        İsteğin gideceği proxy'yi belirler
         
-        # Başarısız proxy'leri hariç tut
-        available_proxies = [p for p in self.proxy_list if p not in self.failed_proxies]
+        Rotasyon açıksa her istek havuzdan seçilen proxy ile gider; kapalıysa
+        mevcut proxy hata alana kadar kullanılır. Session'ın proxy ayarı
+        değiştirilmez, rota istekle birlikte gönderilir.
         
-        if not available_proxies:
-            self.logger.warning("Tüm proxy'ler başarısız! Proxy'siz devam ediliyor.")
-            self.use_proxy = False
+        Args:
+            rotate: Mevcut proxy yerine yenisini seç (tekrar denemelerde)
+            
+        Returns:
+            Proxy URL'i veya doğrudan gidilecekse None
+        """
+        if not self.use_proxy:
             return None
-        
-        # Random proxy seç
-        proxy = random.choice(available_proxies)
-        self.current_proxy = proxy
-        
-        # Session'a proxy ayarla
-        proxy_dict = self._parse_proxy(proxy)
-        if proxy_dict:
-            self.session.proxies.update(proxy_dict)
-            self.logger.info(f"Proxy seçildi: {proxy}")
-            return proxy
-        else:
-            self.failed_proxies.add(proxy)
-            return self._select_proxy()  # Başka proxy dene
+        from .config import PROXY_ROTATION
+        if rotate or PROXY_ROTATION or self.current_proxy is None:
+            return self._select_proxy()
+        return self.current_proxy
     
-    def _parse_proxy(self, proxy_url: str) -> Optional[Dict[str, str]]:
-        """Proxy URL'ini parse eder"""
-        try:
-            if proxy_url.startswith('http://') or proxy_url.startswith('https://'):
-                return {
-                    'http': proxy_url,
-                    'https': proxy_url
-                }
-            elif proxy_url.startswith('socks4://') or proxy_url.startswith('socks5://'):
-                return {
-                    'http': proxy_url,
-                    'https': proxy_url
-                }
-            else:
-                # Format belirtilmemişse HTTP olarak varsay
-                formatted_proxy = f"http://{proxy_url}"
-                return {
-                    'http': formatted_proxy,
-                    'https': formatted_proxy
-                }
-        except Exception as e:
-            self.logger.error(f"Proxy parse hatası {proxy_url}: {e}")
-            return None
+    def _request_proxies(self, proxy: Optional[str]) -> Optional[Dict[str, str]]:
+        """Proxy için isteğin ``proxies`` parametresi (None: doğrudan rota)"""
+        return self.proxy_pool.proxies_for(proxy) if proxy is not None else None
     
-    def _validate_proxy(self, proxy_url: str) -> bool:
-        """Proxy'nin çalışıp çalışmadığını test eder"""
-        try:
-            from .config import PROXY_VALIDATION_URL, PROXY_VALIDATION_TIMEOUT
-            
-            proxy_dict = self._parse_proxy(proxy_url)
-            if not proxy_dict:
-                return False
-            
-            test_session = requests.Session()
-            test_session.proxies.update(proxy_dict)
-            
-            response = test_session.get(
-                PROXY_VALIDATION_URL, 
-                timeout=PROXY_VALIDATION_TIMEOUT
-            )
-            
-            if response.status_code == 200:
-                self.logger.debug(f"Proxy doğrulandı: {proxy_url}")
-                return True
-            else:
-                self.logger.debug(f"Proxy doğrulama başarısız: {proxy_url} (Status: {response.status_code})")
-                return False
-                
-        except Exception as e:
-            self.logger.debug(f"Proxy doğrulama hatası {proxy_url}: {e}")
-            return False
-    
-    def _rotate_proxy(self):
-        """Proxy rotasyonu yapar"""
-        if self.use_proxy and self.proxy_list:
-            from .config import PROXY_ROTATION
-            if PROXY_ROTATION:
-                old_proxy = self.current_proxy
-                new_proxy = self._select_proxy()
-                if new_proxy and new_proxy != old_proxy:
-                    self.logger.debug(f"Proxy değiştirildi: {old_proxy} -> {new_proxy}")
-    
-    def _handle_proxy_failure(self):
-        """Proxy başarısızlığını işler"""
-        if self.current_proxy:
-            self.failed_proxies.add(self.current_proxy)
-            self.logger.warning(f"Proxy başarısız olarak işaretlendi: {self.current_proxy}")
-            
-            # Yeni proxy dene
-            new_proxy = self._select_proxy()
-            if not new_proxy:
-                self.logger.warning("Kullanılabilir proxy kalmadı, proxy'siz devam ediliyor")
-                self.use_proxy = False
-                self.session.proxies.clear()
+    def _handle_proxy_failure(self, proxy: Optional[str]):
+        """Proxy başarısızlığını havuza bildirir; mevcut proxy ise yenisini seçer"""
+        if proxy is None:
+            return
+        self.proxy_pool.record_failure(proxy)
+        self.logger.warning(f"Proxy hatası kaydedildi: {proxy}")
+        if proxy == self.current_proxy:
+            self._select_proxy()
     
     def _setup_domain_blocking(self, blocked_domains: List[str] = None):
         """Domain engelleme ayarlarını yapar"""
@@ -228,6 +232,12 @@ class URLCrawler:
             self.logger.info("Domain engelleme kullanılmıyor")
             return
         
+        # Önceden derlenmiş liste verildiyse tekrar derleme
+        if self.domain_blocklist is not None:
+            self.blocked_domains = self.domain_blocklist.domains
+            self.logger.info(f"Domain engelleme: paylaşılan liste kullanılıyor ({len(self.blocked_domains)} domain, mod: {self.domain_blocklist.mode})")
+            return
+        
         # Engellenen domain'leri ayarla
         if blocked_domains:
             self.blocked_domains.update(domain.lower().strip() for domain in blocked_domains)
@@ -237,6 +247,10 @@ class URLCrawler:
             self.blocked_domains.update(domain.lower().strip() for domain in DEFAULT_BLOCKED_DOMAINS)
             self.logger.info(f"Domain engelleme: {len(DEFAULT_BLOCKED_DOMAINS)} varsayılan domain eklendi")
         
+        # Engelleme listesini moda göre bir kez derle
+        self.domain_blocklist = DomainBlocklist(self.blocked_domains)
+        self.blocked_domains = self.domain_blocklist.domains
+        
         self.logger.info(f"Toplam engellenen domain sayısı: {len(self.blocked_domains)}")
         
         # İlk birkaç engellenen domain'i göster
@@ -264,89 +278,86 @@ class URLCrawler:
         
         return blocked_domains
     
-    def _is_domain_blocked(self, url: str) -> bool:
-        """URL'nin domain'inin engellenip engellenmediğini kontrol eder"""
-        if not self.use_domain_blocking or not self.blocked_domains:
+    @metrics.timed('domain_blocking')
+    def _is_domain_blocked(self, url: Union[str, URLRecord]) -> bool:
+        """URL'nin domain'inin engellenip engellenmediğini kontrol eder (URLRecord verilirse tekrar parse edilmez)"""
+        if not self.use_domain_blocking or not self.domain_blocklist:
             return False
         
         try:
-            from .config import DOMAIN_BLOCKING_MODE
-            parsed = urlparse(url)
-            domain = parsed.netloc.lower()
-            
-            # Port numarasını kaldır
-            if ':' in domain:
-                domain = domain.split(':')[0]
-            
-            # www. prefix'ini kaldır
-            if domain.startswith('www.'):
-                domain = domain[4:]
-            
-            for blocked_domain in self.blocked_domains:
-                if DOMAIN_BLOCKING_MODE == 'exact':
-                    # Tam eşleşme
-                    if domain == blocked_domain:
-                        return True
-                elif DOMAIN_BLOCKING_MODE == 'subdomain':
-                    # Alt domain dahil
-                    if domain == blocked_domain or domain.endswith('.' + blocked_domain):
-                        return True
-                elif DOMAIN_BLOCKING_MODE == 'contains':
-                    # İçeren
-                    if blocked_domain in domain:
-                        return True
-            
-            return False
-            
+            if isinstance(url, URLRecord):
+                return self.domain_blocklist.is_host_blocked(DomainBlocklist.normalize_domain(url.host))
+            return self.domain_blocklist.is_blocked(url)
         except Exception as e:
             self.logger.debug(f"Domain engelleme kontrolü hatası {url}: {e}")
             return False
     
-    def _log_blocked_domain(self, url: str):
-        """Engellenen domain'i loglar"""
+    def _log_blocked_domain(self, url: Union[str, URLRecord]):
+        """Engellenen URL'yi sitesine göre gruplayarak loglar (URLRecord verilirse tekrar parse edilmez)"""
         self.blocked_urls_count += 1
-        parsed = urlparse(url)
-        domain = parsed.netloc.lower()
-        self.logger.info(f"🚫 Domain engellendi: {domain} (URL: {url})")
+        record = url if isinstance(url, URLRecord) else parse_url(url)
+        if record is not None:
+            url, site = record.url, record.registrable
+        else:
+            site = urlparse(url).netloc.lower()
+        if site not in self.blocked_sites:
+            self.blocked_sites.add(site)
+            self.logger.info(f"🚫 Domain engellendi: {site} (URL: {url})")
+        else:
+            self.logger.debug(f"🚫 Engellenen siteye ait URL atlandı: {url}")
         self.logger.debug(f"Toplam engellenen URL sayısı: {self.blocked_urls_count}")
     
+    def _is_robots_allowed(self, url: str) -> bool:
+        """
+        URL'nin robots.txt'ye göre crawl edilip edilemeyeceğini kontrol eder
+        
+        Host'un robots.txt'si ilk kontrolde indirilir ve önbellekten kullanılır.
+        """
+        if self.robots_cache is None:
+            return True
+        if self.robots_cache.allowed(url, self.session, self._get_request_headers(), self.scheduler,
+                self._request_proxies(self._request_proxy())):
+            return True
+        self.robots_blocked_count += 1
+        self.logger.info(f"robots.txt tarafından yasaklandı: {url}")
+        return False
+    
     def is_excluded_url(self, url: str) -> bool:
         """URL'nin hariç tutulacak dosya uzantısına sahip olup olmadığını kontrol eder"""
-        try:
-            parsed = urlparse(url)
-            path = parsed.path.lower()
-            
-            # Dosya uzantısını kontrol et
-            for ext in self.excluded_extensions:
-                if path.endswith(ext):
-                    self.logger.debug(f"URL hariç tutuldu (uzantı {ext}): {url}")
-                    return True
-            
-            return False
+        record = parse_url(url)
+        return record is not None and self._is_excluded_record(record)
+    
+    def _is_excluded_record(self, record: URLRecord) -> bool:
+        """Kaydın path'inin hariç tutulan bir uzantıyla bitip bitmediğini kontrol eder"""
+        if record.path.lower().endswith(self._excluded_suffixes):
+            self.logger.debug(f"URL hariç tutuldu (uzantı): {record.url}")
+            return True
+        return False
+    
+    @metrics.timed('url_validation')
+    def _parse_link(self, url: str) -> Optional[URLRecord]:
+        """
+        URL'yi tek seferde parse edip doğrular
+        
+        Args:
+            url: Absolute URL
             
-        except Exception:
-            return False
+        Returns:
+            Kanonik URLRecord veya URL geçersiz/hariç tutulmuşsa None
+        """
+        record = parse_url(url)
+        if record is None or self._is_excluded_record(record):
+            return None
+        return record
     
     def is_valid_url(self, url: str) -> bool:
-        """URL'nin geçerli olup olmadığını kontrol eder"""
-        if not validators.url(url):
-            return False
-        
-        # Sadece HTTP ve HTTPS protokollerini kabul et
-        parsed = urlparse(url)
-        if parsed.scheme not in ['http', 'https']:
-            return False
-        
-        # Hariç tutulacak uzantıları kontrol et
-        if self.is_excluded_url(url):
-            return False
-        
-        return True
+        """URL'nin geçerli olup olmadığını kontrol eder (sadece HTTP/HTTPS, hariç tutulan uzantılar hariç)"""
+        return self._parse_link(url) is not None
     
     def normalize_url(self, url: str) -> str:
-        """URL'yi normalize eder (fragment'ları kaldırır)"""
-        parsed = urlparse(url)
-        return f"{parsed.scheme}://{parsed.netloc}{parsed.path}"
+        """URL'yi kanonik biçime çevirir (fragment ve takip parametreleri kaldırılır, query sıralanır)"""
+        record = parse_url(url)
+        return record.url if record is not None else url
     
     def get_page_content(self, url: str) -> BeautifulSoup:
         """
@@ -358,53 +369,93 @@ class URLCrawler:
         Returns:
             BeautifulSoup objesi veya None
         """
-        max_retries = 3
-        
-        for attempt in range(max_retries):
+        while True:
             try:
-                # Random user agent kullanılıyorsa güncelle
-                self._update_user_agent_if_needed()
-                
-                # Proxy rotasyonu
-                if attempt > 0:  # İlk denemede rotasyon yapma
-                    self._rotate_proxy()
-                
-                response = self.session.get(url, timeout=10)
-                response.raise_for_status()
-                
-                # Content-Type kontrolü
-                content_type = response.headers.get('content-type', '').lower()
-                if 'text/html' not in content_type:
-                    return None
-                
-                return BeautifulSoup(response.content, 'html.parser')
-                
-            except requests.exceptions.ProxyError as e:
-                self.logger.warning(f"Proxy hatası {url} (Deneme {attempt + 1}/{max_retries}): {e}")
-                self._handle_proxy_failure()
-                if attempt == max_retries - 1:
-                    self.logger.error(f"Tüm proxy denemeleri başarısız: {url}")
-                    return None
-                continue
-                
-            except requests.exceptions.Timeout as e:
-                self.logger.warning(f"Timeout {url} (Deneme {attempt + 1}/{max_retries}): {e}")
-                if self.use_proxy:
-                    self._rotate_proxy()
-                if attempt == max_retries - 1:
-                    return None
-                continue
-                
-            except requests.RequestException as e:
-                self.logger.error(f"URL alınamadı {url} (Deneme {attempt + 1}/{max_retries}): {e}")
-                if self.use_proxy and "proxy" in str(e).lower():
-                    self._handle_proxy_failure()
-                if attempt == max_retries - 1:
-                    return None
-                continue
+                content = self._fetch_content(url)
+                break
+            except RetryLater as e:
+                # Tek sayfalık istekte kuyruk yoktur; tekrar deneme zamanı beklenir
+                time.sleep(max(0.0, e.not_before - time.monotonic()))
+        if content is None:
+            return None
+        
+        return BeautifulSoup(content, 'html.parser')
+    
+    def _fetch_content(self, url: str) -> Optional[Union[str, bytes]]:
+        """
+        Verilen URL'nin ham HTML içeriğini indirir
+        
+        Host zamanlayıcısını bekler, user agent/proxy rotasyonu ve retry
+        uygular. HTML olmayan veya boyut limitini aşan yanıtlar için gövde
+        indirilmeden None döner.
+        
+        Args:
+            url: İndirilecek URL
+            
+        Returns:
+            HTML içeriği (charset header'da varsa str, yoksa bytes) veya None
+        """
+        # Önbellekteki taze kopya ağa gidilmeden kullanılır, eskisi koşullu istekle doğrulanır
+        cached = self.http_cache.lookup(url) if self.http_cache is not None else None
+        if cached is not None and cached.fresh:
+            return self.http_cache.reuse(cached)
+        
+        # Rate limiting (host bazlı)
+        self.scheduler.wait(url)
+        
+        # İsteğin rotası (tekrar denemelerde farklı proxy seçilir)
+        attempt = self.retry_policy.attempts(url)
+        proxy = self._request_proxy(rotate=attempt > 0)
+        
+        try:
+            # Random user agent kullanılıyorsa istek header'ına ekle
+            headers = self._get_request_headers()
+            if cached is not None:
+                headers.update(cached.conditional_headers())
+            
+            # Gövde, header'lar kontrol edildikten sonra akış halinde okunur
+            with self.session.get(url, headers=headers, timeout=10, stream=True,
+                                  proxies=self._request_proxies(proxy)) as response:
+                self.scheduler.record_response(url, response.status_code, response.elapsed.total_seconds())
+                if proxy is not None:
+                    self.proxy_pool.record_success(proxy, response.elapsed.total_seconds())
+                if self.http_cache is not None:
+                    content = self.http_cache.read(url, response, self.body_reader, cached)
+                else:
+                    response.raise_for_status()
+                    content = self.body_reader.read(response)
+        except requests.RequestException as e:
+            self._handle_fetch_error(url, e, attempt, proxy)
+            return None
         
-        return None
+        self.retry_policy.succeeded(url)
+        return content
     
+    def _handle_fetch_error(self, url: str, error: requests.RequestException, attempt: int,
+                            proxy: Optional[str]) -> None:
+        """
+        İstek hatasını loglar, proxy/zamanlayıcı durumunu günceller ve retry politikasına bildirir
+        
+        Raises:
+            RetryLater: URL ertelenip daha sonra tekrar denenmeli
+        """
+        if isinstance(error, requests.exceptions.ProxyError):
+            self.logger.warning(f"Proxy hatası {url} (Deneme {attempt + 1}): {error}")
+            self._handle_proxy_failure(proxy)
+        elif isinstance(error, requests.exceptions.Timeout):
+            self.logger.warning(f"Timeout {url} (Deneme {attempt + 1}): {error}")
+            self.scheduler.record_timeout(url)
+            self._handle_proxy_failure(proxy)
+        else:
+            self.logger.error(f"URL alınamadı {url} (Deneme {attempt + 1}): {error}")
+            if proxy is not None and "proxy" in str(error).lower():
+                self._handle_proxy_failure(proxy)
+        
+        # Tekrar denenecekse RetryLater yükselir ve URL çağıranın kuyruğuna geri konur
+        reason = self.retry_policy.failed(url, error, self.scheduler)
+        self.logger.warning(f"Tekrar denenmeyecek ({reason}): {url}")
+    
+    @metrics.timed('extract')
     def extract_urls_from_page(self, soup: BeautifulSoup, base_url: str) -> List[str]:
         """
         Sayfa içeriğinden URL'leri çıkarır
@@ -416,130 +467,300 @@ class URLCrawler:
         Returns:
             Bulunan URL'lerin listesi
         """
-        urls = []
-        
-        # <a> etiketlerinden href'leri al
-        for link in soup.find_all('a', href=True):
-            href = link['href'].strip()
-            if href:
-                # Relative URL'leri absolute'a çevir
-                absolute_url = urljoin(base_url, href)
-                normalized_url = self.normalize_url(absolute_url)
-                
-                if self.is_valid_url(normalized_url):
-                    urls.append(normalized_url)
-        
-        # <link> etiketlerinden href'leri al (CSS, canonical vb.)
-        for link in soup.find_all('link', href=True):
-            href = link['href'].strip()
-            if href:
-                absolute_url = urljoin(base_url, href)
-                normalized_url = self.normalize_url(absolute_url)
-                
-                if self.is_valid_url(normalized_url):
-                    urls.append(normalized_url)
-        
-        return list(set(urls))  # Duplikatları kaldır
+        return [record.url for record in self._filter_page_links(PageData.from_soup(soup, base_url).links)]
     
-    def crawl_url(self, url: str, current_depth: int = 0) -> None:
+    @metrics.timed('extract')
+    def _filter_page_links(self, links: List[str]) -> List[URLRecord]:
         """
-        Tek bir URL'yi crawl eder
+        Sayfadaki <a>/<link> absolute URL'lerini kanonikleştirip filtreler
         
         Args:
-            url: Crawl edilecek URL
-            current_depth: Mevcut derinlik seviyesi
+            links: Absolute URL listesi
+            
+        Returns:
+            Geçerli ve benzersiz URL kayıtları (sayfadaki sırayla)
         """
-        if (len(self.found_urls) >= self.max_urls or 
-            current_depth > self.max_depth or 
-            url in self.visited_urls):
-            return
+        records = {}
         
-        # Domain engelleme kontrolü
-        if self._is_domain_blocked(url):
-            self._log_blocked_domain(url)
-            return
+        for absolute_url in links:
+            record = self._parse_link(absolute_url)
+            if record is not None:
+                records.setdefault(record.url, record)  # Duplikatları kaldır
         
-        self.visited_urls.add(url)
-        self.logger.info(f"Crawling: {url} (Derinlik: {current_depth})")
+        return list(records.values())
+    
+    def _fetch_and_extract(self, url: str) -> Optional[List[URLRecord]]:
+        """
+        Sayfayı pipeline üzerinden indirir ve içindeki URL'leri çıkarır
         
-        # Sayfa içeriğini al
-        soup = self.get_page_content(url)
-        if not soup:
-            return
+        Eşzamanlı modda executor thread'lerinde çalıştırılır; crawler durumunu
+        (visited/found set'leri) değiştirmez.
         
-        # URL'leri çıkar
-        urls = self.extract_urls_from_page(soup, url)
+        Args:
+            url: İndirilecek URL
+            
+        Returns:
+            Bulunan URL kayıtları veya sayfa alınamadıysa None
+            
+        Raises:
+            RetryLater: Sayfa daha sonra tekrar denenmeli
+        """
+        page = self.page_pipeline.get(url, self._fetch_content)
+        if page is None:
+            return None
+        return self._filter_page_links(page.links)
+    
+    def _process_found_urls(self, url: str, records: List[URLRecord]) -> List[str]:
+        """
+        Sayfada bulunan URL'leri kaydeder ve takip edilecek olanları döndürür
         
-        for found_url in urls:
-            if found_url not in self.found_urls and len(self.found_urls) < self.max_urls:
-                # Domain engelleme kontrolü (bulunan URL'ler için)
-                if not self._is_domain_blocked(found_url):
-                    self.found_urls.add(found_url)
+        Args:
+            url: URL'lerin bulunduğu sayfa
+            records: Sayfadan çıkarılan URL kayıtları
+            
+        Returns:
+            Aynı sitede olup crawl edilebilecek URL'ler
+        """
+        base = parse_url(url)
+        next_urls = []
+        for record in records:
+            found_url = record.url
+            # Domain engelleme kontrolü (URL başına bir kez)
+            blocked = self._is_domain_blocked(record)
+            
+            if found_url not in self._found_seen and len(self.found_urls) < self.max_urls:
+                if not blocked:
+                    self._found_seen.add(found_url)
+                    self.found_urls.append(found_url)
+                    if self.result_stream is not None:
+                        self.result_stream.page(found_url, source=url)
                     self.logger.info(f"Yeni URL bulundu: {found_url}")
                 else:
-                    self._log_blocked_domain(found_url)
+                    self._log_blocked_domain(record)
+            
+            # Aynı siteden (www/alt domain'ler dahil) URL'leri crawl et; daha önce
+            # kuyruğa alınmış linkler (menü, footer) robots kontrolüne girmez
+            if (not blocked and base is not None and record.same_site(base)
+                    and found_url not in self.frontier and self._is_robots_allowed(found_url)):
+                next_urls.append(found_url)
         
-        # Recursive crawling (eğer derinlik limiti aşılmamışsa)
-        if current_depth < self.max_depth:
-            for found_url in urls:
-                if len(self.found_urls) >= self.max_urls:
-                    break
-                
-                # Domain engelleme kontrolü
-                if self._is_domain_blocked(found_url):
-                    continue
-                
-                # Aynı domain'den URL'leri crawl et (opsiyonel)
-                base_domain = urlparse(url).netloc
-                found_domain = urlparse(found_url).netloc
-                
-                if base_domain == found_domain:  # Sadece aynı domain
-                    time.sleep(self.delay)  # Rate limiting
-                    self.crawl_url(found_url, current_depth + 1)
+        return next_urls
     
-    def crawl(self, start_urls: List[str]) -> Dict:
+    def _crawl_page(self, url: str, current_depth: int, urls: Optional[List[URLRecord]]) -> None:
         """
-        Ana crawling fonksiyonu
+        İndirilen sayfanın URL'lerini kaydeder ve takip edilecekleri frontier'a ekler
         
         Args:
-            start_urls: Başlangıç URL'lerinin listesi
-            
+            url: İndirilen sayfa
+            current_depth: Sayfanın derinlik seviyesi
+            urls: Sayfadan çıkarılan URL kayıtları (sayfa alınamadıysa None)
+        """
+        if urls is None:
+            return
+        
+        # Derinlik limiti ve tekrar kontrolü frontier tarafından uygulanır
+        for found_url in self._process_found_urls(url, urls):
+            self.frontier.push(found_url, current_depth + 1)
+    
+    def _next_batch(self, size: int) -> List:
+        """URL limiti dolmadıysa frontier'dan bir sonraki URL grubunu alır"""
+        if len(self.found_urls) >= self.max_urls:
+            return []
+        
+        batch = self.frontier.pop_batch(size)
+        for url, current_depth in batch:
+            self.visited_urls.add(url)
+            self.logger.info(f"Crawling: {url} (Derinlik: {current_depth})")
+        return batch
+    
+    def _retry_wait(self) -> Optional[float]:
+        """
+        Frontier'da sadece zamanı gelmemiş tekrar denemeler kaldığında beklenecek süre
+        
         Returns:
-            Crawling sonuçları
+            Saniye veya bekleyen tekrar deneme yoksa/limit dolduysa None
         """
-        self.logger.info(f"Crawling başlatılıyor. Başlangıç URL'leri: {start_urls}")
+        if len(self.found_urls) >= self.max_urls or not self.frontier.budget_left:
+            return None
+        return self.frontier.next_retry_in()
+    
+    def _defer(self, url: str, current_depth: int, retry: RetryLater) -> None:
+        """Başarısız URL'yi tekrar deneme zamanına kadar frontier'da bekletir"""
+        self.logger.info(f"Tekrar denenecek ({retry.reason}): {url} "
+                         f"({max(0.0, retry.not_before - time.monotonic()):.1f} sn sonra)")
+        self.frontier.defer(url, current_depth, retry.not_before)
+    
+    def _run_frontier(self) -> None:
+        """Frontier boşalana veya bütçe bitene kadar URL'leri sırayla işler"""
+        while True:
+            batch = self._next_batch(1)
+            if not batch:
+                # Sadece ertelenmiş URL'ler kaldıysa ilkinin zamanı beklenir
+                wait_time = self._retry_wait()
+                if wait_time is None:
+                    break
+                time.sleep(wait_time)
+                continue
+            
+            url, current_depth = batch[0]
+            
+            # Sayfa içeriğini al ve URL'leri çıkar
+            try:
+                urls = self._fetch_and_extract(url)
+            except RetryLater as e:
+                self._defer(url, current_depth, e)
+                continue
+            self._crawl_page(url, current_depth, urls)
+    
+    def crawl_url(self, url: str, current_depth: int = 0) -> None:
+        """
+        Bir URL'den başlayarak crawl eder
         
+        URL frontier'a eklenir ve frontier boşalana veya bütçe bitene kadar
+        iteratif olarak (varsayılan BFS sırasıyla) işlenir.
+        
+        Args:
+            url: Crawl edilecek URL
+            current_depth: URL'nin derinlik seviyesi
+        """
+        # Domain engelleme kontrolü
+        if self._is_domain_blocked(url):
+            self._log_blocked_domain(url)
+            return
+        
+        if not self._is_robots_allowed(url):
+            return
+        
+        self.frontier.push(url, current_depth)
+        self._run_frontier()
+    
+    def _prepare_start_urls(self, start_urls: List[str]) -> List[str]:
+        """Başlangıç URL'lerini doğrular, kanonikleştirir ve engellenenleri ayıklar"""
+        prepared = []
         for url in start_urls:
-            if len(self.found_urls) >= self.max_urls:
-                break
-            
-            if self.is_valid_url(url):
+            record = self._parse_link(url)
+            if record is not None:
                 # Domain engelleme kontrolü
-                if self._is_domain_blocked(url):
-                    self._log_blocked_domain(url)
+                if self._is_domain_blocked(record):
+                    self._log_blocked_domain(record)
                     continue
                 
-                self.crawl_url(url)
+                if not self._is_robots_allowed(record.url):
+                    continue
+                
+                prepared.append(record.url)
             else:
                 self.logger.warning(f"Geçersiz URL: {url}")
-        
+        return prepared
+    
+    def _build_results(self, start_urls: List[str]) -> Dict:
+        """Crawling sonuç sözlüğünü hazırlar"""
         results = {
             'start_urls': start_urls,
             'total_found': len(self.found_urls),
             'total_visited': len(self.visited_urls),
             'found_urls': list(self.found_urls),
-            'visited_urls': list(self.visited_urls),
+            # Bloom/disk backend'leri URL'leri saklamaz, sadece sayıları raporlanır
+            'visited_urls': list(self.visited_urls) if self.visited_urls.iterable else [],
+            'seen_set': self.frontier.seen_stats(),
             'blocked_urls_count': self.blocked_urls_count if self.use_domain_blocking else 0,
-            'blocked_domains_count': len(self.blocked_domains) if self.use_domain_blocking else 0
+            'blocked_domains_count': len(self.blocked_domains) if self.use_domain_blocking else 0,
+            'blocked_sites_count': len(self.blocked_sites),
+            'robots_blocked_count': self.robots_blocked_count,
+            'crawl_budget': self.frontier.budget_report(),
+            'retries': self.retry_policy.summary()
         }
+        if self.scheduler.adaptive:
+            results['host_rates'] = self.scheduler.rates()
         
         if self.use_domain_blocking:
             self.logger.info(f"Crawling tamamlandı. {len(self.found_urls)} URL bulundu, {self.blocked_urls_count} URL engellendi.")
         else:
             self.logger.info(f"Crawling tamamlandı. {len(self.found_urls)} URL bulundu.")
+        self.logger.info(f"Crawl bütçesi: {self.frontier.fetched}/{self.frontier.max_fetches} indirme kullanıldı")
         
         return results
     
+    def crawl(self, start_urls: List[str]) -> Dict:
+        """
+        Ana crawling fonksiyonu
+        
+        Args:
+            start_urls: Başlangıç URL'lerinin listesi
+            
+        Returns:
+            Crawling sonuçları
+        """
+        self.logger.info(f"Crawling başlatılıyor. Başlangıç URL'leri: {start_urls}")
+        
+        for url in self._prepare_start_urls(start_urls):
+            self.frontier.push(url, 0)
+        
+        self._run_frontier()
+        
+        return self._build_results(start_urls)
+    
+    def crawl_concurrent(self, start_urls: List[str], concurrency: int = None) -> Dict:
+        """
+        Thread havuzu ile eşzamanlı crawling fonksiyonu
+        
+        İstekler bloklayan ``requests`` çağrılarıdır ve ``concurrency`` thread'lik
+        bir havuzda yürütülür; asyncio event loop'u sadece frontier'dan iş dağıtır,
+        sonuçları toplar ve retry bekleme sürelerini yönetir. Eşzamanlılık
+        thread sayısıyla sınırlıdır. User agent rotasyonu, proxy seçimi, retry ve
+        domain engelleme davranışı ``crawl()`` ile aynıdır.
+        
+        Args:
+            start_urls: Başlangıç URL'lerinin listesi
+            concurrency: İstekleri yürüten thread sayısı
+            
+        Returns:
+            Crawling sonuçları (``crawl()`` ile aynı format)
+        """
+        if concurrency is None:
+            from .config import DEFAULT_CONCURRENCY
+            concurrency = DEFAULT_CONCURRENCY
+        concurrency = max(1, concurrency)
+        
+        self.logger.info(f"Eşzamanlı crawling başlatılıyor ({concurrency} thread). Başlangıç URL'leri: {start_urls}")
+        
+        for url in self._prepare_start_urls(start_urls):
+            self.frontier.push(url, 0)
+        
+        asyncio.run(self._crawl_concurrent(concurrency))
+        
+        return self._build_results(start_urls)
+    
+    async def _crawl_concurrent(self, concurrency: int) -> None:
+        """Eşzamanlı crawling döngüsü - frontier'dan aldığı URL'leri thread havuzunda indirir"""
+        loop = asyncio.get_running_loop()
+        running = {}
+        
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            while True:
+                # Boşalan slotları frontier'dan doldur
+                for url, current_depth in self._next_batch(concurrency - len(running)):
+                    future = loop.run_in_executor(executor, self._fetch_and_extract, url)
+                    running[future] = (url, current_depth)
+                
+                # Ertelenmiş URL'lerin zamanı gelince boşalan slotlara alınması için uyanılır
+                wait_time = self._retry_wait()
+                if not running:
+                    if wait_time is None:
+                        break
+                    await asyncio.sleep(wait_time)
+                    continue
+                
+                done, _ = await asyncio.wait(running, timeout=wait_time, return_when=asyncio.FIRST_COMPLETED)
+                for future in done:
+                    url, current_depth = running.pop(future)
+                    try:
+                        self._crawl_page(url, current_depth, future.result())
+                    except RetryLater as e:
+                        self._defer(url, current_depth, e)
+                    except Exception as e:
+                        self.logger.error(f"URL işlenirken hata {url}: {e}")
+    
     def save_results(self, results: Dict, filename: str = 'crawl_results.json') -> None:
         """
         Sonuçları JSON dosyasına kaydet
@@ -552,3 +773,15 @@ class URLCrawler:
             json.dump(results, f, indent=2, ensure_ascii=False)
         
         self.logger.info(f"Sonuçlar {filename} dosyasına kaydedildi.")
+    
+    def close(self) -> None:
+        """
+        Crawler'ın görülen URL kümelerini kapatır
+        
+        Ziyaret edilen, bulunan ve frontier'daki kümeler crawler'a aittir;
+        disk backend'inde geçici SQLite dosyaları silinir, bloom filtreleri
+        serbest bırakılır. Sonuçlar (``crawl()`` dönüşü) kapatmadan önce alınmalıdır.
+        """
+        self.visited_urls.close()
+        self._found_seen.close()
+        self.frontier.close()
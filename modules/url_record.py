@@ -0,0 +1,162 @@
+"""
+Spider Domain Crawler - URL Kaydı Modülü
+
+Copyright (c) 2025 Hasan Yasin Yaşar
+Licensed under PSH 1.1 (Pasha Software License)
+"""
+
+import ipaddress
+import re
+from functools import lru_cache
+from typing import Optional
+from urllib.parse import unquote, urlsplit
+
+from .config import URL_RECORD_CACHE_SIZE, URL_TRACKING_PARAMS, URL_TRACKING_PREFIXES
+
+_DEFAULT_PORTS = {'http': 80, 'https': 443}
+# Boşluk ve kontrol karakteri içeren URL'ler geçersiz sayılır
+_INVALID_CHARS_RE = re.compile(r'[\x00-\x20\x7f]')
+_LABEL_RE = re.compile(r'^[a-z0-9](?:[a-z0-9-]{0,61}[a-z0-9])?$')
+_TLD_RE = re.compile(r'^(?:[a-z]{2,63}|xn--[a-z0-9-]{1,59})$')
+_IPV4_RE = re.compile(r'^(?:25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d)(?:\.(?:25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d)){3}$')
+# Ülke kodlu TLD'lerde kayıt alanı olarak kullanılan ikinci seviye label'lar (example.com.tr, example.co.uk)
+_SECOND_LEVEL_LABELS = frozenset(('ac', 'av', 'bel', 'co', 'com', 'edu', 'gen', 'go', 'gob', 'gov',
+                                  'k12', 'mil', 'ne', 'net', 'or', 'org'))
+_TRACKING_PARAMS = frozenset(param.lower() for param in URL_TRACKING_PARAMS)
+_TRACKING_PREFIXES = tuple(prefix.lower() for prefix in URL_TRACKING_PREFIXES)
+
+
+class URLRecord:
+    """
+    Bir kez parse edilip kanonikleştirilmiş URL
+
+    ``url`` kanonik biçimdir: scheme ve host küçük harf, kullanıcı bilgisi
+    (``user:pass@``), varsayılan port ve fragment yok, boş path ``/``, takip
+    parametreleri çıkarılmış ve kalan query parametreleri isme göre sıralanmış.
+    Tekrar kontrolü bu biçim üzerinden yapılır. ``registrable`` site anahtarıdır
+    (``blog.example.com.tr`` -> ``example.com.tr``); aynı siteye ait URL'ler bu
+    anahtarla gruplanır.
+    """
+
+    __slots__ = ('url', 'scheme', 'host', 'port', 'path', 'query', 'registrable')
+
+    def __init__(self, url: str, scheme: str, host: str, port: Optional[int], path: str, query: str,
+                 registrable: str):
+        self.url = url
+        self.scheme = scheme
+        self.host = host
+        # Varsayılan port (80/443) None olarak tutulur
+        self.port = port
+        self.path = path
+        self.query = query
+        # Kayıt alanı (sub.example.com.tr -> example.com.tr); IP adreslerinde host'un kendisi
+        self.registrable = registrable
+
+    def same_site(self, other: 'URLRecord') -> bool:
+        """İki URL'nin aynı siteye (kayıt alanı ve port) ait olup olmadığını döndürür"""
+        return self.registrable == other.registrable and self.port == other.port
+
+    def __repr__(self) -> str:
+        return f"URLRecord({self.url!r})"
+
+
+def _canonical_host(hostname: Optional[str]) -> Optional[str]:
+    """Host'u doğrular ve kanonik biçime çevirir (IDN'ler punycode'a); geçersizse None"""
+    if not hostname:
+        return None
+    host = hostname.rstrip('.')
+    if not host.isascii():
+        try:
+            host = host.encode('idna').decode('ascii')
+        except UnicodeError:
+            return None
+
+    if _IPV4_RE.match(host):
+        return host
+    if ':' in host:
+        try:
+            return str(ipaddress.IPv6Address(host))
+        except ValueError:
+            return None
+
+    labels = host.split('.')
+    if len(labels) < 2 or len(host) > 253 or not _TLD_RE.match(labels[-1]):
+        return None
+    for label in labels[:-1]:
+        if not _LABEL_RE.match(label):
+            return None
+    return host
+
+
+def _registrable(host: str) -> str:
+    """
+    Host'un kayıt alanını (eTLD+1) döndürür
+
+    Public suffix listesi kullanılmaz: son iki label alınır, ülke kodlu
+    TLD'lerde ikinci seviye label biliniyorsa (com.tr, co.uk) son üç label.
+    """
+    if ':' in host or _IPV4_RE.match(host):
+        return host
+    labels = host.split('.')
+    if len(labels) > 2 and len(labels[-1]) == 2 and labels[-2] in _SECOND_LEVEL_LABELS:
+        return '.'.join(labels[-3:])
+    return '.'.join(labels[-2:])
+
+
+def _canonical_query(query: str) -> str:
+    """Takip parametrelerini çıkarır, kalanları isme göre sıralar (değerlerin kodlaması korunur)"""
+    if not query:
+        return ''
+    params = []
+    for param in query.split('&'):
+        if not param:
+            continue
+        name = unquote(param.split('=', 1)[0]).lower()
+        if name in _TRACKING_PARAMS or name.startswith(_TRACKING_PREFIXES):
+            continue
+        params.append(param)
+    # Sıralama kararlıdır; aynı isimli parametrelerin kendi aralarındaki sırası korunur
+    params.sort(key=lambda param: param.split('=', 1)[0])
+    return '&'.join(params)
+
+
+@lru_cache(maxsize=URL_RECORD_CACHE_SIZE)
+def parse_url(url: str) -> Optional[URLRecord]:
+    """
+    URL'yi tek seferde doğrulayıp kanonik URLRecord'a çevirir
+
+    Sonuçlar LRU önbellekte tutulur; sayfalarda tekrar eden linkler
+    (menü, footer) yeniden parse edilmez.
+
+    Args:
+        url: Absolute URL
+
+    Returns:
+        URLRecord veya URL geçersizse (http/https değil, host/port geçersiz,
+        boşluk içeriyor) None
+    """
+    url = url.strip()
+    if _INVALID_CHARS_RE.search(url):
+        return None
+    try:
+        parts = urlsplit(url)
+        port = parts.port
+    except ValueError:
+        return None
+
+    scheme = parts.scheme.lower()
+    if scheme not in _DEFAULT_PORTS:
+        return None
+    host = _canonical_host(parts.hostname)
+    if host is None:
+        return None
+    if port == _DEFAULT_PORTS[scheme]:
+        port = None
+
+    netloc = f"[{host}]" if ':' in host else host
+    if port is not None:
+        netloc = f"{netloc}:{port}"
+    path = parts.path or '/'
+    query = _canonical_query(parts.query)
+    canonical = f"{scheme}://{netloc}{path}?{query}" if query else f"{scheme}://{netloc}{path}"
+    return URLRecord(canonical, scheme, host, port, path, query, _registrable(host))